@@ -0,0 +1,85 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import time
+from contextlib import contextmanager
+from unittest import mock
+
+import pytest
+import torch
+
+from pytorch_lightning.utilities.grads import grad_norm
+
+_REQUIRES_GPU = pytest.mark.skipif(not torch.cuda.is_available(), reason="test requires GPU machine")
+
+
+@contextmanager
+def count_host_syncs():
+    """Counts the tensor to Python scalar conversions, each of them being a device-to-host synchronization."""
+    counter = {"syncs": 0}
+
+    def wrap(fn):
+
+        def wrapped(*args, **kwargs):
+            counter["syncs"] += 1
+            return fn(*args, **kwargs)
+
+        return wrapped
+
+    with mock.patch.object(torch.Tensor, "item", wrap(torch.Tensor.item)), \
+            mock.patch.object(torch.Tensor, "__float__", wrap(torch.Tensor.__float__)), \
+            mock.patch.object(torch.Tensor, "tolist", wrap(torch.Tensor.tolist)):
+        yield counter
+
+
+def _per_parameter_grad_norm(module: torch.nn.Module, norm_type: float) -> dict:
+    # reference implementation: one host sync per parameter
+    norms = {name: float(p.grad.data.norm(norm_type)) for name, p in module.named_parameters() if p.grad is not None}
+    norms["total"] = float(torch.tensor(list(norms.values())).norm(norm_type))
+    return norms
+
+
+def _model_with_grads(num_params: int, device: torch.device) -> torch.nn.Module:
+    model = torch.nn.Sequential(*(torch.nn.Linear(32, 32) for _ in range(num_params // 2))).to(device)
+    model(torch.rand(4, 32, device=device)).sum().backward()
+    return model
+
+
+@pytest.mark.parametrize("device", ["cpu", pytest.param("cuda", marks=_REQUIRES_GPU)])
+@pytest.mark.parametrize("num_params", [10, 100, 400])
+def test_grad_norm_host_syncs(device: str, num_params: int, norm_type: float = 2., num_runs: int = 10):
+    """Verify that the number of host syncs of ``grad_norm`` does not depend on the number of parameters"""
+    model = _model_with_grads(num_params, torch.device(device))
+
+    with count_host_syncs() as reference:
+        start = time.perf_counter()
+        for _ in range(num_runs):
+            expected = _per_parameter_grad_norm(model, norm_type)
+        reference_time = (time.perf_counter() - start) / num_runs
+
+    with count_host_syncs() as vectorized:
+        start = time.perf_counter()
+        for _ in range(num_runs):
+            norms = grad_norm(model, norm_type)
+            # reading the total norm on the host is the only synchronization
+            total = float(norms[f"grad_{norm_type}_norm_total"])
+        vectorized_time = (time.perf_counter() - start) / num_runs
+
+    print(
+        f"{num_params} params on {device}: per-parameter {reference_time * 1000:.3f} ms"
+        f" ({reference['syncs'] // num_runs} syncs), vectorized {vectorized_time * 1000:.3f} ms"
+        f" ({vectorized['syncs'] // num_runs} syncs)"
+    )
+    assert reference["syncs"] == num_runs * (num_params + 1)
+    assert vectorized["syncs"] == num_runs
+    assert total == pytest.approx(expected["total"], rel=1e-5)
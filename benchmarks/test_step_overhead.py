@@ -0,0 +1,187 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Micro-benchmarks of the per-step overhead the Trainer adds on top of the user code.
+
+The model is trivial and runs on CPU so that the measured step time is dominated by the framework: hook dispatch,
+logging, progress bar updates, moving batches to the device and checkpointing. Every benchmark is compared with
+a baseline run and the results are written as JSON so that they can be diffed between commits::
+
+    python -m pytest benchmarks/test_step_overhead.py -v
+    PL_BENCHMARK_RESULTS=after.json python benchmarks/test_step_overhead.py
+"""
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+import pytest
+import torch
+
+import pytorch_lightning as pl
+from pytorch_lightning import Callback, Trainer
+from pytorch_lightning.callbacks import ModelCheckpoint
+from pytorch_lightning.trainer.connectors.logger_connector.result import ResultCollection
+from tests.helpers import BoringModel, RandomDataset
+
+NUM_STEPS = 200
+NUM_WARMUP_STEPS = 20
+PATH_HERE = os.path.dirname(__file__)
+PATH_RESULTS = os.path.abspath(
+    os.environ.get("PL_BENCHMARK_RESULTS", os.path.join(PATH_HERE, "dump-step_overhead.json"))
+)
+
+
+class StepTimer(Callback):
+    """Records the wall time between the start of two consecutive training batches."""
+
+    def __init__(self) -> None:
+        self.durations: List[float] = []
+        self._start = None
+
+    def on_train_batch_start(self, trainer, pl_module, batch, batch_idx, dataloader_idx) -> None:
+        now = time.perf_counter()
+        if self._start is not None:
+            self.durations.append(now - self._start)
+        self._start = now
+
+
+class LoggingModel(BoringModel):
+
+    def __init__(self, num_metrics: int) -> None:
+        super().__init__()
+        self.num_metrics = num_metrics
+
+    def training_step(self, batch, batch_idx):
+        output = super().training_step(batch, batch_idx)
+        loss = output["loss"].detach()
+        for i in range(self.num_metrics):
+            self.log(f"metric_{i}", loss, on_step=True, on_epoch=True)
+        return output
+
+
+class NestedBatchDataset(RandomDataset):
+    """Returns the sample nested in a collection of tensors, similar to what multi-modal models receive."""
+
+    def __getitem__(self, index):
+        x = self.data[index]
+        return {"x": x, "extra": [{"a": x.clone(), "b": (x.clone(), x.clone())} for _ in range(4)]}
+
+
+class NestedBatchModel(BoringModel):
+
+    def training_step(self, batch, batch_idx):
+        return super().training_step(batch["x"], batch_idx)
+
+    def train_dataloader(self):
+        return torch.utils.data.DataLoader(NestedBatchDataset(32, NUM_STEPS + NUM_WARMUP_STEPS + 1))
+
+
+def measure_step_time(model: pl.LightningModule, **trainer_kwargs) -> float:
+    """Returns the median wall time of a training step, after discarding the warm-up steps."""
+    timer = StepTimer()
+    trainer_kwargs.setdefault("progress_bar_refresh_rate", 0)
+    trainer_kwargs.setdefault("checkpoint_callback", False)
+    trainer = Trainer(
+        max_steps=NUM_STEPS + NUM_WARMUP_STEPS + 1,
+        limit_val_batches=0,
+        logger=False,
+        weights_summary=None,
+        callbacks=[timer] + trainer_kwargs.pop("callbacks", []),
+        **trainer_kwargs,
+    )
+    trainer.fit(model)
+    return statistics.median(timer.durations[NUM_WARMUP_STEPS:])
+
+
+def measure_result_collection_metrics(num_metrics: int) -> float:
+    """Returns the median wall time of a :meth:`ResultCollection.metrics` call with ``num_metrics`` logged values."""
+    results = ResultCollection(training=True, device="cpu")
+    value = torch.tensor(1.0)
+    for i in range(num_metrics):
+        results.log("training_step", f"metric_{i}", value, on_step=True, on_epoch=True, batch_size=1)
+
+    durations = []
+    for _ in range(NUM_STEPS + NUM_WARMUP_STEPS):
+        start = time.perf_counter()
+        results.metrics(on_step=True)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations[NUM_WARMUP_STEPS:])
+
+
+# each benchmark returns the median time of a step, in seconds
+BENCHMARKS: Dict[str, Callable[[], float]] = {
+    "baseline": lambda: measure_step_time(BoringModel()),
+    "call_hook_10_callbacks": lambda: measure_step_time(BoringModel(), callbacks=[Callback() for _ in range(10)]),
+    "log_1_metric": lambda: measure_step_time(LoggingModel(1)),
+    "log_10_metrics": lambda: measure_step_time(LoggingModel(10)),
+    "log_50_metrics": lambda: measure_step_time(LoggingModel(50)),
+    "progress_bar_refresh": lambda: measure_step_time(LoggingModel(10), progress_bar_refresh_rate=1),
+    "batch_to_device_nested": lambda: measure_step_time(NestedBatchModel()),
+    # the default `ModelCheckpoint` only saves at the end of the epoch
+    "model_checkpoint": lambda: measure_step_time(BoringModel(), callbacks=[ModelCheckpoint(every_n_train_steps=1)]),
+    "result_collection_metrics_10": lambda: measure_result_collection_metrics(10),
+    "result_collection_metrics_50": lambda: measure_result_collection_metrics(50),
+}
+
+
+def dump_results(results: Dict[str, float], path: str = PATH_RESULTS) -> None:
+    """Merges the results in microseconds into the JSON file at ``path``."""
+    content = {"versions": {}, "step_time_us": {}}
+    if os.path.isfile(path):
+        with open(path) as fp:
+            content = json.load(fp)
+    content["versions"] = {"torch": torch.__version__, "pytorch_lightning": pl.__version__}
+    content["step_time_us"].update({name: round(duration * 1e6, 2) for name, duration in results.items()})
+    with open(path, "w") as fp:
+        json.dump(content, fp, indent=2, sort_keys=True)
+
+
+@pytest.fixture(scope="module")
+def results():
+    results = {}
+    yield results
+    dump_results(results)
+
+
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_step_overhead(tmpdir, results, name: str):
+    """Measure the per-step time of each benchmark and report its overhead over the baseline."""
+    if "baseline" not in results:
+        with tmpdir.as_cwd():
+            results["baseline"] = BENCHMARKS["baseline"]()
+    if name not in results:
+        with tmpdir.as_cwd():
+            results[name] = BENCHMARKS[name]()
+
+    overhead = results[name] - results["baseline"]
+    print(f"{name}: {results[name] * 1e6:.1f} us per step ({overhead * 1e6:+.1f} us over the baseline)")
+    assert results[name] > 0
+
+
+def _main():
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # the checkpoints are saved in the working directory
+        os.chdir(tmpdir)
+        results = {name: fn() for name, fn in BENCHMARKS.items()}
+        os.chdir(cwd)
+    dump_results(results)
+    print(f"Results saved to {PATH_RESULTS}")
+
+
+if __name__ == '__main__':
+    _main()
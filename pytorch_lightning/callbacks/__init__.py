@@ -19,8 +19,8 @@ from pytorch_lightning.callbacks.gradient_accumulation_scheduler import Gradient
 from pytorch_lightning.callbacks.lambda_function import LambdaCallback
 from pytorch_lightning.callbacks.lr_monitor import LearningRateMonitor
 from pytorch_lightning.callbacks.model_checkpoint import ModelCheckpoint
-from pytorch_lightning.callbacks.prediction_writer import BasePredictionWriter
-from pytorch_lightning.callbacks.progress import ProgressBar, ProgressBarBase
+from pytorch_lightning.callbacks.prediction_writer import BasePredictionWriter, ShardedPredictionWriter
+from pytorch_lightning.callbacks.progress import HeadlessProgressBar, ProgressBar, ProgressBarBase
 from pytorch_lightning.callbacks.pruning import ModelPruning
 from pytorch_lightning.callbacks.quantization import QuantizationAwareTraining
 from pytorch_lightning.callbacks.stochastic_weight_avg import StochasticWeightAveraging
@@ -35,6 +35,7 @@ __all__ = [
     'GPUStatsMonitor',
     'XLAStatsMonitor',
     'GradientAccumulationScheduler',
+    'HeadlessProgressBar',
     'LambdaCallback',
     'LearningRateMonitor',
     'ModelCheckpoint',
@@ -43,6 +44,7 @@ __all__ = [
     'ProgressBar',
     'ProgressBarBase',
     'QuantizationAwareTraining',
+    'ShardedPredictionWriter',
     'StochasticWeightAveraging',
     'Timer',
 ]
@@ -35,8 +35,9 @@ import yaml
 import pytorch_lightning as pl
 from pytorch_lightning.callbacks.base import Callback
 from pytorch_lightning.utilities import rank_zero_deprecation, rank_zero_info, rank_zero_warn
-from pytorch_lightning.utilities.cloud_io import get_filesystem
+from pytorch_lightning.utilities.cloud_io import AsyncCheckpointWriter, get_filesystem
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from pytorch_lightning.utilities.model_helpers import is_overridden
 from pytorch_lightning.utilities.types import _METRIC, STEP_OUTPUT
 from pytorch_lightning.utilities.warnings import WarningCache
 
@@ -124,6 +125,12 @@ class ModelCheckpoint(Callback):
             where both values for ``every_n_epochs`` and ``check_val_every_n_epoch`` evenly divide E.
         save_on_train_epoch_end: Whether to run checkpointing at the end of the training epoch.
             If this is ``False``, then the check runs at the end of the validation.
+        save_async: Whether to write the checkpoints from a background thread. The tensors are copied to CPU memory
+            before the training continues, then the checkpoint is serialized and written while training.
+            At most one checkpoint is waiting to be written at a time, and the removal of the checkpoints which fell
+            out of the top-k happens once the new checkpoint has been written.
+            Pending writes are completed when training finishes or fails. The checkpoints saved with
+            ``trainer.save_checkpoint`` are still written synchronously.
         period: Interval (number of epochs) between checkpoints.
 
             .. warning::
@@ -218,6 +225,7 @@ class ModelCheckpoint(Callback):
         save_on_train_epoch_end: Optional[bool] = None,
         period: Optional[int] = None,
         every_n_val_epochs: Optional[int] = None,
+        save_async: bool = False,
     ):
         super().__init__()
         self.monitor = monitor
@@ -226,6 +234,7 @@ class ModelCheckpoint(Callback):
         self.save_top_k = save_top_k
         self.save_weights_only = save_weights_only
         self.auto_insert_metric_name = auto_insert_metric_name
+        self.save_async = save_async
         self._save_on_train_epoch_end = save_on_train_epoch_end
         self._last_global_step_saved = -1
         self._last_time_checked: Optional[float] = None
@@ -255,6 +264,8 @@ class ModelCheckpoint(Callback):
         """
         self.__resolve_ckpt_dir(trainer)
         self._save_function = trainer.save_checkpoint
+        if self.save_async:
+            self.__init_checkpoint_writer(trainer)
         if self._save_on_train_epoch_end is None:
             # if the user runs validation multiple times per training epoch, we try to save checkpoint after
             # validation instead of on train epoch end
@@ -508,8 +519,15 @@ class ModelCheckpoint(Callback):
         self._save_function = value
 
     def _del_model(self, trainer: 'pl.Trainer', filepath: str) -> None:
+        writer = trainer.training_type_plugin.checkpoint_writer
+        if self.save_async and writer is not None:
+            if trainer.should_rank_save_checkpoint:
+                # the removal happens after the pending checkpoints have been written
+                writer.remove(filepath)
+            return
         if trainer.should_rank_save_checkpoint and self._fs.exists(filepath):
-            self._fs.rm(filepath)
+            # sharded checkpoints are directories
+            self._fs.rm(filepath, recursive=True)
             log.debug(f"Removed checkpoint: {filepath}")
 
     def _save_model(self, trainer: 'pl.Trainer', filepath: str) -> None:
@@ -521,7 +539,11 @@ class ModelCheckpoint(Callback):
             self._fs.makedirs(os.path.dirname(filepath), exist_ok=True)
 
         # delegate the saving to the trainer
-        trainer.save_checkpoint(filepath, self.save_weights_only)
+        if self.save_async:
+            with trainer.training_type_plugin.save_checkpoints_async():
+                trainer.save_checkpoint(filepath, self.save_weights_only)
+        else:
+            trainer.save_checkpoint(filepath, self.save_weights_only)
 
     def check_monitor_top_k(self, trainer: 'pl.Trainer', current: Optional[torch.Tensor] = None) -> bool:
         if current is None:
@@ -658,6 +680,24 @@ class ModelCheckpoint(Callback):
         if not trainer.fast_dev_run and trainer.should_rank_save_checkpoint:
             self._fs.makedirs(self.dirpath, exist_ok=True)
 
+    def __init_checkpoint_writer(self, trainer: 'pl.Trainer') -> None:
+        training_type_plugin = trainer.training_type_plugin
+        # `ParallelPlugin` writes sharded checkpoints itself
+        parallel = isinstance(training_type_plugin, pl.plugins.ParallelPlugin)
+        base_plugin = pl.plugins.ParallelPlugin if parallel else pl.plugins.TrainingTypePlugin
+        if (
+            parallel and training_type_plugin.sharded_checkpoint
+            or is_overridden("save_checkpoint", training_type_plugin, base_plugin)
+        ):
+            rank_zero_warn(
+                f"`ModelCheckpoint(save_async=True)` is not supported by `{type(training_type_plugin).__name__}`"
+                " as it saves the checkpoints itself. The checkpoints will be saved synchronously."
+            )
+            self.save_async = False
+            return
+        if training_type_plugin.checkpoint_writer is None:
+            training_type_plugin.checkpoint_writer = AsyncCheckpointWriter()
+
     def _validate_monitor_key(self, trainer: 'pl.Trainer') -> None:
         metrics = trainer.callback_metrics
 
@@ -797,4 +837,7 @@ class ModelCheckpoint(Callback):
         the internal state to diverge between ranks.
         """
         exists = self._fs.exists(filepath)
+        writer = trainer.training_type_plugin.checkpoint_writer
+        if not exists and writer is not None:
+            exists = filepath in writer.pending_paths
         return trainer.training_type_plugin.broadcast(exists)
@@ -17,7 +17,13 @@ BasePredictionWriter
 
 Aids in saving predictions
 """
-from typing import Any, Optional, Sequence
+import json
+import math
+import os
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import torch
 
 import pytorch_lightning as pl
 from pytorch_lightning.callbacks.base import Callback
@@ -120,3 +126,250 @@ class BasePredictionWriter(Callback):
         is_distributed = trainer.accelerator_connector.is_distributed
         epoch_batch_indices = trainer.predict_loop.epoch_batch_indices if is_distributed else None
         self.write_on_epoch_end(trainer, pl_module, trainer.predict_loop.predictions, epoch_batch_indices)
+
+
+class _FieldWriter:
+    """Writes the rows of one prediction field of one rank, to a memory-mapped array or in chunks."""
+
+    def __init__(self, dirpath: str, name: str, capacity: Optional[int], chunk_size: int) -> None:
+        self.dirpath = dirpath
+        self.name = name
+        self.capacity = capacity
+        self.chunk_size = chunk_size
+        self.num_rows = 0
+        self.memmap: Optional[np.memmap] = None
+        self.memmap_rows = 0
+        self.chunks: List[str] = []
+        self._buffer: List[torch.Tensor] = []
+        self._use_chunks = capacity is None
+
+    def write(self, values: torch.Tensor) -> None:
+        values = values.detach().cpu()
+        if not self._use_chunks:
+            self._use_chunks = not self._write_memmap(values)
+            if not self._use_chunks:
+                return
+        self._buffer.extend(values.unbind(0))
+        self.num_rows += len(values)
+        if len(self._buffer) >= self.chunk_size:
+            self._flush_chunk()
+
+    def _write_memmap(self, values: torch.Tensor) -> bool:
+        try:
+            array = values.numpy()
+        except TypeError:
+            # dtypes which numpy doesn't support, e.g. `bfloat16`
+            return False
+        if self.memmap is None:
+            self.memmap = np.lib.format.open_memmap(
+                os.path.join(self.dirpath, f"{self.name}.npy"),
+                mode="w+",
+                dtype=array.dtype,
+                shape=(self.capacity, *array.shape[1:]),
+            )
+        fits = (
+            array.dtype == self.memmap.dtype and array.shape[1:] == self.memmap.shape[1:]
+            and self.num_rows + len(array) <= self.capacity
+        )
+        if not fits:
+            # the rows written so far stay in the array, the next ones are written in chunks
+            return False
+        self.memmap[self.num_rows:self.num_rows + len(array)] = array
+        self.num_rows += len(array)
+        self.memmap_rows = self.num_rows
+        return True
+
+    def _flush_chunk(self) -> None:
+        if not self._buffer:
+            return
+        filename = f"{self.name}_{len(self.chunks)}.pt"
+        # clone so that the whole storage of the batch isn't saved with each sample
+        torch.save([sample.clone() for sample in self._buffer], os.path.join(self.dirpath, filename))
+        self.chunks.append(filename)
+        self._buffer = []
+
+    def finalize(self) -> Dict[str, Any]:
+        self._flush_chunk()
+        if self.memmap is not None:
+            self.memmap.flush()
+            self.memmap = None
+        return {
+            "num_rows": self.num_rows,
+            "memmap_rows": self.memmap_rows,
+            "file": f"{self.name}.npy" if self.memmap_rows else None,
+            "chunks": self.chunks,
+        }
+
+
+class ShardedPredictionWriter(BasePredictionWriter):
+    """
+    Streams the predictions of every batch to files, with one directory per dataloader and per rank, so that the
+    predictions of a dataset larger than the memory can be written with a constant memory usage.
+
+    The predictions should be a tensor or a dictionary of tensors whose first dimension is the batch. Together with
+    the dataset indices of the samples, each field is written to a preallocated memory-mapped ``.npy`` array when the
+    number of batches is known and the samples have the same shape and dtype. Otherwise, the samples are saved in
+    chunks of ``chunk_size`` samples with ``torch.save``. :meth:`merge` reorders the predictions of all the ranks
+    by dataset index.
+
+    The prediction loop also keeps the predictions in memory unless ``return_predictions=False`` is passed to
+    :meth:`~pytorch_lightning.trainer.trainer.Trainer.predict`.
+
+    Example::
+
+        writer = ShardedPredictionWriter("predictions")
+        trainer = Trainer(gpus=2, accelerator="ddp", callbacks=[writer])
+        trainer.predict(model, dataloader, return_predictions=False)
+        predictions = ShardedPredictionWriter.merge("predictions")
+
+    Args:
+        output_dir: The local directory where the predictions are written.
+        chunk_size: The number of samples per file when the samples can't be written to a memory-mapped array.
+    """
+
+    INDEX = "_index"
+
+    def __init__(self, output_dir: str, chunk_size: int = 10000) -> None:
+        super().__init__(write_interval="batch")
+        self.output_dir = output_dir
+        self.chunk_size = chunk_size
+        self._fields: Dict[Tuple[int, str], _FieldWriter] = {}
+
+    def _dirpath(self, dataloader_idx: int, rank: int) -> str:
+        return os.path.join(self.output_dir, f"dataloader_{dataloader_idx}", f"rank_{rank}")
+
+    def on_predict_epoch_start(self, trainer: 'pl.Trainer', pl_module: 'pl.LightningModule') -> None:
+        self._fields = {}
+
+    def write_on_batch_end(
+        self,
+        trainer: 'pl.Trainer',
+        pl_module: 'pl.LightningModule',
+        prediction: Any,
+        batch_indices: Optional[Sequence[int]],
+        batch: Any,
+        batch_idx: int,
+        dataloader_idx: int,
+    ) -> None:
+        if isinstance(prediction, torch.Tensor):
+            fields = {"predictions": prediction}
+        elif isinstance(prediction, Mapping) and all(isinstance(v, torch.Tensor) for v in prediction.values()):
+            fields = dict(prediction)
+        else:
+            raise MisconfigurationException(
+                "`ShardedPredictionWriter` expects `predict_step` to return a tensor or a dictionary of tensors,"
+                f" got {type(prediction).__name__}."
+            )
+        if self.INDEX in fields:
+            raise MisconfigurationException(f"The prediction name {self.INDEX!r} is reserved.")
+        batch_size = len(next(iter(fields.values())))
+
+        index_writer = self._fields.get((dataloader_idx, self.INDEX))
+        if index_writer is None:
+            dirpath = self._dirpath(dataloader_idx, trainer.global_rank)
+            os.makedirs(dirpath, exist_ok=True)
+            num_batches = trainer.num_predict_batches[dataloader_idx]
+            # the last batch can be smaller. only the rows which were written are read back
+            capacity = None if math.isinf(num_batches) else int(num_batches) * batch_size
+            for name in (self.INDEX, *fields):
+                self._fields[(dataloader_idx, name)] = _FieldWriter(dirpath, name, capacity, self.chunk_size)
+            index_writer = self._fields[(dataloader_idx, self.INDEX)]
+
+        if batch_indices is None:
+            batch_indices = trainer.predict_loop.epoch_loop.current_batch_indices
+        if batch_indices is None or len(batch_indices) != batch_size:
+            # the samples are assumed to be sequential
+            batch_indices = range(index_writer.num_rows, index_writer.num_rows + batch_size)
+        index_writer.write(torch.tensor(batch_indices, dtype=torch.long))
+
+        for name, values in fields.items():
+            field_writer = self._fields.get((dataloader_idx, name))
+            if field_writer is None:
+                raise MisconfigurationException(
+                    f"The prediction {name!r} was not returned by the first batch of the dataloader {dataloader_idx}."
+                )
+            field_writer.write(values)
+
+    def on_predict_epoch_end(
+        self, trainer: 'pl.Trainer', pl_module: 'pl.LightningModule', outputs: Sequence[Any]
+    ) -> None:
+        metadata: Dict[int, Dict[str, Any]] = {}
+        for (dataloader_idx, name), field_writer in self._fields.items():
+            metadata.setdefault(dataloader_idx, {})[name] = field_writer.finalize()
+        for dataloader_idx, fields in metadata.items():
+            with open(os.path.join(self._dirpath(dataloader_idx, trainer.global_rank), "metadata.json"), "w") as f:
+                json.dump(fields, f)
+        self._fields = {}
+
+    @staticmethod
+    def _read_rows(dirpath: str, field: Dict[str, Any]) -> List[Any]:
+        rows = []
+        if field["file"] is not None:
+            rows.extend(np.load(os.path.join(dirpath, field["file"]), mmap_mode="r")[:field["memmap_rows"]])
+        for chunk in field["chunks"]:
+            rows.extend(torch.load(os.path.join(dirpath, chunk)))
+        return rows
+
+    @staticmethod
+    def _read_index(dirpath: str, field: Dict[str, Any]) -> np.ndarray:
+        # performance: the memory-mapped rows aren't loaded in memory
+        parts = []
+        if field["file"] is not None:
+            parts.append(np.load(os.path.join(dirpath, field["file"]), mmap_mode="r")[:field["memmap_rows"]])
+        for chunk in field["chunks"]:
+            parts.append(torch.stack(torch.load(os.path.join(dirpath, chunk))).numpy())
+        if len(parts) == 1 and parts[0].dtype == np.int64:
+            return parts[0]
+        return np.concatenate(parts).astype(np.int64) if parts else np.empty(0, dtype=np.int64)
+
+    @classmethod
+    def merge(cls, output_dir: str, dataloader_idx: int = 0, block_size: int = 10000) -> Dict[str, Any]:
+        """
+        Reorders the predictions written by all the ranks by dataset index.
+
+        The fields which were fully written to memory-mapped arrays are merged into the memory-mapped arrays
+        ``dataloader_{dataloader_idx}/merged/{name}.npy`` in ``output_dir``, ``block_size`` rows at a time. The other
+        fields are loaded in a list.
+
+        Return:
+            A dictionary mapping each prediction name to its values, where the row ``i`` holds the prediction of the
+            ``i``-th sample of the dataset.
+        """
+        root = os.path.join(output_dir, f"dataloader_{dataloader_idx}")
+        shards = []
+        for rank_dir in sorted(d for d in os.listdir(root) if d.startswith("rank_")):
+            dirpath = os.path.join(root, rank_dir)
+            with open(os.path.join(dirpath, "metadata.json")) as f:
+                fields = json.load(f)
+            index = cls._read_index(dirpath, fields[cls.INDEX])
+            shards.append((dirpath, fields, index))
+        if not shards:
+            return {}
+        size = max(int(index.max()) + 1 if len(index) else 0 for _, _, index in shards)
+
+        merged = {}
+        for name in shards[0][1]:
+            if name == cls.INDEX:
+                continue
+            arrays = [
+                np.load(os.path.join(dirpath, fields[name]["file"]), mmap_mode="r")[:fields[name]["num_rows"]]
+                if fields[name]["memmap_rows"] == fields[name]["num_rows"] and fields[name]["file"] else None
+                for dirpath, fields, _ in shards
+            ]
+            if all(a is not None for a in arrays) and len({(a.dtype, a.shape[1:]) for a in arrays}) == 1:
+                os.makedirs(os.path.join(root, "merged"), exist_ok=True)
+                path = os.path.join(root, "merged", f"{name}.npy")
+                shape = (size, *arrays[0].shape[1:])
+                out = np.lib.format.open_memmap(path, mode="w+", dtype=arrays[0].dtype, shape=shape)
+                for array, (_, _, index) in zip(arrays, shards):
+                    for start in range(0, len(array), block_size):
+                        out[index[start:start + block_size]] = array[start:start + block_size]
+                out.flush()
+                merged[name] = np.load(path, mmap_mode="r")
+            else:
+                values = [None] * size
+                for dirpath, fields, index in shards:
+                    for i, row in zip(index, cls._read_rows(dirpath, fields[name])):
+                        values[i] = row
+                merged[name] = values
+        return merged
@@ -23,10 +23,11 @@ import io
 import math
 import os
 import sys
+import time
 
 # check if ipywidgets is installed before importing tqdm.auto
 # to ensure it won't fail and a progress bar is displayed
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 
 if importlib.util.find_spec('ipywidgets') is not None:
     from tqdm.auto import tqdm as _tqdm
@@ -34,6 +35,8 @@ else:
     from tqdm import tqdm as _tqdm
 
 from pytorch_lightning.callbacks import Callback
+from pytorch_lightning.trainer.states import TrainerFn
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 
 _PAD_SIZE = 5
 
@@ -272,13 +275,26 @@ class ProgressBar(ProgressBarBase):
             together. This corresponds to
             :paramref:`~pytorch_lightning.trainer.trainer.Trainer.process_position` in the
             :class:`~pytorch_lightning.trainer.trainer.Trainer`.
+        refresh_interval:
+            If set, the progress bars get updated at most every ``refresh_interval`` seconds instead of every
+            ``refresh_rate`` batches, e.g. ``0.1``. Checking the time is cheap, and the progress bar metrics are
+            only computed when the bars are redrawn.
 
     """
 
-    def __init__(self, refresh_rate: int = 1, process_position: int = 0):
+    def __init__(self, refresh_rate: int = 1, process_position: int = 0, refresh_interval: Optional[float] = None):
         super().__init__()
+        if refresh_interval is not None and refresh_interval < 0:
+            raise MisconfigurationException(
+                f"`ProgressBar(refresh_interval={refresh_interval})` should be a non-negative number of seconds."
+            )
         self._refresh_rate = refresh_rate
         self._process_position = process_position
+        self._refresh_interval = refresh_interval
+        self._last_refresh_time = -math.inf
+        # batches which haven't been added to the bars yet when `refresh_interval` is set
+        self._num_pending_batches = 0
+        self._refresh_delta = 0
         self._enabled = True
         self.main_progress_bar = None
         self.val_progress_bar = None
@@ -302,6 +318,10 @@ class ProgressBar(ProgressBarBase):
     def process_position(self) -> int:
         return self._process_position
 
+    @property
+    def refresh_interval(self) -> Optional[float]:
+        return self._refresh_interval
+
     @property
     def is_enabled(self) -> bool:
         return self._enabled and self.refresh_rate > 0
@@ -406,6 +426,7 @@ class ProgressBar(ProgressBarBase):
             total_val_batches = total_val_batches * val_checks_per_epoch
         total_batches = total_train_batches + total_val_batches
         reset(self.main_progress_bar, total_batches)
+        self._num_pending_batches = 0
         self.main_progress_bar.set_description(f'Epoch {trainer.current_epoch}')
 
     def on_train_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
@@ -421,9 +442,11 @@ class ProgressBar(ProgressBarBase):
         if trainer.sanity_checking:
             reset(self.val_progress_bar, sum(trainer.num_sanity_val_batches))
         else:
+            self._flush_pending_batches()
             self._update_bar(self.main_progress_bar)  # fill up remaining
             self.val_progress_bar = self.init_validation_tqdm()
             reset(self.val_progress_bar, self.total_val_batches)
+        self._num_pending_batches = 0
 
     def on_validation_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
         super().on_validation_batch_end(trainer, pl_module, outputs, batch, batch_idx, dataloader_idx)
@@ -433,6 +456,8 @@ class ProgressBar(ProgressBarBase):
 
     def on_validation_end(self, trainer, pl_module):
         super().on_validation_end(trainer, pl_module)
+        if self._flush_pending_batches() and not trainer.sanity_checking:
+            self._update_bar(self.main_progress_bar)
         if self.main_progress_bar is not None:
             self.main_progress_bar.set_postfix(trainer.progress_bar_dict)
         self.val_progress_bar.close()
@@ -445,6 +470,7 @@ class ProgressBar(ProgressBarBase):
         super().on_test_start(trainer, pl_module)
         self.test_progress_bar = self.init_test_tqdm()
         self.test_progress_bar.total = convert_inf(self.total_test_batches)
+        self._num_pending_batches = 0
 
     def on_test_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
         super().on_test_batch_end(trainer, pl_module, outputs, batch, batch_idx, dataloader_idx)
@@ -459,6 +485,7 @@ class ProgressBar(ProgressBarBase):
         super().on_predict_epoch_start(trainer, pl_module)
         self.predict_progress_bar = self.init_predict_tqdm()
         self.predict_progress_bar.total = convert_inf(self.total_predict_batches)
+        self._num_pending_batches = 0
 
     def on_predict_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
         super().on_predict_batch_end(trainer, pl_module, outputs, batch, batch_idx, dataloader_idx)
@@ -487,21 +514,187 @@ class ProgressBar(ProgressBarBase):
             active_progress_bar.write(s, end=end, file=file, nolock=nolock)
 
     def _should_update(self, current, total) -> bool:
-        return self.is_enabled and (current % self.refresh_rate == 0 or current == total)
+        if not self.is_enabled:
+            return False
+        if self.refresh_interval is None:
+            return current % self.refresh_rate == 0 or current == total
+        self._num_pending_batches += 1
+        now = time.monotonic()
+        if current == total or now - self._last_refresh_time >= self.refresh_interval:
+            self._last_refresh_time = now
+            self._flush_pending_batches()
+            return True
+        return False
+
+    def _flush_pending_batches(self) -> bool:
+        """ Moves the batches which haven't been displayed yet to the next bar updates, if any. """
+        if self.refresh_interval is None:
+            return False
+        self._refresh_delta = self._num_pending_batches
+        self._num_pending_batches = 0
+        return self._refresh_delta > 0
 
     def _update_bar(self, bar: Optional[tqdm]) -> None:
         """ Updates the bar by the refresh rate without overshooting. """
         if bar is None:
             return
+        # with a time-based refresh, the number of batches since the last update
+        delta = self.refresh_rate if self.refresh_interval is None else self._refresh_delta
         if bar.total is not None:
-            delta = min(self.refresh_rate, bar.total - bar.n)
-        else:
-            # infinite / unknown size
-            delta = self.refresh_rate
+            delta = min(delta, bar.total - bar.n)
         if delta > 0:
             bar.update(delta)
 
 
+class HeadlessProgressBar(ProgressBarBase):
+    r"""
+    A progress bar for non-interactive outputs, like the log file of a job on a cluster. Instead of redrawing
+    :mod:`tqdm` bars, it prints a compact status line at most every ``refresh_interval`` seconds, and once at the end
+    of every epoch and evaluation run::
+
+        Epoch 3: 120/500 [24%, 153.21it/s] loss=0.123, v_num=1
+
+    Example::
+
+        trainer = Trainer(callbacks=[HeadlessProgressBar(refresh_interval=60)])
+
+    Args:
+        refresh_interval: The minimum number of seconds between two status lines.
+
+    """
+
+    def __init__(self, refresh_interval: float = 30.0):
+        super().__init__()
+        if refresh_interval < 0:
+            raise MisconfigurationException(
+                f"`HeadlessProgressBar(refresh_interval={refresh_interval})` should be a non-negative number of"
+                " seconds."
+            )
+        self._refresh_interval = refresh_interval
+        self._enabled = True
+        self._train_start_time = 0.0
+        self._eval_start_time = 0.0
+        self._last_print_time = 0.0
+
+    @property
+    def refresh_interval(self) -> float:
+        return self._refresh_interval
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def is_disabled(self) -> bool:
+        return not self.is_enabled
+
+    def disable(self) -> None:
+        self._enabled = False
+
+    def enable(self) -> None:
+        self._enabled = True
+
+    def print(self, *args, **kwargs):
+        if self.is_enabled:
+            print(*args, **kwargs)
+
+    def on_train_epoch_start(self, trainer, pl_module):
+        super().on_train_epoch_start(trainer, pl_module)
+        self._train_start_time = self._last_print_time = time.monotonic()
+
+    def on_train_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
+        super().on_train_batch_end(trainer, pl_module, outputs, batch, batch_idx, dataloader_idx)
+        if self._should_print():
+            self._print_status(
+                f"Epoch {trainer.current_epoch}", self.train_batch_idx, self.total_train_batches,
+                self._train_start_time, trainer.progress_bar_dict
+            )
+
+    def on_train_epoch_end(self, trainer, pl_module, unused: Optional = None):
+        super().on_train_epoch_end(trainer, pl_module)
+        if self.is_enabled:
+            self._print_status(
+                f"Epoch {trainer.current_epoch}", self.train_batch_idx, self.total_train_batches,
+                self._train_start_time, trainer.progress_bar_dict
+            )
+
+    def on_validation_start(self, trainer, pl_module):
+        super().on_validation_start(trainer, pl_module)
+        self._eval_start_time = time.monotonic()
+
+    def on_validation_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
+        super().on_validation_batch_end(trainer, pl_module, outputs, batch, batch_idx, dataloader_idx)
+        if not trainer.sanity_checking and self._should_print():
+            self._print_status("Validating", self.val_batch_idx, self.total_val_batches, self._eval_start_time)
+
+    def on_validation_end(self, trainer, pl_module):
+        super().on_validation_end(trainer, pl_module)
+        # during `trainer.fit`, the validation metrics are printed at the end of the epoch
+        if self.is_enabled and trainer.state.fn != TrainerFn.FITTING:
+            self._print_status("Validating", self.val_batch_idx, self.total_val_batches, self._eval_start_time)
+
+    def on_test_start(self, trainer, pl_module):
+        super().on_test_start(trainer, pl_module)
+        self._eval_start_time = self._last_print_time = time.monotonic()
+
+    def on_test_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
+        super().on_test_batch_end(trainer, pl_module, outputs, batch, batch_idx, dataloader_idx)
+        if self._should_print():
+            self._print_status("Testing", self.test_batch_idx, self.total_test_batches, self._eval_start_time)
+
+    def on_test_end(self, trainer, pl_module):
+        super().on_test_end(trainer, pl_module)
+        if self.is_enabled:
+            self._print_status("Testing", self.test_batch_idx, self.total_test_batches, self._eval_start_time)
+
+    def on_predict_epoch_start(self, trainer, pl_module):
+        super().on_predict_epoch_start(trainer, pl_module)
+        self._eval_start_time = self._last_print_time = time.monotonic()
+
+    def on_predict_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
+        super().on_predict_batch_end(trainer, pl_module, outputs, batch, batch_idx, dataloader_idx)
+        if self._should_print():
+            self._print_status(
+                "Predicting", self.predict_batch_idx, self.total_predict_batches, self._eval_start_time
+            )
+
+    def on_predict_end(self, trainer, pl_module):
+        if self.is_enabled:
+            self._print_status(
+                "Predicting", self.predict_batch_idx, self.total_predict_batches, self._eval_start_time
+            )
+
+    def _should_print(self) -> bool:
+        if not self.is_enabled:
+            return False
+        now = time.monotonic()
+        if now - self._last_print_time < self.refresh_interval:
+            return False
+        self._last_print_time = now
+        return True
+
+    def _print_status(
+        self,
+        desc: str,
+        current: int,
+        total: Union[int, float],
+        start_time: float,
+        metrics: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        total = convert_inf(total)
+        elapsed = time.monotonic() - start_time
+        rate = f"{current / elapsed:.2f}it/s" if elapsed > 0 else "?it/s"
+        if total:
+            status = f"{desc}: {current}/{total} [{100 * current / total:.0f}%, {rate}]"
+        else:
+            status = f"{desc}: {current} [{rate}]"
+        if metrics:
+            status += " " + ", ".join(
+                f"{k}={v if isinstance(v, str) else _tqdm.format_num(v)}" for k, v in metrics.items()
+            )
+        self.print(status, file=sys.stdout, flush=True)
+
+
 def convert_inf(x: Optional[Union[int, float]]) -> Optional[Union[int, float]]:
     """ The tqdm doesn't support inf/nan values. We have to convert it to None. """
     if x is None or math.isinf(x) or math.isnan(x):
@@ -17,11 +17,12 @@ import functools
 from argparse import ArgumentParser, Namespace
 from typing import Any, List, Mapping, Optional, Sequence, Tuple, Union
 
-from torch.utils.data import DataLoader, Dataset, IterableDataset
+from torch.utils.data import DataLoader, Dataset, IterableDataset, TensorDataset
 
 from pytorch_lightning.core.hooks import CheckpointHooks, DataHooks
 from pytorch_lightning.utilities import rank_zero_deprecation
 from pytorch_lightning.utilities.argparse import add_argparse_args, from_argparse_args, get_init_arguments_and_types
+from pytorch_lightning.utilities.data import _BatchedTensorDataset
 from pytorch_lightning.utilities.hparams_mixin import HyperparametersMixin
 
 
@@ -338,10 +339,14 @@ class LightningDataModule(CheckpointHooks, DataHooks, HyperparametersMixin):
             num_workers: Number of subprocesses to use for data loading. 0 means that the
                 data will be loaded in the main process. Number of CPUs available.
 
+        The Trainer indexes the tensors of a :class:`~torch.utils.data.TensorDataset` once per batch instead of once
+        per sample.
         """
 
         def dataloader(ds: Dataset, shuffle: bool = False) -> DataLoader:
             shuffle &= not isinstance(ds, IterableDataset)
+            if type(ds) is TensorDataset:
+                ds = _BatchedTensorDataset(*ds.tensors)
             return DataLoader(
                 ds,
                 batch_size=batch_size,
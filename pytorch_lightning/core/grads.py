@@ -34,4 +34,4 @@ class GradInformation(Module):
             "LightningModule.grad_norm is deprecated in v1.3 and will be removed in v1.5."
             " Use grad_norm from pytorch_lightning.utilities.grads instead."
         )
-        return new_grad_norm(self, norm_type)
+        return {k: round(float(v), 4) for k, v in new_grad_norm(self, norm_type).items()}
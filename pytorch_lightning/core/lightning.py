@@ -390,11 +390,14 @@ class LightningModule(
         elif reduce_fx == 'default':
             reduce_fx = 'mean'
 
-        # check for invalid values
-        apply_to_collection(value, dict, self.__check_not_nested, name)
-        apply_to_collection(
-            value, object, self.__check_allowed, name, value, wrong_dtype=(numbers.Number, Metric, Tensor, dict)
-        )
+        # performance: single tensors and numbers, the most common values, don't need to be traversed
+        is_collection = not isinstance(value, (Tensor, numbers.Number))
+        if is_collection:
+            # check for invalid values
+            apply_to_collection(value, dict, self.__check_not_nested, name)
+            apply_to_collection(
+                value, object, self.__check_allowed, name, value, wrong_dtype=(numbers.Number, Metric, Tensor, dict)
+            )
 
         # set the default depending on the fx_name
         on_step = self.__auto_choose_log_on_step(on_step)
@@ -412,7 +415,10 @@ class LightningModule(
                 " but it should not contain information about `dataloader_idx`"
             )
 
-        value = apply_to_collection(value, numbers.Number, self.__to_tensor)
+        if is_collection:
+            value = apply_to_collection(value, numbers.Number, self.__to_tensor)
+        elif isinstance(value, numbers.Number):
+            value = self.__to_tensor(value)
 
         if self.trainer.logger_connector.should_reset_tensors(self._current_fx_name):
             # if we started a new epoch (running it's first batch) the hook name has changed
@@ -547,7 +553,11 @@ class LightningModule(
         self.log_dict(grad_norm_dict, on_step=True, on_epoch=True, prog_bar=True, logger=True)
 
     def write_prediction(
-        self, name: str, value: Union[torch.Tensor, List[torch.Tensor]], filename: str = 'predictions.pt'
+        self,
+        name: str,
+        value: Union[torch.Tensor, List[torch.Tensor]],
+        filename: str = 'predictions.pt',
+        columnar: bool = False,
     ):
         """
         Write predictions to disk using ``torch.save``
@@ -560,6 +570,8 @@ class LightningModule(
             name: a string indicating the name to save the predictions under
             value: the predictions, either a single :class:`~torch.Tensor` or a list of them
             filename: name of the file to save the predictions to
+            columnar: whether to save the predictions as a directory named ``filename`` with one file per feature,
+                see :class:`~pytorch_lightning.trainer.supporters.PredictionCollection`
 
         Note:
             when running in distributed mode, calling ``write_prediction`` will create a file for
@@ -573,9 +585,11 @@ class LightningModule(
             ' and will be removed in v1.5.'
         )
 
-        self.trainer._evaluation_loop.predictions._add_prediction(name, value, filename)
+        self.trainer._evaluation_loop.predictions._add_prediction(name, value, filename, columnar=columnar)
 
-    def write_prediction_dict(self, predictions_dict: Dict[str, Any], filename: str = 'predictions.pt'):
+    def write_prediction_dict(
+        self, predictions_dict: Dict[str, Any], filename: str = 'predictions.pt', columnar: bool = False
+    ):
         """
         Write a dictonary of predictions to disk at once using ``torch.save``
 
@@ -587,6 +601,8 @@ class LightningModule(
         Args:
             predictions_dict: dict containing predictions, where each prediction should
                 either be single :class:`~torch.Tensor` or a list of them
+            filename: name of the file to save the predictions to
+            columnar: whether to save the predictions as a directory named ``filename`` with one file per feature
 
         Note:
             when running in distributed mode, calling ``write_prediction_dict`` will create a file for
@@ -601,7 +617,7 @@ class LightningModule(
         )
 
         for k, v in predictions_dict.items():
-            self.write_prediction(k, v, filename)
+            self.write_prediction(k, v, filename, columnar=columnar)
 
     def __auto_choose_log_on_step(self, on_step: Optional[bool]) -> bool:
         if on_step is None:
@@ -28,7 +28,7 @@ import yaml
 
 from pytorch_lightning.utilities import _OMEGACONF_AVAILABLE, AttributeDict, rank_zero_warn
 from pytorch_lightning.utilities.apply_func import apply_to_collection
-from pytorch_lightning.utilities.cloud_io import get_filesystem
+from pytorch_lightning.utilities.cloud_io import get_filesystem, is_sharded_checkpoint, load_sharded_checkpoint
 from pytorch_lightning.utilities.cloud_io import load as pl_load
 from pytorch_lightning.utilities.parsing import parse_class_init_keys
 
@@ -69,7 +69,8 @@ class ModelIO(object):
         Any arguments specified through \*args and \*\*kwargs will override args stored in `hyper_parameters`.
 
         Args:
-            checkpoint_path: Path to checkpoint. This can also be a URL, or file-like object
+            checkpoint_path: Path to checkpoint. This can also be a URL, or file-like object.
+                For a sharded checkpoint directory, the shard of rank 0 is loaded.
             map_location:
                 If your checkpoint saved a GPU model and you now load on CPUs
                 or a different number of GPUs, use this to map to the new setup.
@@ -129,10 +130,12 @@ class ModelIO(object):
             pretrained_model.freeze()
             y_hat = pretrained_model(x)
         """
+        # sharded checkpoints get loaded from the shard of rank 0
+        load_fn = load_sharded_checkpoint if is_sharded_checkpoint(checkpoint_path) else pl_load
         if map_location is not None:
-            checkpoint = pl_load(checkpoint_path, map_location=map_location)
+            checkpoint = load_fn(checkpoint_path, map_location=map_location)
         else:
-            checkpoint = pl_load(checkpoint_path, map_location=lambda storage, loc: storage)
+            checkpoint = load_fn(checkpoint_path, map_location=lambda storage, loc: storage)
 
         if hparams_file is not None:
             extension = hparams_file.split('.')[-1]
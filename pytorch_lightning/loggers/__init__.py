@@ -13,11 +13,12 @@
 # limitations under the License.
 from os import environ
 
-from pytorch_lightning.loggers.base import LightningLoggerBase, LoggerCollection
+from pytorch_lightning.loggers.base import AsyncLogger, LightningLoggerBase, LoggerCollection
 from pytorch_lightning.loggers.csv_logs import CSVLogger
 from pytorch_lightning.loggers.tensorboard import TensorBoardLogger
 
 __all__ = [
+    'AsyncLogger',
     'LightningLoggerBase',
     'LoggerCollection',
     'TensorBoardLogger',
@@ -16,6 +16,8 @@
 import argparse
 import functools
 import operator
+import queue
+import threading
 from abc import ABC, abstractmethod
 from argparse import Namespace
 from functools import wraps
@@ -28,6 +30,9 @@ import torch
 import pytorch_lightning as pl
 from pytorch_lightning.callbacks.model_checkpoint import ModelCheckpoint
 from pytorch_lightning.utilities import rank_zero_only
+from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from pytorch_lightning.utilities.metrics import metrics_to_scalars
 
 
 def rank_zero_experiment(fn: Callable) -> Callable:
@@ -426,6 +431,179 @@ class LoggerCollection(LightningLoggerBase):
         return '_'.join([str(logger.version) for logger in self._logger_iterable])
 
 
+class AsyncLogger(LightningLoggerBase):
+    """
+    Wraps a logger to move its work off the training loop.
+
+    The metrics are queued as detached copies of the tensors together with their step. A worker thread converts them
+    to scalars, which synchronizes with the device away from the training loop, and forwards them to the wrapped
+    logger in the order they were logged. Consecutive :meth:`save` calls queued while the worker was busy are coalesced.
+
+    When the queue is full, logging blocks until the worker catches up. The queue is drained by :meth:`flush`,
+    :meth:`finalize` and :meth:`close`, and at the end of every ``Trainer`` run.
+
+    ``trainer.log_dir`` is resolved from the wrapped logger.
+
+    Example::
+
+        from pytorch_lightning.loggers import AsyncLogger, TensorBoardLogger
+
+        trainer = Trainer(logger=AsyncLogger(TensorBoardLogger("logs")))
+
+    Args:
+        logger: The logger, or :class:`LoggerCollection`, to wrap.
+        max_queue_size: The maximum number of pending logging calls.
+    """
+
+    def __init__(self, logger: LightningLoggerBase, max_queue_size: int = 100):
+        super().__init__()
+        if max_queue_size < 1:
+            raise MisconfigurationException(f"`max_queue_size` should be an int >= 1, got {max_queue_size}.")
+        self._logger = logger
+        self._max_queue_size = max_queue_size
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+    @property
+    def logger(self) -> LightningLoggerBase:
+        """The wrapped logger."""
+        return self._logger
+
+    def _put(self, fn: Callable, *args: Any) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        if self._worker is None or not self._worker.is_alive():
+            self._queue = queue.Queue(maxsize=self._max_queue_size)
+            self._worker = threading.Thread(target=self._process, args=(self._queue, ), daemon=True)
+            self._worker.start()
+        self._queue.put((fn, args))
+
+    def _process(self, q: queue.Queue) -> None:
+        while True:
+            events = [q.get()]
+            # take everything queued while the previous batch was being processed
+            while True:
+                try:
+                    events.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            save = False
+            for fn, args in events:
+                if fn is None:
+                    # the `_stop` sentinel
+                    for _ in events:
+                        q.task_done()
+                    return
+                if fn == self._logger.save:
+                    save = True
+                    continue
+                if self._error is None:
+                    self._call(fn, *args)
+            if save and self._error is None:
+                self._call(self._logger.save)
+            for _ in events:
+                q.task_done()
+
+    def _call(self, fn: Callable, *args: Any) -> None:
+        try:
+            fn(*args)
+        except BaseException as e:
+            # re-raised on the next call from the training loop
+            self._error = e
+
+    @staticmethod
+    def _snapshot(tensor: torch.Tensor) -> torch.Tensor:
+        # the logged tensors can be updated in-place by the training loop before the worker reads them
+        return tensor.detach().clone()
+
+    def _agg_and_log_metrics(self, metrics: Dict[str, Any], step: Optional[int]) -> None:
+        self._logger.agg_and_log_metrics(metrics_to_scalars(metrics), step)
+
+    def _log_metrics(self, metrics: Dict[str, Any], step: Optional[int]) -> None:
+        self._logger.log_metrics(metrics_to_scalars(metrics), step)
+
+    def flush(self) -> None:
+        """Blocks until all the queued logging calls have been processed."""
+        if self._queue is not None:
+            self._queue.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _stop(self) -> None:
+        self.flush()
+        if self._worker is not None and self._worker.is_alive():
+            self._queue.put((None, ()))
+            self._worker.join()
+        self._worker = None
+        self._queue = None
+
+    def update_agg_funcs(
+        self,
+        agg_key_funcs: Optional[Mapping[str, Callable[[Sequence[float]], float]]] = None,
+        agg_default_func: Callable[[Sequence[float]], float] = np.mean
+    ):
+        self.flush()
+        self._logger.update_agg_funcs(agg_key_funcs, agg_default_func)
+
+    def after_save_checkpoint(self, checkpoint_callback: 'ReferenceType[ModelCheckpoint]') -> None:
+        # the checkpoint callback state is read by the logger, it can't be deferred
+        self.flush()
+        self._logger.after_save_checkpoint(checkpoint_callback)
+
+    @property
+    def experiment(self) -> Any:
+        return self._logger.experiment
+
+    def agg_and_log_metrics(self, metrics: Dict[str, Any], step: Optional[int] = None):
+        metrics = apply_to_collection(metrics, torch.Tensor, self._snapshot)
+        self._put(self._agg_and_log_metrics, metrics, step)
+
+    def log_metrics(self, metrics: Dict[str, Any], step: Optional[int] = None) -> None:
+        metrics = apply_to_collection(metrics, torch.Tensor, self._snapshot)
+        self._put(self._log_metrics, metrics, step)
+
+    def log_hyperparams(self, params: Union[Dict[str, Any], Namespace], *args, **kwargs) -> None:
+        self._put(functools.partial(self._logger.log_hyperparams, params, *args, **kwargs))
+
+    def log_graph(self, model: 'pl.LightningModule', input_array=None) -> None:
+        # tracing the model has to happen on the training thread
+        self.flush()
+        self._logger.log_graph(model, input_array)
+
+    def save(self) -> None:
+        self._put(self._logger.save)
+
+    def finalize(self, status: str) -> None:
+        self._stop()
+        self._logger.finalize(status)
+
+    def close(self) -> None:
+        self._stop()
+        self._logger.close()
+
+    @property
+    def save_dir(self) -> Optional[str]:
+        return self._logger.save_dir
+
+    @property
+    def name(self) -> str:
+        return self._logger.name
+
+    @property
+    def version(self) -> Union[int, str]:
+        return self._logger.version
+
+    def __getstate__(self) -> Dict[str, Any]:
+        self.flush()
+        # the worker is started again on the next logging call
+        state = self.__dict__.copy()
+        state.update(_queue=None, _worker=None)
+        return state
+
+
 class DummyExperiment(object):
     """ Dummy experiment """
 
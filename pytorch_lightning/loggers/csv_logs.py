@@ -22,8 +22,9 @@ import csv
 import io
 import logging
 import os
+import time
 from argparse import Namespace
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import torch
 
@@ -42,6 +43,9 @@ class ExperimentWriter(object):
     Currently supports to log hyperparameters and metrics in YAML and CSV
     format, respectively.
 
+    The metrics are buffered in memory until :meth:`save` appends them to the CSV file. The file is only rewritten
+    when new metric keys require widening its header.
+
     Args:
         log_dir: Directory for the experiment logs
     """
@@ -51,7 +55,11 @@ class ExperimentWriter(object):
 
     def __init__(self, log_dir: str) -> None:
         self.hparams = {}
+        # the rows which haven't been written to the metrics file yet
         self.metrics = []
+        self.metrics_keys: List[str] = []
+        self._num_rows = 0
+        self._hparams_saved = False
 
         self.log_dir = log_dir
         if os.path.exists(self.log_dir) and os.listdir(self.log_dir):
@@ -66,6 +74,7 @@ class ExperimentWriter(object):
     def log_hparams(self, params: Dict[str, Any]) -> None:
         """Record hparams"""
         self.hparams.update(params)
+        self._hparams_saved = False
 
     def log_metrics(self, metrics_dict: Dict[str, float], step: Optional[int] = None) -> None:
         """Record metrics"""
@@ -76,29 +85,45 @@ class ExperimentWriter(object):
             return value
 
         if step is None:
-            step = len(self.metrics)
+            step = self._num_rows
 
         metrics = {k: _handle_value(v) for k, v in metrics_dict.items()}
         metrics['step'] = step
         self.metrics.append(metrics)
+        self._num_rows += 1
 
     def save(self) -> None:
-        """Save recorded hparams and metrics into files"""
-        hparams_file = os.path.join(self.log_dir, self.NAME_HPARAMS_FILE)
-        save_hparams_to_yaml(hparams_file, self.hparams)
+        """Save recorded hparams and append the recorded metrics to the files"""
+        if not self._hparams_saved:
+            hparams_file = os.path.join(self.log_dir, self.NAME_HPARAMS_FILE)
+            save_hparams_to_yaml(hparams_file, self.hparams)
+            self._hparams_saved = True
 
         if not self.metrics:
             return
 
-        last_m = {}
+        new_keys = {}
         for m in self.metrics:
-            last_m.update(m)
-        metrics_keys = list(last_m.keys())
+            new_keys.update(dict.fromkeys(k for k in m if k not in self.metrics_keys))
+
+        if new_keys:
+            # the header needs to be widened: rewrite the rows already saved with the new set of columns
+            rows = []
+            if self.metrics_keys:
+                with io.open(self.metrics_file_path, 'r', newline='') as f:
+                    rows = list(csv.DictReader(f))
+            self.metrics_keys = self.metrics_keys + list(new_keys)
+            with io.open(self.metrics_file_path, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=self.metrics_keys)
+                writer.writeheader()
+                writer.writerows(rows)
+                writer.writerows(self.metrics)
+        else:
+            with io.open(self.metrics_file_path, 'a', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=self.metrics_keys)
+                writer.writerows(self.metrics)
 
-        with io.open(self.metrics_file_path, 'w', newline='') as f:
-            self.writer = csv.DictWriter(f, fieldnames=metrics_keys)
-            self.writer.writeheader()
-            self.writer.writerows(self.metrics)
+        self.metrics = []
 
 
 class CSVLogger(LightningLoggerBase):
@@ -119,6 +144,10 @@ class CSVLogger(LightningLoggerBase):
         version: Experiment version. If version is not specified the logger inspects the save
             directory for existing versions, then automatically assigns the next available version.
         prefix: A string to put at the beginning of metric keys.
+        flush_logs_every_n_steps: How many logged rows to buffer in memory before appending them to the metrics
+            file. Defaults to ``1``, writing the metrics every time they are logged.
+        flush_logs_every_n_seconds: If set, the buffered rows are also written when this many seconds have passed
+            since they were last written.
     """
 
     LOGGER_JOIN_CHAR = '-'
@@ -129,6 +158,8 @@ class CSVLogger(LightningLoggerBase):
         name: Optional[str] = "default",
         version: Optional[Union[int, str]] = None,
         prefix: str = '',
+        flush_logs_every_n_steps: int = 1,
+        flush_logs_every_n_seconds: Optional[float] = None,
     ):
         super().__init__()
         self._save_dir = save_dir
@@ -136,6 +167,9 @@ class CSVLogger(LightningLoggerBase):
         self._version = version
         self._prefix = prefix
         self._experiment = None
+        self._flush_logs_every_n_steps = flush_logs_every_n_steps
+        self._flush_logs_every_n_seconds = flush_logs_every_n_seconds
+        self._last_flush_time = time.monotonic()
 
     @property
     def root_dir(self) -> str:
@@ -197,11 +231,26 @@ class CSVLogger(LightningLoggerBase):
     @rank_zero_only
     def save(self) -> None:
         super().save()
-        self.experiment.save()
+        if self._should_flush():
+            self._flush()
 
     @rank_zero_only
     def finalize(self, status: str) -> None:
-        self.save()
+        super().save()
+        self._flush()
+
+    def _should_flush(self) -> bool:
+        num_buffered = len(self.experiment.metrics)
+        # without buffered metrics, saving only writes the hparams if they changed
+        if num_buffered == 0 or num_buffered >= self._flush_logs_every_n_steps:
+            return True
+        if self._flush_logs_every_n_seconds is None:
+            return False
+        return time.monotonic() - self._last_flush_time >= self._flush_logs_every_n_seconds
+
+    def _flush(self) -> None:
+        self.experiment.save()
+        self._last_flush_time = time.monotonic()
 
     @property
     def name(self) -> str:
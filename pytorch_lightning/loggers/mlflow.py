@@ -20,7 +20,7 @@ import os
 import re
 from argparse import Namespace
 from time import time
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from pytorch_lightning.loggers.base import LightningLoggerBase, rank_zero_experiment
 from pytorch_lightning.utilities import _module_available, rank_zero_only, rank_zero_warn
@@ -30,12 +30,13 @@ LOCAL_FILE_URI_PREFIX = "file:"
 _MLFLOW_AVAILABLE = _module_available("mlflow")
 try:
     import mlflow
+    from mlflow.entities import Metric
     from mlflow.tracking import context, MlflowClient
     from mlflow.utils.mlflow_tags import MLFLOW_RUN_NAME
 # todo: there seems to be still some remaining import error with Conda env
 except ImportError:
     _MLFLOW_AVAILABLE = False
-    mlflow, MlflowClient, context = None, None, None
+    mlflow, MlflowClient, context, Metric = None, None, None, None
     MLFLOW_RUN_NAME = "mlflow.runName"
 
 # before v1.1.0
@@ -99,6 +100,10 @@ class MLFlowLogger(LightningLoggerBase):
         prefix: A string to put at the beginning of metric keys.
         artifact_location: The location to store run artifacts. If not provided, the server picks an appropriate
             default.
+        flush_logs_every_n_steps: How many :meth:`log_metrics` calls to buffer before sending their metrics in a
+            single batch. Defaults to ``1``, sending the metrics every time they are logged.
+        flush_logs_every_n_seconds: If set, the buffered metrics are also sent when this many seconds have passed
+            since they were last sent.
 
     Raises:
         ImportError:
@@ -106,6 +111,8 @@ class MLFlowLogger(LightningLoggerBase):
     """
 
     LOGGER_JOIN_CHAR = '-'
+    # the limit of the MLflow tracking servers
+    _MAX_METRICS_PER_BATCH = 1000
 
     def __init__(
         self,
@@ -116,6 +123,8 @@ class MLFlowLogger(LightningLoggerBase):
         save_dir: Optional[str] = './mlruns',
         prefix: str = '',
         artifact_location: Optional[str] = None,
+        flush_logs_every_n_steps: int = 1,
+        flush_logs_every_n_seconds: Optional[float] = None,
     ):
         if mlflow is None:
             raise ImportError(
@@ -134,6 +143,14 @@ class MLFlowLogger(LightningLoggerBase):
         self.tags = tags
         self._prefix = prefix
         self._artifact_location = artifact_location
+        self._flush_logs_every_n_steps = flush_logs_every_n_steps
+        self._flush_logs_every_n_seconds = flush_logs_every_n_seconds
+
+        # maps the logged metric names to the names accepted by MLflow
+        self._metric_names: Dict[str, str] = {}
+        self._metrics_buffer: List[Metric] = []
+        self._num_buffered_steps = 0
+        self._last_flush_time = time()
 
         self._mlflow_client = MlflowClient(tracking_uri)
 
@@ -210,19 +227,40 @@ class MLFlowLogger(LightningLoggerBase):
                 log.warning(f'Discarding metric with string value {k}={v}.')
                 continue
 
-            new_k = re.sub("[^a-zA-Z0-9_/. -]+", "", k)
-            if k != new_k:
-                rank_zero_warn(
-                    "MLFlow only allows '_', '/', '.' and ' ' special characters in metric name."
-                    f" Replacing {k} with {new_k}.", RuntimeWarning
-                )
-                k = new_k
+            name = self._metric_names.get(k)
+            if name is None:
+                name = self._metric_names[k] = self._sanitize_metric_name(k)
+            self._metrics_buffer.append(Metric(key=name, value=v, timestamp=timestamp_ms, step=step or 0))
+        self._num_buffered_steps += 1
+
+        if (
+            self._num_buffered_steps >= self._flush_logs_every_n_steps or self._flush_logs_every_n_seconds is not None
+            and time() - self._last_flush_time >= self._flush_logs_every_n_seconds
+        ):
+            self._flush_metrics()
+
+    @staticmethod
+    def _sanitize_metric_name(name: str) -> str:
+        new_name = re.sub("[^a-zA-Z0-9_/. -]+", "", name)
+        if name != new_name:
+            rank_zero_warn(
+                "MLFlow only allows '_', '/', '.' and ' ' special characters in metric name."
+                f" Replacing {name} with {new_name}.", RuntimeWarning
+            )
+        return new_name
 
-            self.experiment.log_metric(self.run_id, k, v, timestamp_ms, step)
+    def _flush_metrics(self) -> None:
+        """Sends the buffered metrics to MLflow in batches of at most ``_MAX_METRICS_PER_BATCH`` metrics."""
+        metrics, self._metrics_buffer = self._metrics_buffer, []
+        for i in range(0, len(metrics), self._MAX_METRICS_PER_BATCH):
+            self.experiment.log_batch(self.run_id, metrics=metrics[i:i + self._MAX_METRICS_PER_BATCH])
+        self._num_buffered_steps = 0
+        self._last_flush_time = time()
 
     @rank_zero_only
     def finalize(self, status: str = 'FINISHED') -> None:
         super().finalize(status)
+        self._flush_metrics()
         status = 'FINISHED' if status == 'success' else status
         if self.experiment.get_run(self.run_id):
             self.experiment.set_terminated(self.run_id, status)
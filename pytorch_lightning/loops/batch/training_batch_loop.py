@@ -607,7 +607,7 @@ class TrainingBatchLoop(Loop):
 
         if accumulated_loss is not None:
             # calculate running loss for display
-            self.running_loss.append(self.accumulated_loss.mean() * self.trainer.accumulate_grad_batches)
+            self.running_loss.append(accumulated_loss * self.trainer.accumulate_grad_batches)
 
         # reset for next set of accumulated grads
         self.accumulated_loss.reset()
@@ -99,6 +99,9 @@ class PredictionLoop(DataLoaderLoop):
         """Predicts one entire dataloader"""
         void(*args, **kwargs)
         dataloader = self.trainer.accelerator.process_dataloader(self.current_dataloader)
+        dataloader = self.trainer.data_connector.prefetch_to_device(
+            dataloader, "predict_batch_to_device", self.current_dataloader_idx
+        )
         dataloader_iter = enumerate(dataloader)
         dl_max_batches = self.max_batches[self.current_dataloader_idx]
 
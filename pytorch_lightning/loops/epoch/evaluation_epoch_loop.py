@@ -23,7 +23,7 @@ from pytorch_lightning.loops.base import Loop
 from pytorch_lightning.trainer.connectors.logger_connector.result import ResultCollection
 from pytorch_lightning.trainer.progress import EpochProgress
 from pytorch_lightning.trainer.supporters import PredictionCollection
-from pytorch_lightning.utilities.memory import recursive_detach
+from pytorch_lightning.utilities.memory import _AsyncCPUOffload, recursive_detach
 from pytorch_lightning.utilities.types import STEP_OUTPUT
 
 
@@ -42,6 +42,7 @@ class EvaluationEpochLoop(Loop):
         self.num_dataloaders: Optional[int] = None
         self.outputs: List[STEP_OUTPUT] = []
         self.progress = EpochProgress()
+        self._offload = _AsyncCPUOffload()
 
     def connect(
         self, trainer: "pl.Trainer", *args: Any, progress: Optional[EpochProgress] = None, **kwargs: Any
@@ -111,8 +112,9 @@ class EvaluationEpochLoop(Loop):
         if batch is None:
             raise StopIteration
 
-        with self.trainer.profiler.profile("evaluation_batch_to_device"):
-            batch = self.trainer.accelerator.batch_to_device(batch, dataloader_idx=dataloader_idx)
+        if not self.trainer.data_connector.prefetches_to_device:
+            with self.trainer.profiler.profile("evaluation_batch_to_device"):
+                batch = self.trainer.accelerator.batch_to_device(batch, dataloader_idx=dataloader_idx)
 
         # hook
         self.on_evaluation_batch_start(batch, batch_idx, dataloader_idx)
@@ -133,6 +135,8 @@ class EvaluationEpochLoop(Loop):
 
     def on_run_end(self) -> List[STEP_OUTPUT]:
         """Returns the outputs of the whole run"""
+        # the outputs are moved to CPU asynchronously with `move_metrics_to_cpu=True`
+        self._offload.wait()
         outputs = self.outputs
         # free memory
         self.outputs = []
@@ -261,9 +265,9 @@ class EvaluationEpochLoop(Loop):
                 output = output.detach()
                 if self.trainer.move_metrics_to_cpu:
                     output = output.cpu()
+            elif isinstance(output, (dict, Tensor)) and self.trainer.move_metrics_to_cpu:
+                output = self._offload(output)
             elif isinstance(output, dict):
-                output = recursive_detach(output, to_cpu=self.trainer.move_metrics_to_cpu)
-            elif isinstance(output, Tensor) and output.is_cuda and self.trainer.move_metrics_to_cpu:
-                output = output.cpu()
+                output = recursive_detach(output)
             outputs.append(output)
         return outputs
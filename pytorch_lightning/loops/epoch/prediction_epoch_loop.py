@@ -95,8 +95,9 @@ class PredictionEpochLoop(Loop):
         if batch is None:
             raise StopIteration
 
-        with self.trainer.profiler.profile("predict_batch_to_device"):
-            batch = self.trainer.accelerator.batch_to_device(batch, dataloader_idx=dataloader_idx)
+        if not self.trainer.data_connector.prefetches_to_device:
+            with self.trainer.profiler.profile("predict_batch_to_device"):
+                batch = self.trainer.accelerator.batch_to_device(batch, dataloader_idx=dataloader_idx)
 
         with self.trainer.profiler.profile("predict_step"):
             self._predict_step(batch, batch_idx, dataloader_idx)
@@ -159,8 +160,12 @@ class PredictionEpochLoop(Loop):
 
     def _store_batch_indices(self, dataloader_idx: int) -> None:
         """Stores the batch indices if the predictions should be stored"""
-        batch_sampler = self.trainer.predict_dataloaders[dataloader_idx].batch_sampler
+        dataloader = self.trainer.predict_dataloaders[dataloader_idx]
+        batch_sampler = dataloader.batch_sampler
+        if batch_sampler is None:
+            # the batches fetched with `lightning_getitems` are sampled by the sampler
+            batch_sampler = dataloader.sampler
         if isinstance(batch_sampler, IndexBatchSamplerWrapper):
-            self.current_batch_indices = batch_sampler.batch_indices
+            self.current_batch_indices = batch_sampler.pop_batch_indices()
             if self.should_store_predictions:
-                self._all_batch_indices.append(batch_sampler.batch_indices)
+                self._all_batch_indices.append(self.current_batch_indices)
@@ -114,8 +114,9 @@ class TrainingEpochLoop(loops.Loop):
         # ------------------------------------
         # TRAINING_STEP + TRAINING_STEP_END
         # ------------------------------------
-        with self.trainer.profiler.profile("training_batch_to_device"):
-            batch = self.trainer.accelerator.batch_to_device(batch, dataloader_idx=self._dataloader_idx)
+        if not self.trainer.data_connector.prefetches_to_device:
+            with self.trainer.profiler.profile("training_batch_to_device"):
+                batch = self.trainer.accelerator.batch_to_device(batch, dataloader_idx=self._dataloader_idx)
 
         with self.trainer.profiler.profile("run_training_batch"):
             batch_output = self.batch_loop.run(batch, self.iteration_count, self._dataloader_idx)
@@ -249,31 +250,29 @@ class TrainingEpochLoop(loops.Loop):
         prev_fx_name = self.trainer.lightning_module._current_fx_name
         self.trainer.lightning_module._current_fx_name = hook_name
 
+        trainer_hook, model_hook, accelerator_hook = self.trainer._hook_dispatch(hook_name)
+
         # always profile hooks
         with self.trainer.profiler.profile(hook_name):
 
             # first call trainer hook
-            if hasattr(self.trainer, hook_name):
-                trainer_hook = getattr(self.trainer, hook_name)
+            if trainer_hook is not None:
                 trainer_hook(processed_epoch_output)
 
             # next call hook in lightningModule
-            model_ref = self.trainer.lightning_module
-            if is_overridden(hook_name, model_ref):
-                hook_fx = getattr(model_ref, hook_name)
-                if is_param_in_hook_signature(hook_fx, "outputs"):
+            if model_hook is not None:
+                if is_param_in_hook_signature(model_hook, "outputs"):
                     self._warning_cache.deprecation(
                         "The signature of `ModelHooks.on_train_epoch_end` has changed in v1.3."
                         " `outputs` parameter has been deprecated."
                         " Support for the old signature will be removed in v1.5",
                     )
-                    model_ref.on_train_epoch_end(processed_epoch_output)
+                    model_hook(processed_epoch_output)
                 else:
-                    model_ref.on_train_epoch_end()
+                    model_hook()
 
             # call the accelerator hook
-            if hasattr(self.trainer.accelerator, hook_name):
-                accelerator_hook = getattr(self.trainer.accelerator, hook_name)
+            if accelerator_hook is not None:
                 accelerator_hook()
 
         # restore current_fx when nested context
@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import itertools
-from typing import Any, Iterator, List, Optional
+from collections import deque
+from typing import Any, Deque, Iterator, List, Optional
 
 import torch
 from torch.nn.parallel import DistributedDataParallel
@@ -129,12 +130,24 @@ class IndexBatchSamplerWrapper:
     def __init__(self, sampler: BatchSampler) -> None:
         self._sampler = sampler
         self.batch_indices: Optional[List[int]] = None
+        self._pending_batch_indices: Deque[List[int]] = deque()
 
     def __iter__(self) -> Iterator[List[int]]:
+        self._pending_batch_indices.clear()
         for batch in self._sampler:
             self.batch_indices = batch
+            self._pending_batch_indices.append(batch)
             yield batch
 
+    def pop_batch_indices(self) -> Optional[List[int]]:
+        """
+        Returns the indices of the oldest batch which hasn't been consumed yet. Unlike ``batch_indices``, this stays
+        correct when the batches are fetched ahead, e.g. by dataloader workers or by device prefetching.
+        """
+        if self._pending_batch_indices:
+            return self._pending_batch_indices.popleft()
+        return self.batch_indices
+
     def __len__(self) -> int:
         return len(self._sampler)
 
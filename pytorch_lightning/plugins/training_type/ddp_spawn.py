@@ -14,7 +14,7 @@
 import logging
 import os
 import re
-from typing import Any, List, Optional, Union
+from typing import Any, List, Mapping, Optional, Union
 
 import torch
 import torch.distributed
@@ -33,7 +33,7 @@ from pytorch_lightning.utilities import (
     rank_zero_deprecation,
     rank_zero_warn,
 )
-from pytorch_lightning.utilities.cloud_io import atomic_save
+from pytorch_lightning.utilities.cloud_io import atomic_save, is_sharded_checkpoint
 from pytorch_lightning.utilities.cloud_io import load as pl_load
 from pytorch_lightning.utilities.distributed import (
     distributed_available,
@@ -67,9 +67,14 @@ class DDPSpawnPlugin(ParallelPlugin):
         ddp_comm_state: Optional[object] = None,
         ddp_comm_hook: Optional[callable] = None,
         ddp_comm_wrapper: Optional[callable] = None,
+        sharded_checkpoint: bool = False,
         **kwargs: Any,
     ):
-        super().__init__(parallel_devices=parallel_devices, cluster_environment=cluster_environment)
+        super().__init__(
+            parallel_devices=parallel_devices,
+            cluster_environment=cluster_environment,
+            sharded_checkpoint=sharded_checkpoint,
+        )
         if num_nodes is not None:
             rank_zero_deprecation(
                 "Argument `num_nodes` in `DDPSpawnPlugin` is deprecated in v1.4, and will be removed in v1.6. "
@@ -194,11 +199,26 @@ class DDPSpawnPlugin(ParallelPlugin):
         # move the model to the correct device
         self.model_to_device()
 
+        # the main process restored the shard of rank 0, every process restores from its own shard instead
+        resume_from_sharded_checkpoint = self._resumes_from_sharded_checkpoint(trainer)
+        if resume_from_sharded_checkpoint:
+            checkpoint_connector = trainer.checkpoint_connector
+            checkpoint_connector._loaded_checkpoint = self.load_checkpoint_file(
+                checkpoint_connector.resume_checkpoint_path
+            )
+            checkpoint_connector.restore_datamodule()
+            checkpoint_connector.restore_model()
+            checkpoint_connector.restore_callbacks()
+
         if self.sync_batchnorm:
             self.model = self.configure_sync_batchnorm(self.model)
 
         self.configure_ddp()
 
+        # the optimizers may get wrapped in `configure_ddp`, so they are restored afterwards
+        if resume_from_sharded_checkpoint:
+            trainer.checkpoint_connector.restore_training_state()
+
         self.barrier()
 
         results = trainer.run_stage()
@@ -206,6 +226,20 @@ class DDPSpawnPlugin(ParallelPlugin):
         # persist info in ddp_spawn
         self.transfer_distrib_spawn_state_on_fit_end(results)
 
+    @staticmethod
+    def _resumes_from_sharded_checkpoint(trainer) -> bool:
+        checkpoint_path = trainer.checkpoint_connector.resume_checkpoint_path
+        return (
+            trainer.state.fn == TrainerFn.FITTING and checkpoint_path is not None
+            and is_sharded_checkpoint(checkpoint_path)
+        )
+
+    def load_optimizer_state_dict(self, checkpoint: Mapping[str, Any]) -> None:
+        if not distributed_available() and self._resumes_from_sharded_checkpoint(self.lightning_module.trainer):
+            # the main process doesn't train, the spawned processes restore the optimizers from their own shards
+            return
+        super().load_optimizer_state_dict(checkpoint)
+
     def post_dispatch(self):
         # restore main state with best weights
         best_path = self.mp_queue.get()
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import contextlib
-from typing import Any, Dict, Generator, List, Optional, Union
+from typing import Any, Dict, Generator, List, Mapping, Optional, Union
 
 import torch
 from torch import Tensor
@@ -43,6 +43,7 @@ class DDPFullyShardedPlugin(DDPPlugin):
         state_dict_to_cpu: bool = True,
         parallel_devices: Optional[List[torch.device]] = None,
         cluster_environment: ClusterEnvironment = None,
+        sharded_checkpoint: bool = False,
     ):
         """
         Plugin for Fully Sharded Data Parallel provided by FairScale.
@@ -89,11 +90,15 @@ class DDPFullyShardedPlugin(DDPPlugin):
             state_dict_to_cpu: Whether to return parameters (returned by :func:`state_dict`) on CPU device.
                 If ``False``, this will default to ``compute_device``.
                 (Defautl: True).
+            sharded_checkpoint: Whether every process saves its own shard of the model and optimizer states instead
+                of gathering the full states. The shards get loaded once the model has been wrapped.
+                (Default: False).
         """
 
         super().__init__(
             parallel_devices=parallel_devices,
             cluster_environment=cluster_environment,
+            sharded_checkpoint=sharded_checkpoint,
         )
         self.cpu_offload = cpu_offload
         self.move_grads_to_cpu = move_grads_to_cpu
@@ -105,6 +110,7 @@ class DDPFullyShardedPlugin(DDPPlugin):
         self.min_num_params = min_num_params
         self.state_dict_device = torch.device("cpu") if state_dict_to_cpu else None
         self._process_group = None
+        self._sharded_state_dict: Optional[Dict[str, Any]] = None
 
     @property
     def process_group(self):
@@ -166,6 +172,11 @@ class DDPFullyShardedPlugin(DDPPlugin):
         if self.sync_batchnorm:
             self.model = self.configure_sync_batchnorm(self.model)
         self.configure_ddp()
+        if self._sharded_state_dict is not None:
+            # the local shards of a sharded checkpoint fit the model only once it has been wrapped
+            with self._local_state_dict():
+                self.lightning_module.load_state_dict(self._sharded_state_dict)
+            self._sharded_state_dict = None
         self.barrier()
 
     def model_to_device(self) -> None:
@@ -173,11 +184,29 @@ class DDPFullyShardedPlugin(DDPPlugin):
         self.lightning_module.to(self.root_device)
 
     def lightning_module_state_dict(self) -> Dict[str, Union[Any, Tensor]]:
-        # Currently it is same as default TrainingTypePlugin, i.e. return
-        # the full state dict for FSDP, in the future, we will provide sharded
-        # state dict.
+        if self.sharded_checkpoint:
+            # every process saves the local shards of its parameters, which avoids summoning the full parameters
+            with self._local_state_dict():
+                return self.lightning_module.state_dict()
+        # Otherwise it is same as default TrainingTypePlugin, i.e. return
+        # the full state dict for FSDP.
         return super().lightning_module_state_dict()
 
+    def load_model_state_dict(self, checkpoint: Mapping[str, Any]) -> None:
+        if not self.sharded_checkpoint:
+            return super().load_model_state_dict(checkpoint)
+        # the model gets wrapped after being restored, so the local shards are loaded in `pre_dispatch`
+        self._sharded_state_dict = checkpoint["state_dict"]
+
+    @contextlib.contextmanager
+    def _local_state_dict(self) -> Generator:
+        """Makes all the fully sharded modules return and load the local shards of their parameters."""
+        with contextlib.ExitStack() as stack:
+            for module in self.lightning_module.modules():
+                if isinstance(module, FullyShardedDataParallel):
+                    stack.enter_context(module._no_return_full_state_dict())
+            yield
+
     @property
     def setup_optimizers_in_pre_dispatch(self) -> bool:
         # Setup optimizers after the Fully Sharded Model has been made
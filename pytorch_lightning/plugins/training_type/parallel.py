@@ -14,7 +14,8 @@
 import os
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from typing import Any, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
 import torch
 from torch.nn.parallel import DistributedDataParallel
@@ -24,20 +25,38 @@ from pytorch_lightning.overrides.base import unwrap_lightning_module
 from pytorch_lightning.plugins.environments.cluster_environment import ClusterEnvironment
 from pytorch_lightning.plugins.training_type.training_type_plugin import TrainingTypePlugin
 from pytorch_lightning.utilities import _XLA_AVAILABLE
-from pytorch_lightning.utilities.distributed import all_gather_ddp_if_available, ReduceOp
+from pytorch_lightning.utilities.cloud_io import (
+    atomic_save,
+    is_sharded_checkpoint,
+    load_sharded_checkpoint,
+    load_sharded_checkpoint_manifest,
+    remove_sharded_checkpoint_manifest,
+    save_sharded_checkpoint_manifest,
+    sharded_checkpoint_shard_path,
+)
+from pytorch_lightning.utilities.distributed import all_gather_ddp_if_available, distributed_available, ReduceOp
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 
 
 class ParallelPlugin(TrainingTypePlugin, ABC):
-    """ Plugin for training with multiple processes in parallel. """
+    """
+    Plugin for training with multiple processes in parallel.
+
+    With ``sharded_checkpoint=True``, checkpoints are saved as a directory holding one shard file per process plus a
+    manifest. Every process writes its own states in parallel and restores from its own shard only, so the states
+    don't need to be gathered on rank 0. Sharded checkpoints have to be restored with the same number of processes.
+    """
 
     def __init__(
         self,
         parallel_devices: Optional[List[torch.device]] = None,
         cluster_environment: Optional[ClusterEnvironment] = None,
+        sharded_checkpoint: bool = False,
     ):
         super().__init__()
         self.parallel_devices = parallel_devices
         self.cluster_environment = cluster_environment
+        self.sharded_checkpoint = sharded_checkpoint
 
     @property
     @abstractmethod
@@ -96,6 +115,36 @@ class ParallelPlugin(TrainingTypePlugin, ABC):
         decision = bool(decision == self.world_size)
         return decision
 
+    def save_checkpoint(self, checkpoint: Dict[str, Any], filepath: str) -> None:
+        if not self.sharded_checkpoint:
+            return super().save_checkpoint(checkpoint, filepath)
+
+        checkpoint = self.on_save(checkpoint)
+        # without a process group (e.g. in the main process of `ddp_spawn`), this process writes the only shard
+        distributed = distributed_available()
+        rank = self.global_rank if distributed else 0
+        # invalidate an existing checkpoint before its shards get overwritten
+        if rank == 0:
+            remove_sharded_checkpoint_manifest(filepath)
+        self.barrier("ParallelPlugin.save_checkpoint")
+        atomic_save(checkpoint, sharded_checkpoint_shard_path(filepath, rank))
+        # the manifest marks the checkpoint complete, so it is written once all shards are
+        self.barrier("ParallelPlugin.save_checkpoint")
+        if rank == 0:
+            save_sharded_checkpoint_manifest(filepath, self.world_size if distributed else 1)
+
+    def load_checkpoint_file(self, checkpoint_path: Union[str, Path]) -> Dict[str, Any]:
+        if not is_sharded_checkpoint(checkpoint_path):
+            return super().load_checkpoint_file(checkpoint_path)
+
+        world_size = load_sharded_checkpoint_manifest(checkpoint_path)["world_size"]
+        if world_size != self.world_size:
+            raise MisconfigurationException(
+                f"The sharded checkpoint at {checkpoint_path} was saved by {world_size} processes, it can't be"
+                f" restored by {self.world_size} processes."
+            )
+        return load_sharded_checkpoint(checkpoint_path, self.global_rank, map_location=(lambda storage, loc: storage))
+
     @property
     def torch_distributed_backend(self):
         torch_backend = os.getenv("PL_TORCH_DISTRIBUTED_BACKEND")
@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Optional
+from typing import Any, Mapping, Optional
 
 import torch
 
@@ -73,9 +73,24 @@ class DDPShardedPlugin(DDPPlugin):
     def optimizer_state(self, optimizer: "OSS") -> Optional[dict]:
         if isinstance(optimizer, LightningOptimizer):
             optimizer = optimizer._optimizer
+        if self.sharded_checkpoint:
+            # every process saves the state of its own partition, which avoids consolidating it on rank 0
+            return optimizer.optim.state_dict()
         optimizer.consolidate_state_dict()
         return self._optim_state_dict(optimizer)
 
+    def load_optimizer_state_dict(self, checkpoint: Mapping[str, Any]) -> None:
+        if not self.sharded_checkpoint:
+            return super().load_optimizer_state_dict(checkpoint)
+        optimizer_states = checkpoint["optimizer_states"]
+        for optimizer, opt_state in zip(self.lightning_module.trainer.accelerator.optimizers, optimizer_states):
+            if isinstance(optimizer, OSS):
+                optimizer.optim.load_state_dict(opt_state)
+                # propagate the restored hyperparameters (e.g. the learning rate) to the global param groups
+                OSS._sync_param_groups(optimizer.optim.param_groups, optimizer.param_groups)
+            else:
+                optimizer.load_state_dict(opt_state)
+
     @rank_zero_only
     def _optim_state_dict(self, optimizer):
         """
@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Optional
+from typing import Any, Mapping, Optional
 
 import torch
 
@@ -20,6 +20,7 @@ from pytorch_lightning.plugins.precision.sharded_native_amp import ShardedNative
 from pytorch_lightning.plugins.training_type.ddp_spawn import DDPSpawnPlugin
 from pytorch_lightning.trainer.states import TrainerFn
 from pytorch_lightning.utilities import _FAIRSCALE_AVAILABLE, rank_zero_only
+from pytorch_lightning.utilities.distributed import distributed_available
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 
 if _FAIRSCALE_AVAILABLE:
@@ -58,9 +59,26 @@ class DDPSpawnShardedPlugin(DDPSpawnPlugin):
 
     def optimizer_state(self, optimizer: 'OSS') -> Optional[dict]:
         if isinstance(optimizer, OSS):
+            if self.sharded_checkpoint:
+                # every process saves the state of its own partition, which avoids consolidating it on rank 0
+                return optimizer.optim.state_dict()
             optimizer.consolidate_state_dict()
         return self._optim_state_dict(optimizer)
 
+    def load_optimizer_state_dict(self, checkpoint: Mapping[str, Any]) -> None:
+        if not self.sharded_checkpoint or not distributed_available():
+            # the optimizers of the main process aren't wrapped with `OSS`, the spawned processes restore their
+            # partitions in `new_process`
+            return super().load_optimizer_state_dict(checkpoint)
+        optimizer_states = checkpoint["optimizer_states"]
+        for optimizer, opt_state in zip(self.lightning_module.trainer.accelerator.optimizers, optimizer_states):
+            if isinstance(optimizer, OSS):
+                optimizer.optim.load_state_dict(opt_state)
+                # propagate the restored hyperparameters (e.g. the learning rate) to the global param groups
+                OSS._sync_param_groups(optimizer.optim.param_groups, optimizer.param_groups)
+            else:
+                optimizer.load_state_dict(opt_state)
+
     @rank_zero_only
     def _optim_state_dict(self, optimizer):
         """
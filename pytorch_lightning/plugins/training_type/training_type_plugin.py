@@ -26,7 +26,12 @@ import pytorch_lightning as pl
 from pytorch_lightning.overrides.base import unwrap_lightning_module
 from pytorch_lightning.plugins.base_plugin import Plugin
 from pytorch_lightning.utilities import rank_zero_warn
-from pytorch_lightning.utilities.cloud_io import atomic_save
+from pytorch_lightning.utilities.cloud_io import (
+    AsyncCheckpointWriter,
+    atomic_save,
+    is_sharded_checkpoint,
+    load_sharded_checkpoint,
+)
 from pytorch_lightning.utilities.cloud_io import load as pl_load
 from pytorch_lightning.utilities.types import _EVALUATE_OUTPUT, _PREDICT_OUTPUT
 
@@ -42,6 +47,8 @@ class TrainingTypePlugin(Plugin, ABC):
         self._model = None
         self._results: Optional[Union[_EVALUATE_OUTPUT, _PREDICT_OUTPUT]] = None
         self._call_configure_sharded_model_hook = True
+        self.checkpoint_writer: Optional[AsyncCheckpointWriter] = None
+        self._save_checkpoints_async = False
 
     def connect(self, model: Module) -> None:
         """Called by the accelerator to connect the accelerator and the model with this plugin"""
@@ -146,6 +153,9 @@ class TrainingTypePlugin(Plugin, ABC):
         return self._results
 
     def load_checkpoint_file(self, checkpoint_path: Union[str, Path]) -> Dict[str, Any]:
+        if is_sharded_checkpoint(checkpoint_path):
+            # a single process restores from the shard of rank 0
+            return load_sharded_checkpoint(checkpoint_path, map_location=(lambda storage, loc: storage))
         return pl_load(checkpoint_path, map_location=(lambda storage, loc: storage))
 
     def load_model_state_dict(self, checkpoint: Mapping[str, Any]) -> None:
@@ -262,6 +272,13 @@ class TrainingTypePlugin(Plugin, ABC):
         # dump states as a checkpoint dictionary object
         checkpoint = self.on_save(checkpoint)
         if self.is_global_zero:
+            if self.checkpoint_writer is not None:
+                if self._save_checkpoints_async:
+                    # the checkpoint is serialized and written in the background
+                    self.checkpoint_writer.save(checkpoint, filepath)
+                    return
+                # the other checkpoints are written synchronously, after the pending ones
+                self.checkpoint_writer.wait()
             try:
                 # write the checkpoint dictionary on the file
                 atomic_save(checkpoint, filepath)
@@ -271,6 +288,16 @@ class TrainingTypePlugin(Plugin, ABC):
                 rank_zero_warn(f'Warning, `{key}` dropped from checkpoint. An attribute is not picklable: {err}')
                 atomic_save(checkpoint, filepath)
 
+    @contextlib.contextmanager
+    def save_checkpoints_async(self) -> Generator:
+        """The checkpoints saved within this context are written by the :attr:`checkpoint_writer` in the background,
+        if it is set."""
+        self._save_checkpoints_async = True
+        try:
+            yield
+        finally:
+            self._save_checkpoints_async = False
+
     @contextlib.contextmanager
     def model_sharded_context(self) -> Generator:
         """
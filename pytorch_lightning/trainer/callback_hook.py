@@ -29,66 +29,83 @@ from pytorch_lightning.utilities.warnings import WarningCache
 warning_cache = WarningCache()
 
 
+def _is_hook_implemented(callback: Callback, hook_name: str) -> bool:
+    # anything other than the base class no-op (an override, a mock, a patched attribute) has to be called
+    hook = getattr(callback, hook_name, None)
+    return getattr(hook, "__func__", None) is not getattr(Callback, hook_name)
+
+
 class TrainerCallbackHookMixin(ABC):
 
     # this is just a summary on variables used in this abstract class,
     # the proper values/initialisation should be done in child class
     callbacks: List[Callback] = []
     lightning_module: 'pl.LightningModule'
+    _callback_hooks: Dict[str, List[Callback]]
+
+    def _callbacks_with_hook(self, hook_name: str) -> List[Callback]:
+        """Returns the callbacks implementing ``hook_name``, the ones inheriting the no-op from
+        :class:`~pytorch_lightning.callbacks.base.Callback` are skipped. The result is cached until the next call
+        to :meth:`~pytorch_lightning.trainer.trainer.Trainer._reset_hook_dispatch_table`."""
+        callbacks = self._callback_hooks.get(hook_name)
+        if callbacks is None:
+            callbacks = [c for c in self.callbacks if _is_hook_implemented(c, hook_name)]
+            self._callback_hooks[hook_name] = callbacks
+        return callbacks
 
     def on_before_accelerator_backend_setup(self, model: 'pl.LightningModule') -> None:
         """Called at the beginning of fit (train + validate), validate, test, or predict, or tune."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_before_accelerator_backend_setup"):
             callback.on_before_accelerator_backend_setup(self, model)
 
     def configure_sharded_model(self, model: 'pl.LightningModule') -> None:
         """Called at the beginning of fit (train + validate), validate, test, or predict, or tune."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_configure_sharded_model"):
             callback.on_configure_sharded_model(self, model)
 
     def setup(self, model: 'pl.LightningModule', stage: Optional[str]) -> None:
         """Called at the beginning of fit (train + validate), validate, test, or predict, or tune."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("setup"):
             callback.setup(self, model, stage=stage)
 
     def teardown(self, stage: Optional[str] = None) -> None:
         """Called at the end of fit (train + validate), validate, test, or predict, or tune."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("teardown"):
             callback.teardown(self, self.lightning_module, stage=stage)
 
     def on_init_start(self):
         """Called when the trainer initialization begins, model has not yet been set."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_init_start"):
             callback.on_init_start(self)
 
     def on_init_end(self):
         """Called when the trainer initialization ends, model has not yet been set."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_init_end"):
             callback.on_init_end(self)
 
     def on_fit_start(self):
         """Called when the trainer initialization begins, model has not yet been set."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_fit_start"):
             callback.on_fit_start(self, self.lightning_module)
 
     def on_fit_end(self):
         """Called when the trainer initialization begins, model has not yet been set."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_fit_end"):
             callback.on_fit_end(self, self.lightning_module)
 
     def on_sanity_check_start(self):
         """Called when the validation sanity check starts."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_sanity_check_start"):
             callback.on_sanity_check_start(self, self.lightning_module)
 
     def on_sanity_check_end(self):
         """Called when the validation sanity check ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_sanity_check_end"):
             callback.on_sanity_check_end(self, self.lightning_module)
 
     def on_train_epoch_start(self):
         """Called when the epoch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_train_epoch_start"):
             callback.on_train_epoch_start(self, self.lightning_module)
 
     def on_train_epoch_end(self, outputs: EPOCH_OUTPUT):
@@ -97,7 +114,7 @@ class TrainerCallbackHookMixin(ABC):
         Args:
             outputs: List of outputs on each ``train`` epoch
         """
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_train_epoch_end"):
             if is_param_in_hook_signature(callback.on_train_epoch_end, "outputs"):
                 warning_cache.deprecation(
                     "The signature of `Callback.on_train_epoch_end` has changed in v1.3."
@@ -110,147 +127,147 @@ class TrainerCallbackHookMixin(ABC):
 
     def on_validation_epoch_start(self):
         """Called when the epoch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_validation_epoch_start"):
             callback.on_validation_epoch_start(self, self.lightning_module)
 
     def on_validation_epoch_end(self):
         """Called when the validation epoch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_validation_epoch_end"):
             callback.on_validation_epoch_end(self, self.lightning_module)
 
     def on_test_epoch_start(self):
         """Called when the epoch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_test_epoch_start"):
             callback.on_test_epoch_start(self, self.lightning_module)
 
     def on_test_epoch_end(self):
         """Called when the test epoch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_test_epoch_end"):
             callback.on_test_epoch_end(self, self.lightning_module)
 
     def on_predict_epoch_start(self) -> None:
         """Called when the epoch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_predict_epoch_start"):
             callback.on_predict_epoch_start(self, self.lightning_module)
 
     def on_predict_epoch_end(self, outputs: List[Any]) -> None:
         """Called when the epoch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_predict_epoch_end"):
             callback.on_predict_epoch_end(self, self.lightning_module, outputs)
 
     def on_epoch_start(self):
         """Called when either of train/val/test epoch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_epoch_start"):
             callback.on_epoch_start(self, self.lightning_module)
 
     def on_epoch_end(self):
         """Called when either of train/val/test epoch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_epoch_end"):
             callback.on_epoch_end(self, self.lightning_module)
 
     def on_train_start(self):
         """Called when the train begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_train_start"):
             callback.on_train_start(self, self.lightning_module)
 
     def on_train_end(self):
         """Called when the train ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_train_end"):
             callback.on_train_end(self, self.lightning_module)
 
     def on_pretrain_routine_start(self) -> None:
         """Called when the pre-train routine begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_pretrain_routine_start"):
             callback.on_pretrain_routine_start(self, self.lightning_module)
 
     def on_pretrain_routine_end(self) -> None:
         """Called when the pre-train routine ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_pretrain_routine_end"):
             callback.on_pretrain_routine_end(self, self.lightning_module)
 
     def on_batch_start(self):
         """Called when the training batch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_batch_start"):
             callback.on_batch_start(self, self.lightning_module)
 
     def on_batch_end(self):
         """Called when the training batch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_batch_end"):
             callback.on_batch_end(self, self.lightning_module)
 
     def on_train_batch_start(self, batch, batch_idx, dataloader_idx):
         """Called when the training batch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_train_batch_start"):
             callback.on_train_batch_start(self, self.lightning_module, batch, batch_idx, dataloader_idx)
 
     def on_train_batch_end(self, outputs: STEP_OUTPUT, batch, batch_idx, dataloader_idx):
         """Called when the training batch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_train_batch_end"):
             callback.on_train_batch_end(self, self.lightning_module, outputs, batch, batch_idx, dataloader_idx)
 
     def on_validation_batch_start(self, batch, batch_idx, dataloader_idx):
         """Called when the validation batch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_validation_batch_start"):
             callback.on_validation_batch_start(self, self.lightning_module, batch, batch_idx, dataloader_idx)
 
     def on_validation_batch_end(self, outputs: STEP_OUTPUT, batch, batch_idx, dataloader_idx):
         """Called when the validation batch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_validation_batch_end"):
             callback.on_validation_batch_end(self, self.lightning_module, outputs, batch, batch_idx, dataloader_idx)
 
     def on_test_batch_start(self, batch, batch_idx, dataloader_idx):
         """Called when the test batch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_test_batch_start"):
             callback.on_test_batch_start(self, self.lightning_module, batch, batch_idx, dataloader_idx)
 
     def on_test_batch_end(self, outputs: STEP_OUTPUT, batch, batch_idx, dataloader_idx):
         """Called when the test batch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_test_batch_end"):
             callback.on_test_batch_end(self, self.lightning_module, outputs, batch, batch_idx, dataloader_idx)
 
     def on_predict_batch_start(self, batch: Any, batch_idx: int, dataloader_idx: int) -> None:
         """Called when the predict batch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_predict_batch_start"):
             callback.on_predict_batch_start(self, self.lightning_module, batch, batch_idx, dataloader_idx)
 
     def on_predict_batch_end(self, outputs: STEP_OUTPUT, batch: Any, batch_idx: int, dataloader_idx: int) -> None:
         """Called when the predict batch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_predict_batch_end"):
             callback.on_predict_batch_end(self, self.lightning_module, outputs, batch, batch_idx, dataloader_idx)
 
     def on_validation_start(self):
         """Called when the validation loop begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_validation_start"):
             callback.on_validation_start(self, self.lightning_module)
 
     def on_validation_end(self):
         """Called when the validation loop ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_validation_end"):
             callback.on_validation_end(self, self.lightning_module)
 
     def on_test_start(self):
         """Called when the test begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_test_start"):
             callback.on_test_start(self, self.lightning_module)
 
     def on_test_end(self):
         """Called when the test ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_test_end"):
             callback.on_test_end(self, self.lightning_module)
 
     def on_predict_start(self) -> None:
         """Called when predict begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_predict_start"):
             callback.on_predict_start(self, self.lightning_module)
 
     def on_predict_end(self) -> None:
         """Called when predict ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_predict_end"):
             callback.on_predict_end(self, self.lightning_module)
 
     def on_keyboard_interrupt(self):
         """Called when the training is interrupted by KeyboardInterrupt."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_keyboard_interrupt"):
             callback.on_keyboard_interrupt(self, self.lightning_module)
 
     @staticmethod
@@ -317,26 +334,26 @@ class TrainerCallbackHookMixin(ABC):
 
     def on_before_backward(self, loss: torch.Tensor) -> None:
         """Called before ``loss.backward()``."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_before_backward"):
             callback.on_before_backward(self, self.lightning_module, loss)
 
     def on_after_backward(self):
         """
         Called after loss.backward() and before optimizers do anything.
         """
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_after_backward"):
             callback.on_after_backward(self, self.lightning_module)
 
     def on_before_optimizer_step(self, optimizer, optimizer_idx):
         """
         Called after on_after_backward() once the gradient is accumulated and before optimizer.step().
         """
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_before_optimizer_step"):
             callback.on_before_optimizer_step(self, self.lightning_module, optimizer, optimizer_idx)
 
     def on_before_zero_grad(self, optimizer):
         """
         Called after optimizer.step() and before optimizer.zero_grad().
         """
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_before_zero_grad"):
             callback.on_before_zero_grad(self, self.lightning_module, optimizer)
@@ -51,6 +51,9 @@ class CheckpointConnector:
         2. from `resume_from_checkpoint` file if provided
         3. don't restore
 
+        Local checkpoint files get memory-mapped where supported, and the ``restore_*`` methods release each section
+        of the checkpoint as soon as it has been restored.
+
         Raises:
             FileNotFoundError: If the path to the checkpoint file is provided but the file does not exist.
         """
@@ -141,6 +144,9 @@ class CheckpointConnector:
         # restore model state_dict
         self.trainer.training_type_plugin.load_model_state_dict(self._loaded_checkpoint)
 
+        # the weights have been copied into the model, release them before the remaining states get restored
+        self._loaded_checkpoint.pop("state_dict", None)
+
     def restore_model_weights(self, checkpoint_path: Optional[Union[str, Path]]) -> None:
         """ Restore only the model weights. """
         checkpoint = self._loaded_checkpoint
@@ -178,6 +184,7 @@ class CheckpointConnector:
                 " where `model.ckpt` is your checkpoint file."
             )
         self.trainer.on_load_checkpoint(self._loaded_checkpoint)
+        self._loaded_checkpoint.pop("callbacks", None)
 
     def restore_progress(self) -> None:
         """
@@ -238,6 +245,7 @@ class CheckpointConnector:
                     for k, v in state.items():
                         if isinstance(v, torch.Tensor):
                             state[k] = v.cuda(self.trainer.root_gpu)
+        self._loaded_checkpoint.pop("optimizer_states", None)
 
     def restore_lr_schedulers(self) -> None:
         """ Restores the learning rate scheduler states from the pre-loaded checkpoint. """
@@ -248,6 +256,7 @@ class CheckpointConnector:
         lr_schedulers = self._loaded_checkpoint['lr_schedulers']
         for scheduler, lrs_state in zip(self.trainer.lr_schedulers, lr_schedulers):
             scheduler['scheduler'].load_state_dict(lrs_state)
+        self._loaded_checkpoint.pop("lr_schedulers", None)
 
     # ----------------------------------
     # PRIVATE OPS
@@ -419,6 +428,12 @@ class CheckpointConnector:
         ckpt_number = max_suffix if max_suffix is not None else 0
         return f'{folder_path}/hpc_ckpt_{ckpt_number}.ckpt'
 
+    def wait_for_checkpoint_writes(self) -> None:
+        """Blocks until the checkpoints being written in the background have been written."""
+        writer = self.trainer.training_type_plugin.checkpoint_writer
+        if writer is not None:
+            writer.close()
+
     def save_checkpoint(self, filepath, weights_only: bool = False) -> None:
         """Save model/training states as a checkpoint file through state-dump and file-write.
 
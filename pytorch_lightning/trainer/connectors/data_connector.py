@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, Union
+from functools import partial
+from typing import Any, Dict, Iterable, Optional, Union
 
 import pytorch_lightning as pl
-from pytorch_lightning.trainer.supporters import prefetch_iterator
-from pytorch_lightning.utilities import rank_zero_deprecation
+from pytorch_lightning.trainer.supporters import DevicePrefetcher, prefetch_iterator
+from pytorch_lightning.utilities import DeviceType, rank_zero_deprecation
+from pytorch_lightning.utilities.dataset_cache import CachedDataset
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.model_helpers import is_overridden
 from pytorch_lightning.utilities.types import EVAL_DATALOADERS, TRAIN_DATALOADERS
@@ -27,6 +29,10 @@ class DataConnector:
     def __init__(self, trainer: "pl.Trainer", multiple_trainloader_mode: str = "max_size_cycle"):
         self.trainer = trainer
         self.multiple_trainloader_mode = multiple_trainloader_mode
+        # the arguments found by the dataloader tuner, which override those of the train dataloader
+        self.train_dataloader_kwargs: Dict[str, Any] = {}
+        # the caches of the training datasets, by position of the dataset, reused when the dataloaders are reloaded
+        self._dataset_caches: Dict[int, CachedDataset] = {}
 
     def on_trainer_init(
         self,
@@ -34,6 +40,8 @@ class DataConnector:
         reload_dataloaders_every_n_epochs: int,
         reload_dataloaders_every_epoch: bool,
         prepare_data_per_node: bool,
+        prefetch_batches: int = 0,
+        dataset_cache_bytes: int = 0,
     ) -> None:
         self.trainer.datamodule = None
         self.trainer.prepare_data_per_node = prepare_data_per_node
@@ -61,7 +69,37 @@ class DataConnector:
         self.trainer.reload_dataloaders_every_n_epochs = reload_dataloaders_every_n_epochs
         self.trainer._is_data_prepared = False
 
+        if not isinstance(prefetch_batches, int) or prefetch_batches < 0:
+            raise MisconfigurationException(f"`prefetch_batches` should be an int >= 0, got {prefetch_batches}.")
+        self.trainer.prefetch_batches = prefetch_batches
+
+        if not isinstance(dataset_cache_bytes, int) or dataset_cache_bytes < 0:
+            raise MisconfigurationException(f"`dataset_cache_bytes` should be an int >= 0, got {dataset_cache_bytes}.")
+        self.trainer.dataset_cache_bytes = dataset_cache_bytes
+
+    @property
+    def prefetches_to_device(self) -> bool:
+        """Whether the batches get moved to the device in the background instead of by the loops."""
+        return self.trainer.prefetch_batches > 0 and self.trainer._device_type not in (DeviceType.TPU, DeviceType.IPU)
+
+    def prefetch_to_device(self, dataloader: Iterable, action_name: str, dataloader_idx: int = 0) -> Iterable:
+        """Wraps the dataloader into a :class:`~pytorch_lightning.trainer.supporters.DevicePrefetcher` if enabled.
+
+        The time the loop waits for the next batch to be on the device is profiled as ``action_name``.
+        """
+        if not self.prefetches_to_device:
+            return dataloader
+        accelerator = self.trainer.accelerator
+        prefetcher = DevicePrefetcher(
+            dataloader,
+            partial(accelerator.batch_to_device, dataloader_idx=dataloader_idx),
+            accelerator.root_device,
+            depth=self.trainer.prefetch_batches,
+        )
+        return self.trainer.profiler.profile_iterable(prefetcher, action_name)
+
     def get_profiled_train_dataloader(self, train_dataloader):
+        train_dataloader = self.prefetch_to_device(train_dataloader, "training_batch_to_device")
         profiled_dl = self.trainer.profiler.profile_iterable(
             enumerate(prefetch_iterator(train_dataloader)), "get_train_batch"
         )
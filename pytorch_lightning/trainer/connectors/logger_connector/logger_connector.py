@@ -13,16 +13,17 @@
 # limitations under the License.
 import os
 from pprint import pprint
-from typing import Any, Dict, Iterable, Mapping, Optional, Union
+from typing import Any, Dict, Iterable, Mapping, Optional, Set, Union
 
 import torch
 
 import pytorch_lightning as pl
 from pytorch_lightning.core import memory
-from pytorch_lightning.loggers import LightningLoggerBase, LoggerCollection, TensorBoardLogger
+from pytorch_lightning.loggers import AsyncLogger, LightningLoggerBase, LoggerCollection, TensorBoardLogger
 from pytorch_lightning.trainer.connectors.logger_connector.result import _METRIC, MetricSource
 from pytorch_lightning.trainer.states import RunningStage, TrainerFn
 from pytorch_lightning.utilities import DeviceType
+from pytorch_lightning.utilities.apply_func import apply_to_collection
 from pytorch_lightning.utilities.metrics import metrics_to_scalars
 from pytorch_lightning.utilities.types import _EVALUATE_OUTPUT
 
@@ -35,7 +36,8 @@ class LoggerConnector:
         self.eval_loop_results = []
         self._val_log_step: int = 0
         self._test_log_step: int = 0
-        self._progress_bar_metrics: Dict[str, float] = {}
+        self._progress_bar_metrics: Dict[str, _METRIC] = {}
+        self._progress_bar_keys_checked: Set[str] = set()
         self._logged_metrics: Dict[str, _METRIC] = {}
         self._callback_metrics: Dict[str, _METRIC] = {}
         self._gpus_metrics: Dict[str, str] = {}
@@ -95,11 +97,17 @@ class LoggerConnector:
         if self.trainer.logger is None or not metrics:
             return
 
-        # turn all tensors to scalars
-        scalar_metrics = metrics_to_scalars(metrics)
+        if isinstance(self.trainer.logger, AsyncLogger):
+            # the tensors are turned to scalars by the logger, away from the training loop
+            scalar_metrics = apply_to_collection(metrics, torch.Tensor, torch.Tensor.detach)
+        else:
+            # turn all tensors to scalars
+            scalar_metrics = metrics_to_scalars(metrics)
 
         if step is None:
             step = scalar_metrics.pop("step", None)
+            if isinstance(step, torch.Tensor):
+                step = int(step.item())
         if step is None:
             # added metrics for convenience
             scalar_metrics.setdefault("epoch", self.trainer.current_epoch)
@@ -112,6 +120,11 @@ class LoggerConnector:
 
         self._logged_metrics.update(scalar_metrics)
 
+    def wait_for_logger(self) -> None:
+        """Waits for the logging calls queued by an :class:`~pytorch_lightning.loggers.base.AsyncLogger`."""
+        if isinstance(self.trainer.logger, AsyncLogger):
+            self.trainer.logger.flush()
+
     """
     Evaluation metric updates
     """
@@ -268,6 +281,10 @@ class LoggerConnector:
             is_first_batch = self._batch_idx + self._split_idx == 0
         return is_different_fx and is_first_batch
 
+    def reset_progress_bar_keys_checked(self) -> None:
+        # the progress bar metrics of the model can change between runs
+        self._progress_bar_keys_checked = set()
+
     def reset(self, metrics: Optional[bool] = None) -> None:
         if self.trainer.sanity_checking:
             # reset metrics
@@ -311,4 +328,5 @@ class LoggerConnector:
         if self.trainer._results:
             metrics = self.metrics[MetricSource.PBAR]
             self._progress_bar_metrics.update(metrics)
-        return self._progress_bar_metrics
+        # the tensors are only transferred to the host when requested, usually when the progress bar refreshes
+        return metrics_to_scalars(self._progress_bar_metrics)
@@ -14,7 +14,7 @@
 from collections.abc import Generator
 from dataclasses import asdict, dataclass, replace
 from functools import partial, wraps
-from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 import torch
 from torchmetrics import Metric
@@ -26,7 +26,6 @@ from pytorch_lightning.utilities.device_dtype_mixin import DeviceDtypeModuleMixi
 from pytorch_lightning.utilities.distributed import distributed_available
 from pytorch_lightning.utilities.enums import LightningEnum
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
-from pytorch_lightning.utilities.metrics import metrics_to_scalars
 from pytorch_lightning.utilities.warnings import WarningCache
 
 # re-define the ones from pytorch_lightning.utilities.types without the `Number` type
@@ -165,11 +164,26 @@ class _Metadata:
 class ResultMetric(Metric, DeviceDtypeModuleMixin):
     """Wraps the value provided to `:meth:`~pytorch_lightning.core.lightning.LightningModule.log`"""
 
+    # set when the states are accumulated in the packed buffers of a `_PackedAccumulator`
+    _accumulator: Optional['_PackedAccumulator'] = None
+    _slot: Optional[int] = None
+
     def __init__(self, metadata: _Metadata, is_tensor: bool) -> None:
         super().__init__()
         self.is_tensor = is_tensor
         self.meta = metadata
         self.has_reset = False
+        # the reduction used to accumulate the values in packed buffers, if they can be
+        self.packed_reduction: Optional[str] = None
+        if is_tensor and metadata.on_epoch and not metadata.enable_graph:
+            if metadata.is_mean_reduction:
+                self.packed_reduction = "mean"
+            elif metadata.is_sum_reduction:
+                self.packed_reduction = "sum"
+            elif metadata.reduce_fx is torch.max:
+                self.packed_reduction = "max"
+            elif metadata.reduce_fx is torch.min:
+                self.packed_reduction = "min"
         if is_tensor:
             self.add_state("value", torch.tensor(0, dtype=torch.float), dist_reduce_fx=torch.sum)
             if self.meta.is_mean_reduction:
@@ -195,14 +209,51 @@ class ResultMetric(Metric, DeviceDtypeModuleMixin):
             self.value = value  # noqa: attribute-defined-outside-init
             self._forward_cache = value._forward_cache
 
+    @property
+    def value(self) -> Any:
+        return self._get_state("value")
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._set_state("value", value)
+
+    @property
+    def cumulated_batch_size(self) -> torch.Tensor:
+        return self._get_state("cumulated_batch_size")
+
+    @cumulated_batch_size.setter
+    def cumulated_batch_size(self, cumulated_batch_size: torch.Tensor) -> None:
+        self._set_state("cumulated_batch_size", cumulated_batch_size)
+
+    def _get_state(self, name: str) -> Any:
+        if self._accumulator is not None:
+            # scatter the packed states back into this metric
+            self._accumulator.materialize()
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def _set_state(self, name: str, value: Any) -> None:
+        self.__dict__[name] = value
+        if self._accumulator is not None:
+            self._accumulator.set_state(self._slot, name, value)
+
+    @property
+    def sync_states(self) -> List[torch.Tensor]:
+        """The tensor states which need to be synced across processes before computing the value."""
+        if self.meta.is_mean_reduction:
+            return [self.value, self.cumulated_batch_size]
+        return [self.value]
+
+    def _compute_synced(self, value: torch.Tensor, cumulated_batch_size: Optional[torch.Tensor] = None) -> torch.Tensor:
+        if self.meta.is_mean_reduction:
+            return value / cumulated_batch_size
+        return value
+
     def compute(self) -> torch.Tensor:
         if self.is_tensor:
-            value = self.meta.sync(self.value)
-            if self.meta.is_mean_reduction:
-                cumulated_batch_size = self.meta.sync(self.cumulated_batch_size)
-                return value / cumulated_batch_size
-            elif self.meta.is_max_reduction or self.meta.is_min_reduction or self.meta.is_sum_reduction:
-                return value
+            return self._compute_synced(*(self.meta.sync(state) for state in self.sync_states))
         return self.value.compute()
 
     def reset(self) -> None:
@@ -250,7 +301,9 @@ class ResultMetric(Metric, DeviceDtypeModuleMixin):
         return f"{self.__class__.__name__}({state})"
 
     def __getstate__(self, drop_value: bool = False) -> dict:
-        skip = ['update', 'compute', '_update_signature']
+        if self._accumulator is not None:
+            self._accumulator.materialize()
+        skip = ['update', 'compute', '_update_signature', '_accumulator', '_slot']
         if not self.is_tensor and drop_value:
             # Avoid serializing ResultMetrics which are passed Metrics
             skip.append('value')
@@ -322,6 +375,105 @@ class ResultMetricCollection(dict):
         return rmc
 
 
+class _PackedAccumulator:
+    """
+    Accumulates the scalar values of several
+    :class:`~pytorch_lightning.trainer.connectors.logger_connector.result.ResultMetric` with the same reduction and
+    device in packed buffers.
+
+    The values logged since the last flush are stacked and reduced into the buffers with a single operation, instead
+    of a few kernels per metric. The states of the ``ResultMetric`` are only updated when they are read, e.g. on
+    ``compute``.
+    """
+
+    def __init__(self, reduction: str, device: torch.device) -> None:
+        self.reduction = reduction
+        self.device = device
+        self.result_metrics: List[ResultMetric] = []
+        self.values = torch.zeros(0, dtype=torch.float, device=device)
+        self.cumulated_batch_sizes = torch.zeros(0, dtype=torch.float, device=device) if reduction == "mean" else None
+        self._pending_slots: List[int] = []
+        self._pending_slots_set: Set[int] = set()
+        self._pending_values: List[torch.Tensor] = []
+        self._pending_batch_sizes: List[torch.Tensor] = []
+        self._index_cache: Tuple[Tuple[int, ...], Optional[torch.Tensor]] = ((), None)
+        self._dirty = False
+
+    def add(self, result_metric: ResultMetric) -> None:
+        """Moves the states of ``result_metric`` into a new slot of the buffers."""
+        result_metric._slot = len(self.result_metrics)
+        result_metric._accumulator = self
+        self.result_metrics.append(result_metric)
+        state = result_metric.__dict__
+        self.values = torch.cat([self.values, state["value"].to(self.values).reshape(1)])
+        if self.cumulated_batch_sizes is not None:
+            cumulated_batch_size = state["cumulated_batch_size"].to(self.cumulated_batch_sizes).reshape(1)
+            self.cumulated_batch_sizes = torch.cat([self.cumulated_batch_sizes, cumulated_batch_size])
+
+    def update(self, slot: int, value: torch.Tensor, batch_size: torch.Tensor) -> None:
+        if slot in self._pending_slots_set:
+            # each slot can only be updated once per flush
+            self.flush()
+        self._pending_slots.append(slot)
+        self._pending_slots_set.add(slot)
+        self._pending_values.append(value)
+        self._pending_batch_sizes.append(batch_size)
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Reduces the pending values into the buffers."""
+        if not self._pending_slots:
+            return
+        slots = tuple(self._pending_slots)
+        # performance: the same metrics are usually logged in the same order on every step
+        if self._index_cache[0] != slots:
+            self._index_cache = (slots, torch.tensor(slots, device=self.device))
+        index = self._index_cache[1]
+        values = torch.stack(self._pending_values)
+        if self.reduction in ("mean", "sum"):
+            batch_sizes = torch.stack(self._pending_batch_sizes)
+            self.values.index_add_(0, index, values * batch_sizes)
+            if self.cumulated_batch_sizes is not None:
+                self.cumulated_batch_sizes.index_add_(0, index, batch_sizes.to(self.cumulated_batch_sizes))
+        else:
+            reduce_fx = torch.max if self.reduction == "max" else torch.min
+            self.values.index_copy_(0, index, reduce_fx(self.values.index_select(0, index), values))
+        self._pending_slots = []
+        self._pending_slots_set = set()
+        self._pending_values = []
+        self._pending_batch_sizes = []
+
+    def materialize(self) -> None:
+        """Scatters the packed states back into each ``ResultMetric``."""
+        self.flush()
+        if not self._dirty:
+            return
+        # a copy so that the states are not modified by the next updates
+        values = self.values.clone()
+        for result_metric, value in zip(self.result_metrics, values):
+            result_metric.__dict__["value"] = value
+        if self.cumulated_batch_sizes is not None:
+            cumulated_batch_sizes = self.cumulated_batch_sizes.clone()
+            for result_metric, cumulated_batch_size in zip(self.result_metrics, cumulated_batch_sizes):
+                result_metric.__dict__["cumulated_batch_size"] = cumulated_batch_size
+        self._dirty = False
+
+    def set_state(self, slot: int, name: str, value: torch.Tensor) -> None:
+        """Writes a state which was set on a ``ResultMetric`` into the buffers, e.g. on ``reset``."""
+        self.flush()
+        buffer = self.values if name == "value" else self.cumulated_batch_sizes
+        buffer[slot] = value
+        self._dirty = True
+
+    def unpack(self) -> None:
+        """Gives each ``ResultMetric`` its own states back."""
+        self.materialize()
+        for result_metric in self.result_metrics:
+            result_metric._accumulator = None
+            result_metric._slot = None
+        self.result_metrics = []
+
+
 class ResultCollection(dict):
     """
     Collection (dictionary) of :class:`~pytorch_lightning.trainer.connectors.logger_connector.result.ResultMetric` or
@@ -346,6 +498,10 @@ class ResultCollection(dict):
         self._minimize = None
         self._batch_size = torch.tensor(1, device=device)
         self.device: Optional[Union[str, torch.device]] = device
+        # maps `(fx, name, dataloader_idx)` to the `log` arguments, the storage key and the value registered for them
+        self._log_cache: Dict[Tuple[str, str, Optional[int]], Tuple[tuple, str, Any]] = {}
+        # maps `(reduction, device)` to the packed states of the scalar `on_epoch` metrics
+        self._accumulators: Dict[Tuple[str, torch.device], _PackedAccumulator] = {}
 
     @property
     def result_metrics(self) -> List[ResultMetric]:
@@ -435,46 +591,61 @@ class ResultCollection(dict):
         if isinstance(value, torch.Tensor) and value.device.type == "xla":
             value = value.cpu()
 
-        # storage key
-        key = f"{fx}.{name}"
-        # add dataloader_suffix to both key and fx
-        if dataloader_idx is not None:
-            key += f'.{dataloader_idx}'
-            fx += f'.{dataloader_idx}'
-
-        meta = _Metadata(
-            fx=fx,
-            name=name,
-            prog_bar=prog_bar,
-            logger=logger,
-            on_step=on_step,
-            on_epoch=on_epoch,
-            enable_graph=enable_graph,
-            dataloader_idx=dataloader_idx,
-            metric_attribute=metric_attribute,
-        )
-        meta.reduce_fx = reduce_fx
-        meta.sync = _Sync(
-            should=sync_dist,
-            fn=sync_dist_fn,
-            group=sync_dist_group,
-            rank_zero_only=rank_zero_only,
+        cache_key = (fx, name, dataloader_idx)
+        log_args = (
+            prog_bar, logger, on_step, on_epoch, reduce_fx, enable_graph, sync_dist, sync_dist_fn, sync_dist_group,
+            metric_attribute, rank_zero_only
         )
+        cached = self._log_cache.get(cache_key)
+        if cached is not None and cached[0] == log_args and self.get(cached[1]) is cached[2]:
+            # performance: the metadata of this key was already created and validated with the same arguments
+            key = cached[1]
+        else:
+            # storage key
+            key = f"{fx}.{name}"
+            # add dataloader_suffix to both key and fx
+            if dataloader_idx is not None:
+                key += f'.{dataloader_idx}'
+                fx += f'.{dataloader_idx}'
+
+            meta = _Metadata(
+                fx=fx,
+                name=name,
+                prog_bar=prog_bar,
+                logger=logger,
+                on_step=on_step,
+                on_epoch=on_epoch,
+                enable_graph=enable_graph,
+                dataloader_idx=dataloader_idx,
+                metric_attribute=metric_attribute,
+            )
+            meta.reduce_fx = reduce_fx
+            meta.sync = _Sync(
+                should=sync_dist,
+                fn=sync_dist_fn,
+                group=sync_dist_group,
+                rank_zero_only=rank_zero_only,
+            )
 
-        # register logged value if it doesn't exist
-        if key not in self:
-            self.register_key(key, meta, value)
+            # register logged value if it doesn't exist
+            if key not in self:
+                self.register_key(key, meta, value)
 
-        # check the stored metadata and the current one match
-        elif meta != self[key].meta:
-            raise MisconfigurationException(
-                f'You called `self.log({name}, ...)` twice in `{fx}` with different arguments. This is not allowed'
-            )
+            # check the stored metadata and the current one match
+            elif meta != self[key].meta:
+                raise MisconfigurationException(
+                    f'You called `self.log({name}, ...)` twice in `{fx}` with different arguments. This is not allowed'
+                )
+            self._log_cache[cache_key] = (log_args, key, self[key])
 
         if batch_size is not None:
             self.batch_size = batch_size
 
-        self.update_metrics(key, value)
+        stored = self[key]
+        if isinstance(stored, ResultMetric) and isinstance(value, (torch.Tensor, Metric)):
+            self._update_metric(stored, value)
+        else:
+            self.update_metrics(key, value)
 
     def register_key(self, key: str, meta: _Metadata, value: _METRIC_COLLECTION) -> None:
         """Create one ResultMetric object per value. Value can be provided as a nested collection"""
@@ -489,13 +660,40 @@ class ResultCollection(dict):
         self[key] = value
 
     def update_metrics(self, key: str, value: _METRIC_COLLECTION) -> None:
+        apply_to_collections(self[key], value, ResultMetric, self._update_metric)
 
-        def fn(result_metric, v):
+    def _update_metric(self, result_metric: ResultMetric, value: _METRIC) -> None:
+        value = value.to(self.device)
+        if result_metric.packed_reduction is not None and isinstance(value, torch.Tensor):
+            self._accumulate(result_metric, value)
+        else:
             # performance: avoid calling `__call__` to avoid the checks in `torch.nn.Module._call_impl`
-            result_metric.forward(v.to(self.device), self.batch_size)
-            result_metric.has_reset = False
-
-        apply_to_collections(self[key], value, ResultMetric, fn)
+            result_metric.forward(value, self.batch_size)
+        result_metric.has_reset = False
+
+    def _accumulate(self, result_metric: ResultMetric, value: torch.Tensor) -> None:
+        """Equivalent to ``ResultMetric.update`` for the values accumulated in packed buffers."""
+        accumulator = result_metric._accumulator
+        if accumulator is None:
+            key = (result_metric.packed_reduction, value.device)
+            accumulator = self._accumulators.get(key)
+            if accumulator is None:
+                accumulator = self._accumulators[key] = _PackedAccumulator(*key)
+            accumulator.add(result_metric)
+        value = value.float()
+        result_metric._forward_cache = value
+        result_metric._computed = None
+        result_metric._update_called = True
+        # the value is reduced on the next flush, snapshot it in case the caller modifies it in-place
+        value = value.reshape(()).clone() if value.numel() == 1 else value.mean()
+        accumulator.update(result_metric._slot, value, self.batch_size)
+
+    def _unpack_metrics(self, device: Optional[torch.device] = None) -> None:
+        """Moves the packed states back into the metrics, for the accumulators which are not on ``device``."""
+        for key, accumulator in list(self._accumulators.items()):
+            if device is None or accumulator.device != device:
+                accumulator.unpack()
+                del self._accumulators[key]
 
     @staticmethod
     def _get_cache(result_metric: ResultMetric, on_step: bool) -> Optional[torch.Tensor]:
@@ -514,6 +712,43 @@ class ResultCollection(dict):
             return cache.detach()
         return cache
 
+    def sync_epoch_metrics(self) -> None:
+        """
+        Sync the states of all the pending ``on_epoch`` tensor metrics with one collective per bucket.
+
+        The states are grouped by sync function, reduce operation, process group, dtype and device. Each group is
+        packed into a flat buffer, reduced with a single call to the sync function and unpacked into the computed
+        value of each :class:`~pytorch_lightning.trainer.connectors.logger_connector.result.ResultMetric`.
+        Metrics which can not be bucketed are left untouched and will be synced individually on ``compute``.
+        """
+        if not distributed_available():
+            return
+
+        buckets: Dict[tuple, List[ResultMetric]] = {}
+        for result_metric in self.result_metrics:
+            if (
+                not result_metric.is_tensor or not result_metric.meta.on_epoch or result_metric.has_reset
+                or not result_metric._update_called or result_metric._computed is not None
+                or result_metric.meta.sync.rank_zero_only
+            ):
+                continue
+            sync = result_metric.meta.sync
+            value = result_metric.value
+            key = (sync.fn, sync.op, sync.group, value.dtype, value.device)
+            buckets.setdefault(key, []).append(result_metric)
+
+        for (sync_fn, op, group, *_), result_metrics in buckets.items():
+            states = [state for result_metric in result_metrics for state in result_metric.sync_states]
+            buffer = torch.cat([state.reshape(-1) for state in states])
+            synced = sync_fn(buffer, reduce_op=op, group=group)
+            if not isinstance(synced, torch.Tensor) or synced.shape != buffer.shape:
+                # the reduction is not element-wise (e.g. DP/DDP2 `reduce`). fallback to per-metric syncing
+                continue
+            synced = iter(synced.split([state.numel() for state in states]))
+            for result_metric in result_metrics:
+                synced_states = [next(synced).view_as(state) for state in result_metric.sync_states]
+                result_metric._computed = result_metric._compute_synced(*synced_states)
+
     def valid_items(self) -> Generator:
         """This function is used to iterate over current valid metrics."""
         return ((k, v) for k, v in self.items()
@@ -532,6 +767,10 @@ class ResultCollection(dict):
     def metrics(self, on_step: bool) -> Dict[MetricSource, Dict[str, _METRIC]]:
         metrics = {k: {} for k in MetricSource}
 
+        if not on_step:
+            # performance: sync all the epoch-level metrics with as few collectives as possible
+            self.sync_epoch_metrics()
+
         for _, result_metric in self.valid_items():
 
             # extract forward_cache or computed from the ResultMetric. ignore when the output is None
@@ -563,9 +802,9 @@ class ResultCollection(dict):
                 metrics[MetricSource.CALLBACK][name] = value
                 metrics[MetricSource.CALLBACK][forked_name] = value
 
-            # populate progress_bar metrics. convert tensors to numbers
+            # populate progress_bar metrics. the tensors are converted to numbers all at once when the bar refreshes
             if result_metric.meta.prog_bar:
-                metrics[MetricSource.PBAR][forked_name] = metrics_to_scalars(value)
+                metrics[MetricSource.PBAR][forked_name] = apply_to_collection(value, torch.Tensor, torch.Tensor.detach)
 
         return metrics
 
@@ -596,6 +835,8 @@ class ResultCollection(dict):
 
     def to(self, *args, **kwargs) -> 'ResultCollection':
         """Move all data to the given device."""
+        device = kwargs.get('device')
+        self._unpack_metrics(torch.device(device) if device is not None else None)
 
         def to_(item: Union[torch.Tensor, Metric], *args: Any, **kwargs: Any) -> Union[torch.Tensor, Metric]:
             return item.to(*args, **kwargs)
@@ -618,6 +859,10 @@ class ResultCollection(dict):
 
     def __getstate__(self, drop_value: bool = True) -> dict:
         d = self.__dict__.copy()
+        # the cache references the registered values, it is rebuilt on the next `log` call
+        del d['_log_cache']
+        # the states of the packed metrics are scattered back when they are serialized
+        del d['_accumulators']
 
         # can't deepcopy tensors with grad_fn
         minimize = d['_minimize']
@@ -639,6 +884,8 @@ class ResultCollection(dict):
         sync_fn: Optional[Callable] = None,
     ) -> None:
         self.__dict__.update({k: v for k, v in state.items() if k != 'items'})
+        self._log_cache = {}
+        self._accumulators = {}
 
         def setstate(k: str, item: dict) -> Union[ResultMetric, ResultMetricCollection]:
             if not isinstance(item, dict):
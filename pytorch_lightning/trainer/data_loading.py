@@ -14,12 +14,13 @@
 import inspect
 import multiprocessing
 import os
+import uuid
 from abc import ABC
 from copy import deepcopy
 from functools import partial
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
-from torch.utils.data import BatchSampler, DataLoader, RandomSampler, SequentialSampler
+from torch.utils.data import BatchSampler, DataLoader, Dataset, RandomSampler, SequentialSampler
 from torch.utils.data.distributed import DistributedSampler
 
 import pytorch_lightning as pl
@@ -30,7 +31,14 @@ from pytorch_lightning.trainer.states import RunningStage
 from pytorch_lightning.trainer.supporters import CombinedLoader
 from pytorch_lightning.utilities import _TORCH_GREATER_EQUAL_1_6, rank_zero_warn
 from pytorch_lightning.utilities.apply_func import apply_to_collection
-from pytorch_lightning.utilities.data import has_iterable_dataset, has_len
+from pytorch_lightning.utilities.data import (
+    _BatchedFetchDataset,
+    _BatchedFetchSampler,
+    has_batched_fetching,
+    has_iterable_dataset,
+    has_len,
+)
+from pytorch_lightning.utilities.dataset_cache import CachedDataset
 from pytorch_lightning.utilities.debugging import InternalDebugger
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.model_helpers import is_overridden
@@ -142,14 +150,38 @@ class TrainerDataLoadingMixin(ABC):
             sampler = self._get_distributed_sampler(dataloader, shuffle, mode=mode)
             dataloader = self.replace_sampler(dataloader, sampler, mode=mode)
 
+        elif has_batched_fetching(dataloader):
+            # fetch the batches with `lightning_getitems`
+            dataloader = self.replace_sampler(dataloader, dataloader.batch_sampler.sampler, mode=mode)
+
         return dataloader
 
     @staticmethod
     def _resolve_batch_sampler(dl_args, dataloader, sampler, mode: Optional[RunningStage] = None) -> Dict[str, Any]:
         batch_sampler = getattr(dataloader, "batch_sampler")
         is_predicting = mode == RunningStage.PREDICTING
+        if has_batched_fetching(dataloader):
+            # the sampler yields the indices of a batch, which are passed to the `lightning_getitems` method of the
+            # dataset in a single call. the batches aren't collated, only converted to tensors
+            batch_sampler = type(batch_sampler)(
+                sampler,
+                batch_size=batch_sampler.batch_size,
+                drop_last=(False if is_predicting else batch_sampler.drop_last),
+            )
+            if is_predicting:
+                batch_sampler = IndexBatchSamplerWrapper(batch_sampler)
+            else:
+                # forwards `set_epoch` to the sampler, e.g. the `DistributedSampler`
+                batch_sampler = _BatchedFetchSampler(batch_sampler)
+            dl_args['dataset'] = _BatchedFetchDataset(dataloader.dataset)
+            dl_args['sampler'] = batch_sampler
+            dl_args['batch_sampler'] = None
+            dl_args['batch_size'] = None
+            dl_args['shuffle'] = False
+            dl_args['drop_last'] = False
+            dl_args['collate_fn'] = None
         # checking the batch sampler type is different than PyTorch default.
-        if (batch_sampler is not None and type(batch_sampler) is not BatchSampler) or is_predicting:
+        elif (batch_sampler is not None and type(batch_sampler) is not BatchSampler) or is_predicting:
             batch_sampler = type(batch_sampler)(
                 sampler,
                 batch_size=batch_sampler.batch_size,
@@ -169,7 +201,13 @@ class TrainerDataLoadingMixin(ABC):
 
         return dl_args
 
-    def replace_sampler(self, dataloader: DataLoader, sampler, mode: Optional[RunningStage] = None) -> DataLoader:
+    def replace_sampler(
+        self,
+        dataloader: DataLoader,
+        sampler,
+        mode: Optional[RunningStage] = None,
+        dataloader_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> DataLoader:
         skip_keys = ('sampler', 'batch_sampler', 'dataset_kind')
         skip_signature_keys = ('args', 'kwargs', 'self')
 
@@ -185,6 +223,8 @@ class TrainerDataLoadingMixin(ABC):
         dl_args = {name: attrs[name] for name in params if name in attrs and name not in skip_keys}
 
         dl_args = self._resolve_batch_sampler(dl_args, dataloader, sampler, mode=mode)
+        if dataloader_kwargs:
+            dl_args.update(dataloader_kwargs)
 
         multiprocessing_context = dataloader.multiprocessing_context
         dl_args['multiprocessing_context'] = multiprocessing_context
@@ -215,6 +255,54 @@ class TrainerDataLoadingMixin(ABC):
         dataloader.multiprocessing_context = multiprocessing_context
         return dataloader
 
+    def _apply_dataloader_kwargs(self, dataloader: DataLoader, dataloader_kwargs: Dict[str, Any]) -> DataLoader:
+        """Rebuilds the dataloader with ``dataloader_kwargs`` overriding its arguments, keeping its sampler."""
+        if has_iterable_dataset(dataloader):
+            return dataloader
+        sampler = dataloader.sampler
+        batch_sampler = dataloader.batch_sampler
+        if batch_sampler is not None and type(batch_sampler) is not BatchSampler:
+            sampler = batch_sampler.sampler
+        return self.replace_sampler(dataloader, sampler, dataloader_kwargs=dataloader_kwargs)
+
+    def _add_dataset_cache(self, dataloader: DataLoader, previous_caches: Dict[int, CachedDataset]) -> DataLoader:
+        """Rebuilds the dataloader with its dataset wrapped into a node-local
+        :class:`~pytorch_lightning.utilities.dataset_cache.CachedDataset`.
+
+        A reloaded dataloader at the same position reuses the previous cache when it returns the same dataset, or a
+        dataset of the same length with the same ``lightning_cache_key`` attribute. Otherwise, the samples might
+        differ and a new cache is created.
+        """
+        dataset = dataloader.dataset
+        if has_iterable_dataset(dataloader) or isinstance(dataset, CachedDataset) or not has_len(dataset):
+            return dataloader
+        if isinstance(dataset, _BatchedFetchDataset):
+            # the batches are already fetched in a single call
+            return dataloader
+        caches = self.data_connector._dataset_caches
+        position = len(caches)
+        cache = previous_caches.get(position)
+        if cache is not None and self._has_same_samples(cache.dataset, dataset):
+            del previous_caches[position]
+            # don't keep the previous dataset alive
+            cache.dataset = dataset
+        else:
+            # all the ranks of a node share the arena, which is removed by the local rank 0
+            name = self.training_type_plugin.broadcast(uuid.uuid4().hex)
+            cache = CachedDataset(dataset, name, self.dataset_cache_bytes, owner=self.local_rank == 0)
+        caches[position] = cache
+        return self._apply_dataloader_kwargs(dataloader, {'dataset': cache})
+
+    @staticmethod
+    def _has_same_samples(previous_dataset: Dataset, dataset: Dataset) -> bool:
+        if previous_dataset is dataset:
+            return True
+        cache_key = getattr(dataset, 'lightning_cache_key', None)
+        return (
+            cache_key is not None and cache_key == getattr(previous_dataset, 'lightning_cache_key', None)
+            and len(previous_dataset) == len(dataset)
+        )
+
     def _get_distributed_sampler(
         self, dataloader: DataLoader, shuffle: bool, mode: Optional[RunningStage] = None
     ) -> DistributedSampler:
@@ -253,6 +341,26 @@ class TrainerDataLoadingMixin(ABC):
             self.train_dataloader, DataLoader, self.auto_add_sampler, shuffle=True
         )
 
+        # cache the samples of the datasets
+        if self.dataset_cache_bytes:
+            previous_caches = self.data_connector._dataset_caches
+            self.data_connector._dataset_caches = {}
+            self.train_dataloader = apply_to_collection(
+                self.train_dataloader, DataLoader, self._add_dataset_cache, previous_caches
+            )
+            # the caches of the datasets which aren't used anymore
+            for cache in previous_caches.values():
+                cache.close()
+
+        # apply the settings found by the dataloader tuner
+        if self.data_connector.train_dataloader_kwargs:
+            self.train_dataloader = apply_to_collection(
+                self.train_dataloader,
+                DataLoader,
+                self._apply_dataloader_kwargs,
+                self.data_connector.train_dataloader_kwargs,
+            )
+
         # check the workers recursively
         apply_to_collection(self.train_dataloader, DataLoader, self._worker_check, 'train dataloader')
 
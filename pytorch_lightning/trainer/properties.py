@@ -27,7 +27,7 @@ from pytorch_lightning.callbacks import EarlyStopping, ModelCheckpoint, Progress
 from pytorch_lightning.callbacks.base import Callback
 from pytorch_lightning.callbacks.prediction_writer import BasePredictionWriter
 from pytorch_lightning.core.optimizer import LightningOptimizer
-from pytorch_lightning.loggers import LightningLoggerBase
+from pytorch_lightning.loggers import AsyncLogger, LightningLoggerBase
 from pytorch_lightning.loggers.tensorboard import TensorBoardLogger
 from pytorch_lightning.loops import PredictionLoop
 from pytorch_lightning.loops.dataloader.evaluation_loop import EvaluationLoop
@@ -227,7 +227,8 @@ class TrainerProperties(ABC):
         if self.logger is None:
             dirpath = self.default_root_dir
         else:
-            dirpath = getattr(self.logger, 'log_dir' if isinstance(self.logger, TensorBoardLogger) else 'save_dir')
+            logger = self.logger.logger if isinstance(self.logger, AsyncLogger) else self.logger
+            dirpath = getattr(logger, 'log_dir' if isinstance(logger, TensorBoardLogger) else 'save_dir')
 
         dirpath = self.accelerator.broadcast(dirpath)
         return dirpath
@@ -284,7 +285,11 @@ class TrainerProperties(ABC):
 
         standard_metrics = ref_model.get_progress_bar_dict()
         pbar_metrics = self.progress_bar_metrics
-        duplicates = list(standard_metrics.keys() & pbar_metrics.keys())
+        # performance: only check the names which haven't been seen before
+        checked = self.logger_connector._progress_bar_keys_checked
+        new_keys = pbar_metrics.keys() - checked
+        checked.update(new_keys)
+        duplicates = list(standard_metrics.keys() & new_keys)
         if duplicates:
             rank_zero_warn(
                 f"The progress bar already tracks a metric with the name(s) '{', '.join(duplicates)}' and"
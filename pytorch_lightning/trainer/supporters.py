@@ -13,9 +13,13 @@
 # limitations under the License.
 
 import os
+import queue
+import threading
+import time
 from collections.abc import Iterable, Iterator, Mapping, Sequence
-from typing import Any, Callable, Generator, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Generator, List, Optional, Set, Tuple, Union
 
+import numpy as np
 import torch
 from torch import Tensor
 from torch.utils.data import Dataset
@@ -32,6 +36,16 @@ class TensorRunningAccum(object):
     """Tracks a running accumulation values (min, max, mean) without graph
     references.
 
+    The values are stored on the device of the appended tensors, and the running sum is updated with every new
+    value so that :meth:`mean` doesn't need to reduce the whole window. Nothing is copied to the host until the
+    caller converts a result to a Python number. The non-finite values are counted instead of being added to the
+    running sum, so that a ``nan`` or ``inf`` value only affects :meth:`mean` while it is in the window.
+
+    Args:
+        window_length: The number of most recent values to keep.
+        ema_decay: If set, :meth:`mean` returns the exponential moving average of all the appended values with this
+            decay instead of the mean of the window.
+
     Examples:
         >>> accum = TensorRunningAccum(5)
         >>> accum.last(), accum.mean()
@@ -46,18 +60,29 @@ class TensorRunningAccum(object):
         >>> _= [accum.append(torch.tensor(i)) for i in range(13)]
         >>> accum.last(), accum.mean(), accum.min(), accum.max()
         (tensor(12.), tensor(10.), tensor(8.), tensor(12.))
+        >>> accum = TensorRunningAccum(5, ema_decay=0.5)
+        >>> _= [accum.append(torch.tensor(i)) for i in range(3)]
+        >>> accum.mean()
+        tensor(1.2500)
     """
 
-    def __init__(self, window_length: int):
+    def __init__(self, window_length: int, ema_decay: Optional[float] = None):
+        if ema_decay is not None and not 0 <= ema_decay < 1:
+            raise MisconfigurationException(f"`ema_decay` should be in the range [0, 1), got {ema_decay}.")
         self.window_length = window_length
+        self.ema_decay = ema_decay
         self.memory = None
         self.current_idx: int = 0
         self.last_idx: Optional[int] = None
         self.rotated: bool = False
+        self._sum: Optional[Tensor] = None
+        # the number of `nan`, `inf` and `-inf` values in the window
+        self._nonfinite: Optional[Tensor] = None
+        self._ema: Optional[Tensor] = None
 
     def reset(self) -> None:
         """Empty the accumulator."""
-        self.__init__(self.window_length)
+        self.__init__(self.window_length, ema_decay=self.ema_decay)
 
     def last(self):
         """Get the last added element."""
@@ -67,7 +92,10 @@ class TensorRunningAccum(object):
     def append(self, x):
         """Add an element to the accumulator."""
         if self.memory is None:
-            self.memory = torch.zeros(self.window_length, *x.shape)
+            # keep the values on the device they come from to avoid a synchronization on every step
+            self.memory = torch.zeros(self.window_length, *x.shape, device=x.device)
+            self._sum = torch.zeros(x.shape, device=x.device)
+            self._nonfinite = torch.zeros(3, *x.shape, dtype=torch.long, device=x.device)
 
         # ensure same device and type
         if self.memory.device != x.device or self.memory.type() != x.type():
@@ -75,8 +103,17 @@ class TensorRunningAccum(object):
 
         # store without grads
         with torch.no_grad():
+            # the slot is zero until the window has been filled once
+            evicted = self.memory[self.current_idx]
+            self._sum += self._finite(x) - self._finite(evicted)
+            self._nonfinite += self._count_nonfinite(x) - self._count_nonfinite(evicted)
             self.memory[self.current_idx] = x
             self.last_idx = self.current_idx
+            if self.ema_decay is not None:
+                if self._ema is None:
+                    self._ema = x.clone()
+                else:
+                    self._ema.mul_(self.ema_decay).add_(x, alpha=1 - self.ema_decay)
 
         # increase index
         self.current_idx += 1
@@ -85,10 +122,32 @@ class TensorRunningAccum(object):
         self.current_idx = self.current_idx % self.window_length
         if self.current_idx == 0:
             self.rotated = True
+            # recompute the sum once per window so that floating point errors don't accumulate
+            self._sum = self._finite(self.memory).sum(0)
+
+    @staticmethod
+    def _finite(x: Tensor) -> Tensor:
+        return torch.where(torch.isfinite(x), x, torch.zeros_like(x))
+
+    @staticmethod
+    def _count_nonfinite(x: Tensor) -> Tensor:
+        return torch.stack([torch.isnan(x), x == float('inf'), x == float('-inf')]).long()
 
     def mean(self):
-        """Get mean value from stored elements."""
-        return self._agg_memory('mean')
+        """Get mean value from stored elements, or their exponential moving average if ``ema_decay`` is set."""
+        if self.last_idx is None:
+            return None
+        if self.ema_decay is not None:
+            return self._ema.mean()
+        length = self.window_length if self.rotated else self.current_idx
+        total = self._sum
+        # the sum of a window with non-finite values only depends on which of them it holds, selected on the device
+        has_nan, has_inf, has_neg_inf = self._nonfinite > 0
+        inf = torch.full_like(total, float('inf'))
+        total = torch.where(has_inf, inf, total)
+        total = torch.where(has_neg_inf, -inf, total)
+        total = torch.where(has_nan | (has_inf & has_neg_inf), torch.full_like(total, float('nan')), total)
+        return (total / length).mean()
 
     def max(self):
         """Get maximal value from stored elements."""
@@ -106,64 +165,139 @@ class TensorRunningAccum(object):
 
 
 class PredictionCollection(object):
+    """
+    Stores the predictions written with :meth:`~pytorch_lightning.core.lightning.LightningModule.write_prediction`.
+
+    The values of each feature are kept as a list of per-batch chunks and concatenated once when written. By default,
+    a file is saved with ``torch.save`` as a list with one dictionary per row. With ``columnar=True``, it is saved as a
+    directory with one file per feature instead: a ``.npy`` array for the tensor features, which can be memory-mapped
+    when loaded, and a ``.pt`` file for the others. Use :meth:`load` to read either format.
+    """
 
     def __init__(self, global_rank: int, world_size: int):
         self.global_rank = global_rank
         self.world_size = world_size
-        self.predictions = {}
+        self.predictions: Dict[str, Dict[str, list]] = {}
         self.num_predictions = 0
+        self._columnar_filenames: Set[str] = set()
 
-    def _add_prediction(self, name, values, filename):
-        if filename not in self.predictions:
-            self.predictions[filename] = {name: values}
-        elif name not in self.predictions[filename]:
-            self.predictions[filename][name] = values
-        elif isinstance(values, Tensor):
-            self.predictions[filename][name] = torch.cat((self.predictions[filename][name], values))
-        elif isinstance(values, list):
-            self.predictions[filename][name].extend(values)
+    def _add_prediction(self, name, values, filename, columnar: bool = False):
+        if columnar:
+            self._columnar_filenames.add(filename)
+        # performance: the chunks are concatenated once in `to_disk`
+        chunks = self.predictions.setdefault(filename, {}).get(name)
+        if chunks is None:
+            self.predictions[filename][name] = [values]
+        elif isinstance(values, (Tensor, list)):
+            chunks.append(values)
 
-    def add(self, predictions):
+    def add(self, predictions, columnar: bool = False):
 
         if predictions is None:
             return
 
         for filename, pred_dict in predictions.items():
             for feature_name, values in pred_dict.items():
-                self._add_prediction(feature_name, values, filename)
+                self._add_prediction(feature_name, values, filename, columnar=columnar)
+
+    @staticmethod
+    def _concatenate(chunks: List[Union[Tensor, list]]) -> Union[Tensor, list]:
+        if len(chunks) == 1:
+            return chunks[0]
+        if all(isinstance(chunk, Tensor) for chunk in chunks):
+            return torch.cat(chunks)
+        return [v for chunk in chunks for v in (chunk.tolist() if isinstance(chunk, Tensor) else chunk)]
 
     def to_disk(self) -> None:
         """Write predictions to file(s).
         """
         for filepath, predictions in self.predictions.items():
+            columnar = filepath in self._columnar_filenames
             fs = get_filesystem(filepath)
             # normalize local filepaths only
             if fs.protocol == "file":
                 filepath = os.path.realpath(filepath)
+            stem, extension = os.path.splitext(filepath)
             if self.world_size > 1:
-                stem, extension = os.path.splitext(filepath)
                 filepath = f"{stem}_rank_{self.global_rank}{extension}"
             dirpath = os.path.split(filepath)[0]
             fs.mkdirs(dirpath, exist_ok=True)
 
-            # Convert any tensor values to list
-            predictions = {k: v if not isinstance(v, Tensor) else v.tolist() for k, v in predictions.items()}
+            predictions = {k: self._concatenate(chunks) for k, chunks in predictions.items()}
 
             # Check if all features for this file add up to same length
             feature_lens = {k: len(v) for k, v in predictions.items()}
             if len(set(feature_lens.values())) != 1:
                 raise ValueError("Mismatching feature column lengths found in stored EvalResult predictions.")
 
+            if columnar:
+                self._write_columns(fs, filepath, predictions)
+                continue
+
+            # Convert any tensor values to list
+            predictions = {k: v if not isinstance(v, Tensor) else v.tolist() for k, v in predictions.items()}
+
             # Switch predictions so each entry has its own dict
-            outputs = []
-            for values in zip(*predictions.values()):
-                output_element = dict(zip(predictions.keys(), values))
-                outputs.append(output_element)
+            keys = list(predictions.keys())
+            outputs = [dict(zip(keys, values)) for values in zip(*predictions.values())]
 
             # Write predictions for current file to disk
             with fs.open(filepath, "wb") as fp:
                 torch.save(outputs, fp)
 
+    @staticmethod
+    def _write_columns(fs, dirpath: str, predictions: Dict[str, Union[Tensor, list]]) -> None:
+        fs.mkdirs(dirpath, exist_ok=True)
+        for name, values in predictions.items():
+            if isinstance(values, Tensor):
+                values = values.detach().cpu()
+                try:
+                    array = values.numpy()
+                except TypeError:
+                    # dtypes which numpy doesn't support, e.g. `bfloat16`
+                    array = None
+                if array is not None:
+                    with fs.open(os.path.join(dirpath, f"{name}.npy"), "wb") as fp:
+                        np.save(fp, array)
+                    continue
+            with fs.open(os.path.join(dirpath, f"{name}.pt"), "wb") as fp:
+                torch.save(values, fp)
+
+    @staticmethod
+    def load(path: str, rows: bool = False, mmap: bool = True) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Load the predictions written by :meth:`to_disk`.
+
+        Args:
+            path: The file or the directory of one rank.
+            rows: Whether to return a list with one dictionary per row, as saved in the files, instead of a dictionary
+                of columns. The files are always loaded as rows.
+            mmap: Whether to memory-map the local ``.npy`` arrays instead of reading them in memory.
+
+        Return:
+            The predictions as a dictionary mapping each feature to its values, or as a list of rows.
+        """
+        fs = get_filesystem(path)
+        if not fs.isdir(path):
+            with fs.open(path, "rb") as fp:
+                return torch.load(fp)
+
+        columns = {}
+        for filepath in sorted(fs.ls(path, detail=False)):
+            name, extension = os.path.splitext(os.path.basename(filepath))
+            if extension == ".npy" and mmap and fs.protocol == "file":
+                columns[name] = np.load(filepath, mmap_mode="r")
+            elif extension == ".npy":
+                with fs.open(filepath, "rb") as fp:
+                    columns[name] = np.load(fp)
+            elif extension == ".pt":
+                with fs.open(filepath, "rb") as fp:
+                    columns[name] = torch.load(fp)
+        if not rows:
+            return columns
+        columns = {k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in columns.items()}
+        return [dict(zip(columns.keys(), values)) for values in zip(*columns.values())]
+
 
 class CycleIterator(object):
     """
@@ -534,3 +668,135 @@ def prefetch_iterator(iterable: Iterable) -> Generator[Tuple[Any, bool], None, N
         last = val
     # yield last, no longer has next
     yield last, True
+
+
+# marks the end of the batches produced by the prefetch worker
+_PREFETCH_DONE = object()
+
+
+class DevicePrefetcher(object):
+    """
+    Iterates over ``iterable`` while a background thread fetches the next batches and moves them to the device.
+
+    Up to ``depth`` batches are kept ready ahead of the consumer. On CUDA devices, the batches are pinned and copied
+    with ``non_blocking=True`` on a side stream, so the consumer receives batches which are already on the device.
+    On other devices, the thread overlaps the fetching of the batches with the computation.
+
+    Args:
+        iterable: The iterable producing the batches, e.g. a :class:`~torch.utils.data.DataLoader`.
+        to_device: The function moving a batch to ``device``.
+        device: The device the batches are moved to.
+        depth: The maximum number of batches fetched ahead.
+
+    Attributes:
+        wait_time: The total time in seconds the consumer waited for the batches.
+    """
+
+    def __init__(
+        self,
+        iterable: Iterable,
+        to_device: Callable[[Any], Any],
+        device: Union[str, torch.device],
+        depth: int = 1,
+    ) -> None:
+        if depth < 1:
+            raise MisconfigurationException(f"`depth` should be a positive integer, got {depth}.")
+        self.iterable = iterable
+        self.to_device = to_device
+        self.device = torch.device(device)
+        self.depth = depth
+        self.wait_time = 0.0
+        self._queue: Optional[queue.Queue] = None
+        self._stop_event: Optional[threading.Event] = None
+
+    def __iter__(self) -> 'DevicePrefetcher':
+        self.close()
+        self._queue = queue.Queue(maxsize=self.depth)
+        self._stop_event = threading.Event()
+        stream = torch.cuda.Stream(self.device) if self.device.type == "cuda" else None
+        # the thread holds no reference to `self`, so the prefetcher gets closed once it is garbage collected
+        thread = threading.Thread(
+            target=_prefetch_worker,
+            args=(iter(self.iterable), self.to_device, self.device, stream, self._queue, self._stop_event),
+            daemon=True,
+        )
+        thread.start()
+        return self
+
+    def __next__(self) -> Any:
+        if self._queue is None:
+            raise StopIteration
+        start = time.monotonic()
+        batch, event, error = self._queue.get()
+        self.wait_time += time.monotonic() - start
+
+        if error is not None:
+            self.close()
+            raise error
+        if batch is _PREFETCH_DONE:
+            self.close()
+            raise StopIteration
+        if event is not None:
+            stream = torch.cuda.current_stream(self.device)
+            stream.wait_event(event)
+            # the memory of the batch was allocated on the side stream, don't let it get reused too early
+            apply_to_collection(batch, Tensor, _record_stream, stream)
+        return batch
+
+    def close(self) -> None:
+        """Stops the background thread. The batches fetched ahead are dropped."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+        self._queue = None
+        self._stop_event = None
+
+    def __del__(self) -> None:
+        self.close()
+
+
+def _prefetch_worker(
+    iterator: Iterator,
+    to_device: Callable[[Any], Any],
+    device: torch.device,
+    stream: Optional['torch.cuda.Stream'],
+    out_queue: queue.Queue,
+    stop_event: threading.Event,
+) -> None:
+
+    def put(batch: Any, event: Optional['torch.cuda.Event'] = None, error: Optional[BaseException] = None) -> bool:
+        while not stop_event.is_set():
+            try:
+                out_queue.put((batch, event, error), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        if stream is not None:
+            torch.cuda.set_device(device)
+        for batch in iterator:
+            event = None
+            if stream is None:
+                batch = to_device(batch)
+            else:
+                batch = apply_to_collection(batch, Tensor, _pin_memory)
+                with torch.cuda.stream(stream):
+                    batch = to_device(batch)
+                    event = stream.record_event()
+            if not put(batch, event):
+                return
+    except BaseException as error:
+        put(None, error=error)
+        return
+    put(_PREFETCH_DONE)
+
+
+def _pin_memory(tensor: Tensor) -> Tensor:
+    return tensor.pin_memory() if tensor.device.type == "cpu" and not tensor.is_pinned() else tensor
+
+
+def _record_stream(tensor: Tensor, stream: 'torch.cuda.Stream') -> Tensor:
+    if tensor.is_cuda:
+        tensor.record_stream(stream)
+    return tensor
@@ -17,7 +17,7 @@ import traceback
 import warnings
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 from weakref import proxy
 
 import torch
@@ -159,7 +159,9 @@ class Trainer(
         distributed_backend: Optional[str] = None,
         move_metrics_to_cpu: bool = False,
         multiple_trainloader_mode: str = 'max_size_cycle',
-        stochastic_weight_avg: bool = False
+        stochastic_weight_avg: bool = False,
+        prefetch_batches: int = 0,
+        dataset_cache_bytes: int = 0,
     ):
         r"""
         Customize every aspect of training via flags
@@ -184,7 +186,8 @@ class Trainer(
                 finder trying to find the largest batch size that fits into memory.
                 The result will be stored in self.batch_size in the LightningModule.
                 Additionally, can be set to either `power` that estimates the batch size through
-                a power search or `binsearch` that estimates the batch size through a binary search.
+                a power search, `binsearch` that estimates the batch size through a binary search or
+                `throughput` that selects the batch size with the best throughput which fits into memory.
 
             auto_select_gpus: If enabled and `gpus` is an integer, pick available
                 gpus automatically. This is especially useful when
@@ -320,6 +323,8 @@ class Trainer(
 
             move_metrics_to_cpu: Whether to force internal logged metrics to be moved to cpu.
                 This can save some gpu memory, but can make training slower. Use with attention.
+                The evaluation step outputs kept for the ``*_epoch_end`` hooks are copied to pinned CPU memory
+                asynchronously, and the hooks receive CPU tensors.
 
             multiple_trainloader_mode: How to loop over the datasets when there are multiple train loaders.
                 In 'max_size_cycle' mode, the trainer ends one epoch when the largest dataset is traversed,
@@ -329,6 +334,17 @@ class Trainer(
             stochastic_weight_avg: Whether to use `Stochastic Weight Averaging (SWA)
                 <https://pytorch.org/blog/pytorch-1.6-now-includes-stochastic-weight-averaging/>_`
 
+            prefetch_batches: How many batches to fetch and move to the device ahead of the loops in a background
+                thread. On GPUs, the copies run on a side CUDA stream. ``0`` disables prefetching.
+                Note that the batch transfer hooks of the LightningModule then run in the background thread.
+
+            dataset_cache_bytes: The size in bytes of a memory-mapped cache of the samples of the training dataset,
+                shared by the processes of a node. See
+                :class:`~pytorch_lightning.utilities.dataset_cache.CachedDataset`.
+                The samples are loaded from the dataset during the first epoch only, as long as they fit.
+                A reloaded dataloader keeps the cache if it returns the same dataset, or a dataset with the same
+                length and ``lightning_cache_key`` attribute. ``0`` disables the cache.
+
         """
         super().__init__()
         Trainer._log_api_event("init")
@@ -385,6 +401,8 @@ class Trainer(
             max_time,
         )
 
+        self._reset_hook_dispatch_table()
+
         # hook
         self.on_init_start()
 
@@ -394,7 +412,7 @@ class Trainer(
         # init data flags
         self.data_connector.on_trainer_init(
             check_val_every_n_epoch, reload_dataloaders_every_n_epochs, reload_dataloaders_every_epoch,
-            prepare_data_per_node
+            prepare_data_per_node, prefetch_batches, dataset_cache_bytes
         )
 
         # init training tricks
@@ -754,7 +772,8 @@ class Trainer(
         scale_batch_size_kwargs: Optional[Dict[str, Any]] = None,
         lr_find_kwargs: Optional[Dict[str, Any]] = None,
         train_dataloader=None,  # noqa TODO: remove with 1.6
-    ) -> Dict[str, Optional[Union[int, _LRFinder]]]:
+        tune_dataloader_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Optional[Union[int, _LRFinder, Dict[str, Any]]]]:
         r"""
         Runs routines to tune hyperparameters before training.
 
@@ -772,6 +791,8 @@ class Trainer(
             scale_batch_size_kwargs: Arguments for :func:`~pytorch_lightning.tuner.batch_size_scaling.scale_batch_size`
 
             lr_find_kwargs: Arguments for :func:`~pytorch_lightning.tuner.lr_finder.lr_find`
+
+            tune_dataloader_kwargs: Arguments for :func:`~pytorch_lightning.tuner.dataloader_tuning.tune_dataloader`
         """
         Trainer._log_api_event("tune")
 
@@ -800,7 +821,12 @@ class Trainer(
             model, train_dataloaders=train_dataloaders, val_dataloaders=val_dataloaders, datamodule=datamodule
         )
 
-        result = self.tuner._tune(model, scale_batch_size_kwargs=scale_batch_size_kwargs, lr_find_kwargs=lr_find_kwargs)
+        result = self.tuner._tune(
+            model,
+            scale_batch_size_kwargs=scale_batch_size_kwargs,
+            lr_find_kwargs=lr_find_kwargs,
+            tune_dataloader_kwargs=tune_dataloader_kwargs,
+        )
 
         assert self.state.stopped
         self.tuning = False
@@ -820,12 +846,16 @@ class Trainer(
         # hook
         self.data_connector.prepare_data(model)
         self.callback_connector._attach_model_callbacks(model, self)
+        self._reset_hook_dispatch_table()
+        self.logger_connector.reset_progress_bar_keys_checked()
 
         # ----------------------------
         # SET UP TRAINING
         # ----------------------------
         self.call_hook("on_before_accelerator_backend_setup", model)
         self.accelerator.connect(model)
+        # the hooks are now dispatched to the connected model
+        self._reset_hook_dispatch_table()
         self.accelerator.setup_environment()
         self._call_setup_hook(model)  # allow user to setup lightning_module in accelerator environment
 
@@ -1005,6 +1035,8 @@ class Trainer(
 
         try:
             self.fit_loop.run()
+            # the checkpoints need to be written before the processes can be torn down
+            self.checkpoint_connector.wait_for_checkpoint_writes()
         except KeyboardInterrupt:
             rank_zero_warn('Detected KeyboardInterrupt, attempting graceful shutdown...')
             # user could press Ctrl+c many times... only shutdown once
@@ -1013,6 +1045,7 @@ class Trainer(
                 self.on_keyboard_interrupt()
                 # same treatment as below
                 self.accelerator.on_train_end()
+                self.checkpoint_connector.wait_for_checkpoint_writes()
         except BaseException:
             self.state.status = TrainerStatus.INTERRUPTED
             if distributed_available() and self.world_size > 1:
@@ -1020,6 +1053,11 @@ class Trainer(
                 self.training_type_plugin.reconciliate_processes(traceback.format_exc())
             # give accelerators a chance to finish
             self.accelerator.on_train_end()
+            # finish writing the checkpoints saved before the failure without hiding the original error
+            try:
+                self.checkpoint_connector.wait_for_checkpoint_writes()
+            except Exception:
+                log.exception("Failed to write a checkpoint in the background")
             # reset bookkeeping
             self.state.stage = None
             raise
@@ -1144,6 +1182,9 @@ class Trainer(
     def _call_teardown_hook(self, model: 'pl.LightningModule') -> None:
         fn = self.state.fn._setup_fn
 
+        self.checkpoint_connector.wait_for_checkpoint_writes()
+        self.logger_connector.wait_for_logger()
+
         if self.datamodule is not None:
             self.datamodule.teardown(stage=fn)
         self.profiler.teardown(stage=fn)
@@ -1155,6 +1196,30 @@ class Trainer(
         # these could have become stale if metrics are defined in `setup`
         model._metric_attributes = None
 
+    def _reset_hook_dispatch_table(self) -> None:
+        """Clears the hook implementations resolved by :meth:`call_hook`. Needs to be called whenever the callbacks
+        or the model change."""
+        self._hook_dispatch_table: Dict[str, Tuple[Optional[Callable], Optional[Callable], Optional[Callable]]] = {}
+        self._callback_hooks: Dict[str, List[Callback]] = {}
+
+    def _hook_dispatch(self, hook_name: str) -> Tuple[Optional[Callable], Optional[Callable], Optional[Callable]]:
+        """Resolves the trainer, model and accelerator implementations of ``hook_name``, ``None`` when there is
+        nothing to call."""
+        dispatch = self._hook_dispatch_table.get(hook_name)
+        if dispatch is None:
+            trainer_hook = getattr(self, hook_name, None)
+            # the trainer callback hooks only forward the call to the callbacks
+            if (
+                getattr(trainer_hook, "__func__", None) is getattr(TrainerCallbackHookMixin, hook_name, None)
+                and not self._callbacks_with_hook(hook_name)
+            ):
+                trainer_hook = None
+            model_ref = self.lightning_module
+            model_hook = getattr(model_ref, hook_name) if is_overridden(hook_name, model_ref) else None
+            accelerator_hook = getattr(self.accelerator, hook_name, None)
+            dispatch = self._hook_dispatch_table[hook_name] = (trainer_hook, model_hook, accelerator_hook)
+        return dispatch
+
     def call_hook(self, hook_name: str, *args, **kwargs) -> Any:
         # Note this implementation is copy/pasted into the TrainLoop class in TrainingEpochLoop._on_train_epoch_end_hook
         # This was done to manage the deprecation of the `outputs` argument to on_train_epoch_end
@@ -1164,29 +1229,14 @@ class Trainer(
             prev_fx_name = self.lightning_module._current_fx_name
             self.lightning_module._current_fx_name = hook_name
 
-        # always profile hooks
-        with self.profiler.profile(hook_name):
+        trainer_hook, model_hook, accelerator_hook = self._hook_dispatch(hook_name)
 
-            # first call trainer hook
-            if hasattr(self, hook_name):
-                trainer_hook = getattr(self, hook_name)
-                trainer_hook(*args, **kwargs)
-
-            # next call hook in lightningModule
-            output = None
-            model_ref = self.lightning_module
-            if is_overridden(hook_name, model_ref):
-                hook_fx = getattr(model_ref, hook_name)
-                output = hook_fx(*args, **kwargs)
-
-            # call the accelerator hook
-            if hasattr(self.accelerator, hook_name):
-                accelerator_hook = getattr(self.accelerator, hook_name)
-                accelerator_output = accelerator_hook(*args, **kwargs)
-                # Rely on the accelerator output if lightningModule hook returns nothing
-                # Required for cases such as DataParallel where we reduce the output for the user
-                # todo: move this data parallel logic into the data parallel plugin
-                output = accelerator_output if output is None else output
+        # profile hooks unless profiling is disabled
+        if isinstance(self.profiler, PassThroughProfiler):
+            output = self._call_hook_implementations(trainer_hook, model_hook, accelerator_hook, *args, **kwargs)
+        else:
+            with self.profiler.profile(hook_name):
+                output = self._call_hook_implementations(trainer_hook, model_hook, accelerator_hook, *args, **kwargs)
 
         if self.lightning_module:
             # restore current_fx when nested context
@@ -1194,6 +1244,30 @@ class Trainer(
 
         return output
 
+    @staticmethod
+    def _call_hook_implementations(
+        trainer_hook: Optional[Callable], model_hook: Optional[Callable], accelerator_hook: Optional[Callable], *args,
+        **kwargs
+    ) -> Any:
+        # first call trainer hook
+        if trainer_hook is not None:
+            trainer_hook(*args, **kwargs)
+
+        # next call hook in lightningModule
+        output = None
+        if model_hook is not None:
+            output = model_hook(*args, **kwargs)
+
+        # call the accelerator hook
+        if accelerator_hook is not None:
+            accelerator_output = accelerator_hook(*args, **kwargs)
+            # Rely on the accelerator output if lightningModule hook returns nothing
+            # Required for cases such as DataParallel where we reduce the output for the user
+            # todo: move this data parallel logic into the data parallel plugin
+            output = accelerator_output if output is None else output
+
+        return output
+
     def _parse_devices(
         self, gpus: Optional[Union[List[int], str, int]], auto_select_gpus: bool, tpu_cores: Optional[Union[List[int],
                                                                                                             str, int]]
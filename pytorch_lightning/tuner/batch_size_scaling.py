@@ -13,9 +13,15 @@
 # limitations under the License
 import logging
 import os
-from typing import Optional, Tuple
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import torch
 
 import pytorch_lightning as pl
+from pytorch_lightning.callbacks.base import Callback
 from pytorch_lightning.loggers.base import DummyLogger
 from pytorch_lightning.utilities import rank_zero_warn
 from pytorch_lightning.utilities.cloud_io import get_filesystem
@@ -26,6 +32,14 @@ from pytorch_lightning.utilities.parsing import lightning_getattr, lightning_has
 
 log = logging.getLogger(__name__)
 
+# number of steps run before measuring the throughput of a batch size, so that the startup of the dataloader and the
+# first, slower, iterations are excluded
+_THROUGHPUT_WARMUP_STEPS = 2
+# fraction of the memory of the device which should stay free with the selected batch size
+_THROUGHPUT_MEMORY_HEADROOM = 0.1
+# the smallest batch size reaching this fraction of the best throughput is selected
+_THROUGHPUT_KNEE_RATIO = 0.95
+
 
 def scale_batch_size(
     trainer: 'pl.Trainer',
@@ -60,6 +74,8 @@ def scale_batch_size(
     __scale_batch_dump_params(trainer)
 
     # Set to values that are required by the algorithm
+    if mode == 'throughput':
+        steps_per_trial += _THROUGHPUT_WARMUP_STEPS
     __scale_batch_reset_params(trainer, model, steps_per_trial)
 
     # Save initial model, that is loaded after batch size is found
@@ -75,8 +91,10 @@ def scale_batch_size(
         new_size = _run_power_scaling(trainer, model, new_size, batch_arg_name, max_trials)
     elif mode == 'binsearch':
         new_size = _run_binsearch_scaling(trainer, model, new_size, batch_arg_name, max_trials)
+    elif mode == 'throughput':
+        new_size = _run_throughput_scaling(trainer, model, new_size, batch_arg_name, max_trials)
     else:
-        raise ValueError('mode in method `scale_batch_size` could either be `power` or `binsearch`')
+        raise ValueError('mode in method `scale_batch_size` could either be `power`, `binsearch` or `throughput`')
 
     garbage_collection_cuda()
     log.info(f'Finished batch size finder, will continue with full run using batch size {new_size}')
@@ -217,6 +235,150 @@ def _run_binsearch_scaling(
     return new_size
 
 
+class _ThroughputMonitor(Callback):
+    """Measures the time of the training steps after the warm-up steps and the peak memory usage of a trial."""
+
+    def __init__(self, warmup_steps: int) -> None:
+        self.warmup_steps = warmup_steps
+        self.durations: List[float] = []
+        self.peak_memory = 0
+        self.total_memory: Optional[int] = None
+        self._device: Optional[torch.device] = None
+        self._num_steps = 0
+        self._start: Optional[float] = None
+
+    def on_train_start(self, trainer: 'pl.Trainer', pl_module: 'pl.LightningModule') -> None:
+        self._device = pl_module.device
+        if self._device.type == 'cuda':
+            torch.cuda.reset_peak_memory_stats(self._device)
+            self.total_memory = torch.cuda.get_device_properties(self._device).total_memory
+        else:
+            self.total_memory = _get_total_cpu_memory()
+
+    def on_train_batch_start(
+        self, trainer: 'pl.Trainer', pl_module: 'pl.LightningModule', batch: Any, batch_idx: int, dataloader_idx: int
+    ) -> None:
+        if self._device.type == 'cuda':
+            # wait for the previous step to finish
+            torch.cuda.synchronize(self._device)
+        now = time.perf_counter()
+        if self._start is not None and self._num_steps > self.warmup_steps:
+            self.durations.append(now - self._start)
+        self._start = now
+        self._num_steps += 1
+
+    def on_train_batch_end(
+        self,
+        trainer: 'pl.Trainer',
+        pl_module: 'pl.LightningModule',
+        outputs: Any,
+        batch: Any,
+        batch_idx: int,
+        dataloader_idx: int,
+    ) -> None:
+        if self._device.type == 'cuda':
+            self.peak_memory = torch.cuda.max_memory_allocated(self._device)
+        else:
+            self.peak_memory = max(self.peak_memory, _get_rss())
+
+    def on_train_end(self, trainer: 'pl.Trainer', pl_module: 'pl.LightningModule') -> None:
+        if self._device.type == 'cuda':
+            torch.cuda.synchronize(self._device)
+        if self._start is not None and self._num_steps > self.warmup_steps:
+            self.durations.append(time.perf_counter() - self._start)
+
+
+def _get_rss() -> int:
+    """Returns the resident set size of the current process in bytes."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        # Windows
+        return 0
+    # not available on macOS, fall back to the peak resident set size, in bytes on macOS and in kilobytes otherwise
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def _get_total_cpu_memory() -> Optional[int]:
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _run_throughput_scaling(
+    trainer: 'pl.Trainer', model: 'pl.LightningModule', new_size: int, batch_arg_name: str, max_trials: int
+) -> int:
+    """ Batch scaling mode where the size is doubled at each iteration until an OOM error is encountered or the
+        memory headroom is used, while measuring the throughput of each size. The smallest batch size reaching
+        ``_THROUGHPUT_KNEE_RATIO`` of the best throughput is selected. """
+    trials: List[Dict[str, Any]] = []
+    for _ in range(max_trials):
+        garbage_collection_cuda()
+        trainer.fit_loop.global_step = 0  # reset after each try
+        monitor = _ThroughputMonitor(_THROUGHPUT_WARMUP_STEPS)
+        trainer.callbacks = [monitor]
+        try:
+            trainer.tuner._run(model)
+        except RuntimeError as exception:
+            # Only these errors should trigger an adjustment
+            if is_oom_error(exception):
+                garbage_collection_cuda()
+                log.info(f'Batch size {new_size} failed')
+                break
+            raise  # some other error not memory related
+        finally:
+            trainer.callbacks = []
+
+        throughput = new_size / statistics.median(monitor.durations) if monitor.durations else None
+        fits = (
+            monitor.total_memory is None
+            or monitor.peak_memory <= (1 - _THROUGHPUT_MEMORY_HEADROOM) * monitor.total_memory
+        )
+        trials.append(dict(batch_size=new_size, throughput=throughput, peak_memory=monitor.peak_memory, fits=fits))
+        if not fits:
+            log.info(f'Batch size {new_size} exceeds the memory headroom')
+            break
+
+        new_size, changed = _adjust_batch_size(trainer, batch_arg_name, factor=2.0, desc='succeeded')
+        if changed:
+            # Force the train dataloader to reset as the batch size has changed
+            trainer.reset_train_dataloader(model)
+        else:
+            break
+
+    candidates = [t for t in trials if t['fits'] and t['throughput'] is not None]
+    if candidates:
+        best_throughput = max(t['throughput'] for t in candidates)
+        new_size = min(
+            t['batch_size'] for t in candidates if t['throughput'] >= _THROUGHPUT_KNEE_RATIO * best_throughput
+        )
+    elif trials and trials[0]['fits']:
+        # too few steps to measure the throughput, fall back to the largest batch size which fits
+        new_size = max(t['batch_size'] for t in trials if t['fits'])
+    elif trials:
+        new_size = max(trials[0]['batch_size'] // 2, 1)
+    else:
+        new_size = max(new_size // 2, 1)
+    _adjust_batch_size(trainer, batch_arg_name, value=new_size)
+
+    rows = '\n'.join(
+        f"{t['batch_size']:>12} {t['throughput'] or float('nan'):>24.1f} {t['peak_memory'] / 2**20:>18.1f}"
+        for t in trials
+    )
+    log.info(
+        f"{'Batch size':>12} {'Throughput (samples/s)':>24} {'Peak memory (MiB)':>18}\n{rows}\n"
+        f"Selected batch size {new_size}"
+    )
+    return new_size
+
+
 def _adjust_batch_size(
     trainer: 'pl.Trainer',
     batch_arg_name: str = 'batch_size',
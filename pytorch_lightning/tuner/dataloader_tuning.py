@@ -0,0 +1,181 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+import inspect
+import logging
+import math
+import multiprocessing
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import torch
+from torch.utils.data import DataLoader
+
+import pytorch_lightning as pl
+from pytorch_lightning.utilities import _TORCH_GREATER_EQUAL_1_7, rank_zero_warn
+from pytorch_lightning.utilities.apply_func import move_data_to_device
+from pytorch_lightning.utilities.data import has_iterable_dataset
+
+log = logging.getLogger(__name__)
+
+# the settings with the fewest workers reaching this fraction of the best throughput are selected
+_KNEE_RATIO = 0.95
+
+
+def tune_dataloader(
+    trainer: 'pl.Trainer',
+    model: 'pl.LightningModule',
+    mode: str = 'halving',
+    num_batches: int = 20,
+    warmup_batches: int = 3,
+    max_num_workers: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """See :meth:`~pytorch_lightning.tuner.tuning.Tuner.tune_dataloader`"""
+    if mode not in ('grid', 'halving'):
+        raise ValueError('mode in method `tune_dataloader` could either be `grid` or `halving`')
+    if trainer.fast_dev_run:
+        rank_zero_warn('Skipping dataloader tuning since fast_dev_run is enabled.', UserWarning)
+        return
+
+    # benchmark the dataloader as configured by the user
+    trainer.data_connector.train_dataloader_kwargs = {}
+    trainer.reset_train_dataloader(model)
+    dataloader = trainer.train_dataloader.loaders
+    if not isinstance(dataloader, DataLoader) or has_iterable_dataset(dataloader):
+        rank_zero_warn(
+            'Skipping dataloader tuning, which supports a single train `DataLoader` over a map-style dataset.',
+            UserWarning
+        )
+        return
+
+    device = trainer.training_type_plugin.root_device
+    candidates = _get_candidates(dataloader, device, max_num_workers or multiprocessing.cpu_count())
+    trials = [dict(config=config, throughput=0.0, startup=0.0, num_batches=0) for config in candidates]
+
+    remaining = trials
+    while True:
+        for trial in remaining:
+            _measure_trial(trainer, dataloader, trial, num_batches, warmup_batches, device)
+        if mode == 'grid' or len(remaining) <= 1:
+            break
+        # successive halving: measure the best half of the candidates with twice as many batches
+        remaining = sorted(remaining, key=lambda t: t['throughput'], reverse=True)[:math.ceil(len(remaining) / 2)]
+        num_batches *= 2
+
+    # the throughputs measured over different numbers of batches aren't comparable, so the settings reaching almost
+    # the best throughput are measured again over the batches of the last round
+    finalists = _fast_enough(trials)
+    for trial in finalists:
+        if trial['num_batches'] != num_batches:
+            _measure_trial(trainer, dataloader, trial, num_batches, warmup_batches, device)
+
+    # the fewest workers and the smallest prefetch factor reaching almost the best throughput
+    fast_enough = _fast_enough(finalists)
+    best = min(fast_enough, key=lambda t: (t['config']['num_workers'], t['config'].get('prefetch_factor') or 0))
+
+    rows = '\n'.join(
+        f"{str(t['config']):<90} {t['num_batches']:>8} {t['throughput']:>16.1f} {t['startup']:>12.3f}" for t in trials
+    )
+    log.info(
+        f"{'Settings':<90} {'Batches':>8} {'Batches/s':>16} {'Startup (s)':>12}\n{rows}\n"
+        f"Selected dataloader settings {best['config']}"
+    )
+
+    trainer.data_connector.train_dataloader_kwargs = best['config']
+    return best['config']
+
+
+def _fast_enough(trials: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Returns the trials reaching almost the best throughput."""
+    best_throughput = max(t['throughput'] for t in trials)
+    return [t for t in trials if t['throughput'] >= _KNEE_RATIO * best_throughput]
+
+
+def _measure_trial(
+    trainer: 'pl.Trainer',
+    dataloader: DataLoader,
+    trial: Dict[str, Any],
+    num_batches: int,
+    warmup_batches: int,
+    device: torch.device,
+) -> None:
+    trial['throughput'], trial['startup'] = _measure(
+        trainer, dataloader, trial['config'], num_batches, warmup_batches, device
+    )
+    trial['num_batches'] = num_batches
+
+
+def _get_candidates(dataloader: DataLoader, device: torch.device, max_num_workers: int) -> List[Dict[str, Any]]:
+    """Returns the grid of the dataloader settings to benchmark."""
+    num_workers = {0, dataloader.num_workers, max_num_workers}
+    num_workers.update(2**i for i in range(int(math.log2(max_num_workers)) + 1))
+    num_workers = sorted(n for n in num_workers if n <= max_num_workers)
+    pin_memory = [False, True] if device.type == 'cuda' else [dataloader.pin_memory]
+
+    candidates = []
+    for workers in num_workers:
+        for pin in pin_memory:
+            config = dict(num_workers=workers, pin_memory=pin)
+            if not _TORCH_GREATER_EQUAL_1_7:
+                candidates.append(config)
+            elif workers == 0:
+                default_prefetch_factor = inspect.signature(DataLoader.__init__).parameters['prefetch_factor'].default
+                candidates.append(dict(config, prefetch_factor=default_prefetch_factor, persistent_workers=False))
+            else:
+                # the persistent workers don't change the throughput within an epoch, but they aren't restarted
+                # at the start of every epoch
+                for prefetch_factor in (2, 4):
+                    candidates.append(dict(config, prefetch_factor=prefetch_factor, persistent_workers=True))
+    return candidates
+
+
+def _measure(
+    trainer: 'pl.Trainer',
+    dataloader: DataLoader,
+    config: Dict[str, Any],
+    num_batches: int,
+    warmup_batches: int,
+    device: torch.device,
+) -> Tuple[float, float]:
+    """
+    Iterates over the dataloader rebuilt with the ``config`` settings, moving the batches to the device without
+    running the model.
+
+    Return:
+        The number of batches per second after the warm-up batches and the time to get the first batch.
+    """
+    dataloader = trainer._apply_dataloader_kwargs(dataloader, config)
+    start = time.perf_counter()
+    startup = 0.0
+    measure_start = None
+    num_measured = 0
+    iterator = iter(dataloader)
+    for i, batch in enumerate(iterator):
+        if i == 0:
+            startup = time.perf_counter() - start
+        if device.type == 'cuda':
+            move_data_to_device(batch, device)
+        if i == max(warmup_batches, 1) - 1:
+            if device.type == 'cuda':
+                torch.cuda.synchronize(device)
+            measure_start = time.perf_counter()
+        elif measure_start is not None:
+            num_measured += 1
+        if num_measured >= num_batches:
+            break
+    if device.type == 'cuda':
+        torch.cuda.synchronize(device)
+    elapsed = time.perf_counter() - measure_start if measure_start is not None else 0.0
+    # shut down the workers
+    del iterator
+    return (num_measured / elapsed if elapsed > 0 else 0.0), startup
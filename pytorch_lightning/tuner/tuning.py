@@ -16,6 +16,7 @@ from typing import Any, Dict, Optional, Union
 import pytorch_lightning as pl
 from pytorch_lightning.trainer.states import TrainerStatus
 from pytorch_lightning.tuner.batch_size_scaling import scale_batch_size
+from pytorch_lightning.tuner.dataloader_tuning import tune_dataloader
 from pytorch_lightning.tuner.lr_finder import _LRFinder, lr_find
 from pytorch_lightning.utilities.types import EVAL_DATALOADERS, TRAIN_DATALOADERS
 
@@ -29,15 +30,18 @@ class Tuner:
     def on_trainer_init(self, auto_lr_find: Union[str, bool], auto_scale_batch_size: Union[str, bool]) -> None:
         self.trainer.auto_lr_find = auto_lr_find
         self.trainer.auto_scale_batch_size = auto_scale_batch_size
+        self.trainer.auto_tune_dataloader = False
 
     def _tune(
         self,
         model: 'pl.LightningModule',
         scale_batch_size_kwargs: Optional[Dict[str, Any]] = None,
         lr_find_kwargs: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Optional[Union[int, _LRFinder]]]:
+        tune_dataloader_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Optional[Union[int, _LRFinder, Dict[str, Any]]]]:
         scale_batch_size_kwargs = scale_batch_size_kwargs or {}
         lr_find_kwargs = lr_find_kwargs or {}
+        tune_dataloader_kwargs = tune_dataloader_kwargs or {}
         # return a dict instead of a tuple so BC is not broken if a new tuning procedure is added
         result = {}
 
@@ -47,6 +51,10 @@ class Tuner:
                 scale_batch_size_kwargs.setdefault("mode", self.trainer.auto_scale_batch_size)
             result['scale_batch_size'] = scale_batch_size(self.trainer, model, **scale_batch_size_kwargs)
 
+        # Run the dataloader tuning, once the batch size is known
+        if self.trainer.auto_tune_dataloader:
+            result['tune_dataloader'] = tune_dataloader(self.trainer, model, **tune_dataloader_kwargs)
+
         # Run learning rate finder:
         if self.trainer.auto_lr_find:
             lr_find_kwargs.setdefault('update_attr', True)
@@ -96,10 +104,15 @@ class Tuner:
                 - ``'power'`` (default): Keep multiplying the batch size by 2, until we get an OOM error.
                 - ``'binsearch'``: Initially keep multiplying by 2 and after encountering an OOM error
                     do a binary search between the last successful batch size and the batch size that failed.
+                - ``'throughput'``: Keep multiplying by 2 until we get an OOM error or the peak memory usage leaves less
+                    than 10% of the memory of the device free, while measuring the samples per second of each
+                    batch size after a few warm-up steps. The smallest batch size reaching 95% of the best
+                    throughput is selected. On CPU, the resident set size of the process is used as memory usage.
 
             steps_per_trial: number of steps to run with a given batch size.
                 Ideally 1 should be enough to test if a OOM error occurs,
-                however in practise a few are needed
+                however in practise a few are needed. With ``mode='throughput'``, the number of measured steps,
+                after the warm-up steps.
 
             init_val: initial batch size to start the search with
 
@@ -202,3 +215,60 @@ class Tuner:
         )
         self.trainer.auto_lr_find = False
         return result['lr_find']
+
+    def tune_dataloader(
+        self,
+        model: 'pl.LightningModule',
+        train_dataloaders: Optional[Union[TRAIN_DATALOADERS, 'pl.LightningDataModule']] = None,
+        datamodule: Optional['pl.LightningDataModule'] = None,
+        mode: str = 'halving',
+        num_batches: int = 20,
+        warmup_batches: int = 3,
+        max_num_workers: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Benchmarks the train dataloader with different ``num_workers``, ``prefetch_factor`` and ``pin_memory``
+        settings, by iterating over it and moving the batches to the device without running the model. The train
+        dataloader is rebuilt with the best settings for the next runs of the trainer. ``persistent_workers`` isn't
+        benchmarked since it doesn't change the throughput within an epoch: it is enabled whenever workers are used.
+
+        Args:
+            model: Model to tune.
+
+            train_dataloaders: A :class:`torch.utils.data.DataLoader` or a
+                :class:`~pytorch_lightning.core.datamodule.LightningDataModule` specifying training samples.
+
+            datamodule: An instance of :class:`~pytorch_lightning.core.datamodule.LightningDataModule`.
+
+            mode: Search strategy over the settings:
+
+                - ``'halving'`` (default): Measure all the settings over ``num_batches`` batches, then keep measuring
+                    the fastest half with twice as many batches until one is left. The settings reaching almost the
+                    best throughput are then measured again with as many batches as the last one.
+                - ``'grid'``: Measure all the settings over ``num_batches`` batches.
+
+            num_batches: number of batches over which the throughput of the settings is measured.
+
+            warmup_batches: number of batches which are loaded before measuring the throughput, to exclude the
+                startup of the workers.
+
+            max_num_workers: maximum number of workers to try. Defaults to the number of CPUs.
+
+        Return:
+            The selected settings, with the fewest workers reaching 95% of the best throughput. ``None`` if the
+            train dataloader can't be tuned: only a single ``DataLoader`` over a map-style dataset is supported.
+        """
+        self.trainer.auto_tune_dataloader = True
+        result = self.trainer.tune(
+            model,
+            train_dataloaders=train_dataloaders,
+            datamodule=datamodule,
+            tune_dataloader_kwargs={
+                'mode': mode,
+                'num_batches': num_batches,
+                'warmup_batches': warmup_batches,
+                'max_num_workers': max_num_workers,
+            }
+        )
+        self.trainer.auto_tune_dataloader = False
+        return result['tune_dataloader']
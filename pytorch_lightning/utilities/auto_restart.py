@@ -12,12 +12,93 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from copy import deepcopy
+from itertools import islice
 from typing import Any, Dict, Generator, Iterator, Optional, Union
 
-from torch.utils.data import get_worker_info, Sampler
+import torch
+from torch.utils.data import DistributedSampler, get_worker_info, RandomSampler, Sampler, SequentialSampler
 from torch.utils.data.dataloader import IterableDataset
 
 from pytorch_lightning.utilities.enums import AutoRestartBatchKeys
+from pytorch_lightning.utilities.imports import _TORCH_GREATER_EQUAL_1_9
+
+_ITERATOR_TYPES = (type(iter([])), type(iter(range(0))))
+
+
+class _IteratorSeeker:
+    """
+    Makes a sampler seekable when its order only depends on its attributes, like the ``SequentialSampler`` and the
+    ``DistributedSampler``. Their ``__iter__`` returns a list or a range iterator, whose position can be set directly.
+    """
+
+    def __init__(self, sampler: Sampler) -> None:
+        self.sampler = sampler
+
+    def state_dict(self) -> Dict[str, Any]:
+        return {}
+
+    def load_state_dict(self, state_dict: Dict[str, Any]) -> None:
+        pass
+
+    def seek(self, offset: int) -> Iterator[Any]:
+        iterator = iter(self.sampler)
+        if type(iterator) not in _ITERATOR_TYPES:
+            return islice(iterator, offset, None)
+        iterator.__setstate__(offset)
+        return iterator
+
+
+class _RandomSamplerSeeker:
+    """
+    Makes a ``RandomSampler`` without replacement seekable by recording the seed, or the state of its generator, at
+    the start of each epoch. The permutation is then regenerated directly instead of iterating through it.
+    """
+
+    def __init__(self, sampler: RandomSampler) -> None:
+        self.sampler = sampler
+        self._state: Dict[str, Any] = {}
+
+    @staticmethod
+    def is_supported(sampler: Sampler) -> bool:
+        if type(sampler) is not RandomSampler or sampler.replacement:
+            return False
+        if sampler.num_samples != len(sampler.data_source):
+            return False
+        # before 1.9, the ``RandomSampler`` without a generator draws the permutation from the global generator
+        return getattr(sampler, "generator", None) is not None or _TORCH_GREATER_EQUAL_1_9
+
+    def state_dict(self) -> Dict[str, Any]:
+        generator = self.sampler.generator
+        if generator is None:
+            # draw the seed of the epoch the same way ``RandomSampler.__iter__`` does
+            self._state = {"seed": int(torch.empty((), dtype=torch.int64).random_().item())}
+        else:
+            self._state = {"generator_state": generator.get_state()}
+        return self._state
+
+    def load_state_dict(self, state_dict: Dict[str, Any]) -> None:
+        self._state = state_dict
+
+    def seek(self, offset: int) -> Iterator[Any]:
+        if "seed" in self._state:
+            generator = torch.Generator()
+            generator.manual_seed(self._state["seed"])
+        else:
+            generator = self.sampler.generator
+            generator.set_state(self._state["generator_state"])
+        permutation = torch.randperm(len(self.sampler.data_source), generator=generator)
+        return iter(permutation[offset:].tolist())
+
+
+def _get_seekable_sampler(sampler: Union[Sampler, Generator]) -> Optional[Any]:
+    """Returns an object implementing the seekable protocol for the ``sampler``, ``None`` if it has to be replayed."""
+    if all(callable(getattr(sampler, name, None)) for name in ("state_dict", "load_state_dict", "seek")):
+        return sampler
+    if type(sampler) in (SequentialSampler, DistributedSampler):
+        return _IteratorSeeker(sampler)
+    if _RandomSamplerSeeker.is_supported(sampler):
+        return _RandomSamplerSeeker(sampler)
+    return None
 
 
 class FastForwardSampler(Sampler):
@@ -29,6 +110,16 @@ class FastForwardSampler(Sampler):
 
     When reloading, the ``FastForwardSampler`` will "fast-forward" the wrapped sampler by iterating through all the
     samples seen in the last iterations (for the current worker).
+
+    Seekable samplers skip this replay. A sampler is seekable when it implements:
+
+    - ``state_dict()``: called at the start of each epoch. Returns the state, e.g. the RNG state, which reproduces
+      the order of the indices of this epoch.
+    - ``load_state_dict(state_dict)``: restores this state when reloading.
+    - ``seek(n)``: returns an iterator over the indices of the epoch, starting from the ``n``-th one.
+
+    The ``SequentialSampler``, the ``DistributedSampler`` and the ``RandomSampler`` without replacement are supported
+    out of the box.
     """
 
     def __init__(self, sampler: Union[Sampler, Generator]) -> None:
@@ -38,6 +129,8 @@ class FastForwardSampler(Sampler):
         self._current_iteration = 0
         self._dataloader_batch_size: Optional[int] = None
         self._cached_state_dict: Optional[Dict[str, Any]] = None
+        self._seekable_sampler = _get_seekable_sampler(sampler)
+        self._sampler_state: Optional[Dict[str, Any]] = None
 
     def __getattr__(self, key: str) -> Any:
         if key in self.__dict__:
@@ -59,7 +152,12 @@ class FastForwardSampler(Sampler):
     def __iter__(self) -> Iterator[Any]:
         # split restart logic to avoid user with tempering with "fast-forwarding"
 
-        if not self.restarting:
+        if self._seekable_sampler is not None:
+            for batch in self._seek():
+                self._current_iteration += 1
+                yield batch
+
+        elif not self.restarting:
             for batch in self._sampler:
                 self._current_iteration += 1
                 yield batch
@@ -84,6 +182,23 @@ class FastForwardSampler(Sampler):
     def __len__(self) -> int:
         return len(self.sampler)
 
+    def _seek(self) -> Iterator[Any]:
+        # the `state dict` was cached as workers were available before.
+        if self._cached_state_dict is not None and self.worker_id in self._cached_state_dict:
+            self.load_state_dict(self._cached_state_dict, workers_initialized=True)
+            self._cached_state_dict = None
+
+        if not self.restarting:
+            self._sampler_state = self._seekable_sampler.state_dict()
+            return self._seekable_sampler.seek(0)
+
+        self.restarting = False
+        if self._sampler_state is None:
+            # the state was saved without the state of the sampler, the sampler is replayed
+            return islice(self._sampler, self._current_iteration, None)
+        self._seekable_sampler.load_state_dict(self._sampler_state)
+        return self._seekable_sampler.seek(self._current_iteration)
+
     def _compute_current_iteration(self, num_batches_processed: Optional[int] = None) -> int:
         """
         This function is used to compute the effective iteration.
@@ -102,7 +217,10 @@ class FastForwardSampler(Sampler):
 
     def state_dict(self, num_batches_processed: Optional[int] = None) -> Dict[int, Dict[str, int]]:
         """ Returns the state of the sampler in the current worker. The worker id indexes the state dict."""
-        return {self.worker_id: {"current_iteration": self._compute_current_iteration(num_batches_processed)}}
+        state = {"current_iteration": self._compute_current_iteration(num_batches_processed)}
+        if self._sampler_state is not None:
+            state["sampler_state"] = self._sampler_state
+        return {self.worker_id: state}
 
     def load_state_dict(self, state_dict: Dict[int, Any], workers_initialized: bool = False) -> None:
         """
@@ -116,6 +234,7 @@ class FastForwardSampler(Sampler):
             self.restarting = self._cached_state_dict[self.worker_id]["current_iteration"] > 0
             return
         self._current_iteration = state_dict[self.worker_id]["current_iteration"]
+        self._sampler_state = state_dict[self.worker_id].get("sampler_state")
         self.restarting = self._current_iteration > 0
 
 
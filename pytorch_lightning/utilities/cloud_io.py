@@ -12,27 +12,61 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import io
+import json
+import logging
+import os
+import threading
+import uuid
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import IO, Union
+from typing import Any, Callable, Dict, IO, List, Optional, Union
 
 import fsspec
 import torch
 from fsspec.implementations.local import LocalFileSystem
 from packaging.version import Version
 
+from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.utilities.imports import _IS_WINDOWS, _TORCH_GREATER_EQUAL_2_1
 
-def load(path_or_url: Union[str, IO, Path], map_location=None):
+log = logging.getLogger(__name__)
+
+_DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+_SHARDED_CHECKPOINT_MANIFEST = "manifest.json"
+
+
+def load(path_or_url: Union[str, IO, Path], map_location=None, mmap: bool = True):
+    """Loads a checkpoint from a file-like object, a URL or a path on any filesystem supported by ``fsspec``.
+
+    Args:
+        path_or_url: The object, URL or path to load the checkpoint from.
+        map_location: Remaps storage locations, see :func:`torch.load`.
+        mmap: Memory-map local checkpoint files instead of reading them into memory. The tensors of the checkpoint
+            are then backed by the file and only paged in once they are accessed, so entries that are never used
+            (e.g. the optimizer states when loading a model for inference) are never read from disk.
+            Only supported with PyTorch 1.6+ zipfile checkpoints on PyTorch 2.1+, ignored otherwise.
+    """
     if not isinstance(path_or_url, (str, Path)):
         # any sort of BytesIO or similiar
         return torch.load(path_or_url, map_location=map_location)
     if str(path_or_url).startswith("http"):
         return torch.hub.load_state_dict_from_url(str(path_or_url), map_location=map_location)
+    if mmap and _is_mmap_loadable(path_or_url):
+        return torch.load(str(path_or_url), map_location=map_location, mmap=True)
     fs = get_filesystem(path_or_url)
     with fs.open(path_or_url, "rb") as f:
         return torch.load(f, map_location=map_location)
 
 
+def _is_mmap_loadable(path: Union[str, Path]) -> bool:
+    # memory-mapping keeps the file open, which would prevent overwriting it on Windows
+    if not _TORCH_GREATER_EQUAL_2_1 or _IS_WINDOWS or "://" in str(path):
+        return False
+    # legacy (non-zipfile) checkpoints can't be memory-mapped
+    return os.path.isfile(path) and zipfile.is_zipfile(path)
+
+
 def get_filesystem(path: Union[str, Path]):
     path = str(path)
     if "://" in path:
@@ -42,24 +76,240 @@ def get_filesystem(path: Union[str, Path]):
     return LocalFileSystem()
 
 
-def atomic_save(checkpoint, filepath: str):
+def atomic_save(checkpoint, filepath: str, chunk_size: int = _DEFAULT_CHUNK_SIZE) -> None:
     """Saves a checkpoint atomically, avoiding the creation of incomplete checkpoints.
 
+    The checkpoint is serialized straight into a temporary file next to ``filepath``, which is moved to ``filepath``
+    once it has been completely written. No full in-memory copy of the serialized checkpoint is created.
+
     Args:
         checkpoint: The object to save.
             Built to be used with the ``dump_checkpoint`` method, but can deal with anything which ``torch.save``
             accepts.
         filepath: The path to which the checkpoint will be saved.
             This points to the file that the checkpoint will be stored in.
+        chunk_size: The maximum number of bytes buffered in memory before being written to the file system.
+    """
+    fs = get_filesystem(filepath)
+    # paths with a protocol, including `file://`, go through `fsspec`
+    is_local = isinstance(fs, LocalFileSystem) and "://" not in str(filepath)
+    tmp_path = f"{filepath}.{uuid.uuid4().hex}.tmp"
+    try:
+        if is_local:
+            fs.makedirs(os.path.dirname(os.path.abspath(tmp_path)), exist_ok=True)
+            f = open(tmp_path, "wb", buffering=chunk_size)
+        else:
+            f = fsspec.open(tmp_path, "wb", block_size=chunk_size).open()
+        with f:
+            # Can't use the new zipfile serialization for 1.6.0 because there's a bug in
+            # torch.hub.load_state_dict_from_url() that prevents it from loading the new files.
+            # More details can be found here: https://github.com/pytorch/pytorch/issues/42239
+            if Version(torch.__version__).release[:3] == (1, 6, 0):
+                torch.save(checkpoint, f, _use_new_zipfile_serialization=False)
+            else:
+                torch.save(checkpoint, f)
+        if is_local:
+            os.replace(tmp_path, filepath)
+        else:
+            fs.mv(tmp_path, filepath)
+    except BaseException:
+        if fs.exists(tmp_path):
+            fs.rm(tmp_path)
+        raise
+
+
+def sharded_checkpoint_shard_path(dirpath: Union[str, Path], rank: int) -> str:
+    """Returns the path of the file holding the shard of process ``rank`` in a sharded checkpoint."""
+    return os.path.join(str(dirpath), f"rank_{rank}.ckpt")
+
+
+def is_sharded_checkpoint(path: Union[str, Path]) -> bool:
+    """Whether ``path`` is a sharded checkpoint directory, i.e. a directory with a complete manifest."""
+    if not isinstance(path, (str, Path)) or str(path).startswith("http"):
+        return False
+    fs = get_filesystem(path)
+    return fs.isfile(os.path.join(str(path), _SHARDED_CHECKPOINT_MANIFEST))
+
+
+def save_sharded_checkpoint_manifest(dirpath: Union[str, Path], world_size: int) -> None:
+    """Writes the manifest of a sharded checkpoint, which marks the shards of all ``world_size`` processes complete.
+
+    The manifest is written to a temporary file first so that it only appears once it is complete.
     """
+    manifest = {
+        "world_size": world_size,
+        "shards": [os.path.basename(sharded_checkpoint_shard_path(dirpath, rank)) for rank in range(world_size)],
+    }
+    filepath = os.path.join(str(dirpath), _SHARDED_CHECKPOINT_MANIFEST)
+    tmp_path = f"{filepath}.{uuid.uuid4().hex}.tmp"
+    fs = get_filesystem(filepath)
+    with fs.open(tmp_path, "w") as f:
+        json.dump(manifest, f)
+    fs.mv(tmp_path, filepath)
+
+
+def remove_sharded_checkpoint_manifest(dirpath: Union[str, Path]) -> None:
+    """Removes the manifest of a sharded checkpoint, invalidating it before its shards get overwritten."""
+    filepath = os.path.join(str(dirpath), _SHARDED_CHECKPOINT_MANIFEST)
+    fs = get_filesystem(filepath)
+    if fs.exists(filepath):
+        fs.rm(filepath)
+
+
+def load_sharded_checkpoint_manifest(dirpath: Union[str, Path]) -> Dict[str, Any]:
+    """Reads the manifest of a sharded checkpoint."""
+    filepath = os.path.join(str(dirpath), _SHARDED_CHECKPOINT_MANIFEST)
+    fs = get_filesystem(filepath)
+    with fs.open(filepath, "r") as f:
+        return json.load(f)
+
+
+def load_sharded_checkpoint(dirpath: Union[str, Path], rank: int = 0, map_location=None) -> Dict[str, Any]:
+    """Loads the shard of process ``rank`` from a sharded checkpoint. The shards of the other processes are not read.
+
+    Args:
+        dirpath: The sharded checkpoint directory.
+        rank: The global rank of the process whose shard is loaded.
+        map_location: Remaps storage locations, see :func:`torch.load`.
+    """
+    manifest = load_sharded_checkpoint_manifest(dirpath)
+    if not 0 <= rank < len(manifest["shards"]):
+        raise ValueError(
+            f"The sharded checkpoint at {dirpath} holds the shards of {manifest['world_size']} processes,"
+            f" it has no shard for rank {rank}."
+        )
+    return load(os.path.join(str(dirpath), manifest["shards"][rank]), map_location=map_location)
+
+
+def _snapshot_tensor(tensor: torch.Tensor) -> torch.Tensor:
+    """Copies a tensor to CPU memory so it can be serialized while the original keeps being updated."""
+    tensor = tensor.detach()
+    if tensor.device.type == "cuda":
+        snapshot = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True)
+        # the copy is synchronized by the writer before serializing
+        return snapshot.copy_(tensor, non_blocking=True)
+    if tensor.device.type == "cpu":
+        return tensor.clone()
+    return tensor.cpu()
+
+
+class AsyncCheckpointWriter:
+    """Writes checkpoints from a background thread so the training loop does not wait for the serialization and
+    the file-system writes.
+
+    On :meth:`save`, the tensors of the checkpoint are copied to (pinned) CPU memory, then the checkpoint is
+    serialized and written with :func:`atomic_save` by a single worker thread, so writes and removals happen
+    in the order they were requested. Non-tensor values are not copied and should not be modified afterwards.
+
+    Args:
+        max_pending: The maximum number of checkpoints waiting to be written. :meth:`save` blocks when
+            this number is reached, which bounds the host memory used by the snapshots.
+        save_fn: The function used to write a checkpoint to a file path.
+    """
+
+    def __init__(self, max_pending: int = 1, save_fn: Callable[[Dict[str, Any], str], None] = atomic_save) -> None:
+        if max_pending < 1:
+            raise ValueError(f"`max_pending` should be at least 1, got {max_pending}")
+        self.max_pending = max_pending
+        self._save_fn = save_fn
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: List[Future] = []
+        self._pending_paths: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        # only accessed by the worker thread
+        self._last_write_failed = False
+
+    @property
+    def pending_paths(self) -> List[str]:
+        """The file paths which have been requested but have not been written yet."""
+        with self._lock:
+            return list(self._pending_paths)
+
+    def save(self, checkpoint: Dict[str, Any], filepath: str) -> None:
+        """Snapshots the checkpoint and schedules it to be written to ``filepath``."""
+        self._slots.acquire()
+        try:
+            snapshot = apply_to_collection(checkpoint, torch.Tensor, _snapshot_tensor)
+            event = None
+            if torch.cuda.is_available() and torch.cuda.is_initialized():
+                event = torch.cuda.Event()
+                event.record()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        def write() -> None:
+            if event is not None:
+                event.synchronize()
+            try:
+                self._save_fn(snapshot, filepath)
+                log.debug(f"Checkpoint written in the background: {filepath}")
+            except BaseException:
+                self._last_write_failed = True
+                raise
+            else:
+                self._last_write_failed = False
+            finally:
+                self._slots.release()
+
+        self._submit(write, filepath)
+
+    def remove(self, filepath: str) -> None:
+        """
+        Schedules the removal of ``filepath`` after the checkpoints requested before have been written. The removal is
+        skipped if the last of these checkpoints failed to be written, so that it doesn't remove the last valid one.
+        """
+
+        def rm() -> None:
+            if self._last_write_failed:
+                log.warning(f"Not removing {filepath} since the last checkpoint failed to be written")
+                return
+            fs = get_filesystem(filepath)
+            if fs.exists(filepath):
+                # sharded checkpoints are directories
+                fs.rm(filepath, recursive=True)
+                log.debug(f"Removed checkpoint: {filepath}")
+
+        self._submit(rm)
+
+    def wait(self) -> None:
+        """Blocks until all the scheduled operations are done and re-raises the first error, if any."""
+        with self._lock:
+            futures, self._futures = self._futures, []
+        errors = [f.exception() for f in futures]
+        errors = [e for e in errors if e is not None]
+        if errors:
+            raise errors[0]
+
+    def close(self) -> None:
+        """Waits for the scheduled operations and stops the worker thread. The writer can still be used after."""
+        try:
+            self.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the pending operations belong to the current process
+        return {"max_pending": self.max_pending, "save_fn": self._save_fn}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    def _submit(self, fn: Callable[[], None], filepath: Optional[str] = None) -> None:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint_writer")
+            future = self._executor.submit(fn)
+            self._futures.append(future)
+            if filepath is not None:
+                self._pending_paths[filepath] = future
+        if filepath is not None:
+            future.add_done_callback(lambda f: self._on_done(filepath, f))
 
-    bytesbuffer = io.BytesIO()
-    # Can't use the new zipfile serialization for 1.6.0 because there's a bug in
-    # torch.hub.load_state_dict_from_url() that prevents it from loading the new files.
-    # More details can be found here: https://github.com/pytorch/pytorch/issues/42239
-    if Version(torch.__version__).release[:3] == (1, 6, 0):
-        torch.save(checkpoint, bytesbuffer, _use_new_zipfile_serialization=False)
-    else:
-        torch.save(checkpoint, bytesbuffer)
-    with fsspec.open(filepath, "wb") as f:
-        f.write(bytesbuffer.getvalue())
+    def _on_done(self, filepath: str, future: Future) -> None:
+        with self._lock:
+            if self._pending_paths.get(filepath) is future:
+                del self._pending_paths[filepath]
@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Iterable, Mapping, Union
+import inspect
+from typing import Any, Iterable, Iterator, List, Mapping, Tuple, Union
 
 import torch
-from torch.utils.data import DataLoader, IterableDataset
+from torch.utils.data import BatchSampler, DataLoader, Dataset, IterableDataset, Sampler, TensorDataset
+from torch.utils.data.dataloader import default_collate
 
 from pytorch_lightning.utilities import rank_zero_warn
 
@@ -84,3 +86,76 @@ def get_len(dataloader: DataLoader) -> Union[int, float]:
         return len(dataloader)
 
     return float('inf')
+
+
+def has_batched_fetching(dataloader: DataLoader) -> bool:
+    """
+    Checks if the batches of a given Dataloader can be fetched with a single call to the
+    ``lightning_getitems(indices)`` method of its dataset, which returns the whole batch. The batches aren't collated,
+    so a custom ``collate_fn`` opts out.
+    """
+    return (
+        isinstance(dataloader, DataLoader) and not has_iterable_dataset(dataloader)
+        and callable(getattr(dataloader.dataset, 'lightning_getitems', None)) and dataloader.batch_sampler is not None
+        and dataloader.collate_fn is default_collate
+        # the dataset of the rebuilt dataloader is replaced
+        and (type(dataloader) is DataLoader or 'dataset' in inspect.signature(dataloader.__init__).parameters)
+    )
+
+
+class _BatchedFetchDataset(Dataset):
+    """
+    Wraps a dataset implementing ``lightning_getitems`` for a :class:`~torch.utils.data.DataLoader` without automatic
+    batching, whose sampler yields the indices of a batch.
+    """
+
+    def __init__(self, dataset: Dataset) -> None:
+        self.dataset = dataset
+
+    def __len__(self) -> int:
+        return len(self.dataset)
+
+    def __getitem__(self, indices: List[int]) -> Any:
+        return self.dataset.lightning_getitems(indices)
+
+
+class _BatchedFetchSampler(Sampler):
+    """
+    Wraps a :class:`~torch.utils.data.BatchSampler` to be used as the sampler of a
+    :class:`~torch.utils.data.DataLoader` without automatic batching. ``set_epoch`` is forwarded to the sampler of the
+    batch sampler, e.g. a :class:`~torch.utils.data.distributed.DistributedSampler`.
+    """
+
+    def __init__(self, batch_sampler: BatchSampler) -> None:
+        self.batch_sampler = batch_sampler
+
+    def __iter__(self) -> Iterator[List[int]]:
+        return iter(self.batch_sampler)
+
+    def __len__(self) -> int:
+        return len(self.batch_sampler)
+
+    @property
+    def drop_last(self) -> bool:
+        return self.batch_sampler.drop_last
+
+    @property
+    def batch_size(self) -> int:
+        return self.batch_sampler.batch_size
+
+    @property
+    def sampler(self) -> Sampler:
+        return self.batch_sampler.sampler
+
+    def set_epoch(self, epoch: int) -> None:
+        set_epoch = getattr(self.sampler, 'set_epoch', None)
+        if callable(set_epoch):
+            set_epoch(epoch)
+
+
+class _BatchedTensorDataset(TensorDataset):
+    """A :class:`~torch.utils.data.TensorDataset` which indexes each of its tensors once per batch."""
+
+    def lightning_getitems(self, indices: List[int]) -> Tuple[torch.Tensor, ...]:
+        indices = torch.as_tensor(indices)
+        return tuple(tensor[indices] for tensor in self.tensors)
@@ -0,0 +1,185 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import atexit
+import mmap
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, Optional, Set
+
+from torch.utils.data import Dataset
+
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from pytorch_lightning.utilities.imports import _IS_WINDOWS
+
+if not _IS_WINDOWS:
+    import fcntl
+
+# the header holds the number of cached samples, the number of used bytes and whether the arena is full
+_NUM_CACHED, _USED_BYTES, _FULL = range(3)
+_HEADER_SIZE = 64
+# each sample has an entry with its offset and its size + 1, 0 meaning that the sample isn't cached
+_ENTRY_SIZE = 16
+# the arenas removed by this process at exit
+_OWNED_PATHS: Set[str] = set()
+
+
+def _shared_memory_dir() -> str:
+    # `/dev/shm` is a RAM-backed filesystem on Linux
+    return '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+
+def _remove(path: str) -> None:
+    for filepath in (path, path + '.lock'):
+        try:
+            os.remove(filepath)
+        except FileNotFoundError:
+            pass
+
+
+@atexit.register
+def _remove_owned() -> None:
+    for path in _OWNED_PATHS:
+        _remove(path)
+    _OWNED_PATHS.clear()
+
+
+class CachedDataset(Dataset):
+    """
+    Wraps a map-style dataset to cache its samples in a memory-mapped arena, so that the epochs after the first one
+    don't load and decode them again.
+
+    The arena is a file in ``/dev/shm`` when available. It is shared by all the processes opening the same ``name``
+    on a node, i.e. the ranks and their dataloader workers. The samples are pickled into it until ``max_bytes``
+    bytes are used, after which the samples which weren't cached are always loaded from the wrapped dataset
+    ("first epoch fills" policy). Contrary to an LRU policy, this keeps the hits constant when the samples are read in
+    a different order every epoch and the dataset doesn't fit in the budget.
+
+    The number of ``hits`` and ``misses`` is counted by each process, i.e. by each dataloader worker.
+
+    Args:
+        dataset: The map-style dataset to cache.
+        name: The name of the arena, which should be the same on all the ranks.
+        max_bytes: The maximum number of bytes of the cached samples.
+        owner: Whether this process removes the arena, on :meth:`close` or at exit. A single process per node, e.g.
+            the local rank 0, should own it so that the arena outlives the other processes using it.
+    """
+
+    def __init__(self, dataset: Dataset, name: str, max_bytes: int, owner: bool = True) -> None:
+        if _IS_WINDOWS:
+            raise MisconfigurationException('`CachedDataset` is not supported on Windows.')
+        self.dataset = dataset
+        self.path = os.path.join(_shared_memory_dir(), f'pl_dataset_cache_{name}')
+        self.max_bytes = max_bytes
+        self.owner = owner
+        self.hits = 0
+        self.misses = 0
+        self._pid: Optional[int] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._header: Optional[memoryview] = None
+        self._index: Optional[memoryview] = None
+        self._lock_fd: Optional[int] = None
+        if owner:
+            # the arena stays alive while a process maps it
+            _OWNED_PATHS.add(self.path)
+
+    def __len__(self) -> int:
+        return len(self.dataset)
+
+    @property
+    def num_cached(self) -> int:
+        """The number of samples cached by all the processes."""
+        self._open()
+        return self._header[_NUM_CACHED]
+
+    @property
+    def used_bytes(self) -> int:
+        """The number of bytes used by the cached samples."""
+        self._open()
+        return self._header[_USED_BYTES]
+
+    def _open(self) -> None:
+        if self._pid == os.getpid():
+            return
+        num_samples = len(self.dataset)
+        self._data_offset = _HEADER_SIZE + num_samples * _ENTRY_SIZE
+        size = self._data_offset + self.max_bytes
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            # the file is sparse, the memory is only used by the cached samples
+            if os.fstat(fd).st_size < size:
+                os.ftruncate(fd, size)
+            self._mmap = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        buffer = memoryview(self._mmap)
+        self._header = buffer[:_HEADER_SIZE].cast('q')
+        # the offset and the size of the sample `i` are at `2 * i` and `2 * i + 1`
+        self._index = buffer[_HEADER_SIZE:self._data_offset].cast('q')
+        self._lock_fd = os.open(self.path + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        self._pid = os.getpid()
+
+    def __getitem__(self, index: int) -> Any:
+        self._open()
+        # the size is read first, it is published after the offset
+        size = self._index[2 * index + 1]
+        if size:
+            self.hits += 1
+            offset = self._index[2 * index]
+            return pickle.loads(self._mmap[offset:offset + size - 1])
+
+        self.misses += 1
+        sample = self.dataset[index]
+        if not self._header[_FULL]:
+            self._insert(index, sample)
+        return sample
+
+    def _insert(self, index: int, sample: Any) -> None:
+        data = pickle.dumps(sample, protocol=pickle.HIGHEST_PROTOCOL)
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        try:
+            if self._index[2 * index + 1]:
+                # cached by another process
+                return
+            used = self._header[_USED_BYTES]
+            if used + len(data) > self.max_bytes:
+                self._header[_FULL] = 1
+                return
+            offset = self._data_offset + used
+            self._mmap[offset:offset + len(data)] = data
+            self._header[_USED_BYTES] = used + len(data)
+            self._header[_NUM_CACHED] += 1
+            self._index[2 * index] = offset
+            self._index[2 * index + 1] = len(data) + 1
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Unmaps the arena of this process. The owner also removes it."""
+        if self._pid == os.getpid():
+            self._header.release()
+            self._index.release()
+            self._mmap.close()
+            os.close(self._lock_fd)
+        self._pid = self._mmap = self._header = self._index = self._lock_fd = None
+        if self.owner and self.path in _OWNED_PATHS:
+            _OWNED_PATHS.discard(self.path)
+            _remove(self.path)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # the arena is opened again by each process
+        for key in ('_pid', '_mmap', '_header', '_index', '_lock_fd'):
+            state[key] = None
+        return state
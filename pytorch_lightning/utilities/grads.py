@@ -14,18 +14,33 @@
 """
 Utilities to describe gradients
 """
-from typing import Dict, Union
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Union
 
 import torch
 from torch.nn import Module
 
+_FOREACH_NORM_AVAILABLE = hasattr(torch, "_foreach_norm")
 
-def grad_norm(module: Module, norm_type: Union[float, int, str]) -> Dict[str, float]:
+
+def _norms(tensors: List[torch.Tensor], norm_type: float) -> torch.Tensor:
+    """Computes the p-norm of each tensor. All tensors need to share the same device and dtype."""
+    if _FOREACH_NORM_AVAILABLE:
+        norms = torch._foreach_norm(tensors, norm_type)
+    else:
+        norms = [t.norm(norm_type) for t in tensors]
+    return torch.stack(norms)
+
+
+def grad_norm(module: Module, norm_type: Union[float, int, str]) -> Dict[str, torch.Tensor]:
     """Compute each parameter's gradient's norm and their overall norm.
 
     The overall norm is computed over all gradients together, as if they
     were concatenated into a single vector.
 
+    The norms are computed on the gradients' device, grouped by device and dtype, so no
+    device-to-host synchronization happens. Call ``float`` on the values to read them on the host.
+
     Args:
         module: :class:`torch.nn.Module` to inspect.
         norm_type: The type of the used p-norm, cast to float if necessary.
@@ -38,17 +53,28 @@ def grad_norm(module: Module, norm_type: Union[float, int, str]) -> Dict[str, fl
     """
     norm_type = float(norm_type)
 
-    norms, all_norms = {}, []
+    groups: Dict[Tuple[torch.device, torch.dtype], List[Tuple[str, torch.Tensor]]] = OrderedDict()
     for name, p in module.named_parameters():
         if p.grad is None:
             continue
+        grad = p.grad.detach()
+        groups.setdefault((grad.device, grad.dtype), []).append((name, grad))
 
-        param_norm = float(p.grad.data.norm(norm_type))
-        norms[f'grad_{norm_type}_norm_{name}'] = round(param_norm, 4)
+    norms, all_norms = {}, []
+    for named_grads in groups.values():
+        names, grads = zip(*named_grads)
+        group_norms = _norms(list(grads), norm_type)
+        norms.update(zip(names, group_norms.unbind()))
+        all_norms.append(group_norms)
 
-        all_norms.append(param_norm)
+    # keep the parameters' order
+    norms = {f'grad_{norm_type}_norm_{name}': norms[name] for name, _ in module.named_parameters() if name in norms}
 
-    total_norm = float(torch.tensor(all_norms).norm(norm_type))
-    norms[f'grad_{norm_type}_norm_total'] = round(total_norm, 4)
+    if all_norms:
+        device = all_norms[0].device
+        total_norm = torch.cat([n.to(device, torch.float) for n in all_norms]).norm(norm_type)
+    else:
+        total_norm = torch.tensor(0.)
+    norms[f'grad_{norm_type}_norm_total'] = total_norm
 
     return norms
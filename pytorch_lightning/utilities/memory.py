@@ -13,9 +13,12 @@
 # limitations under the License.
 
 import gc
+from typing import Any, Dict, List
 
 import torch
 
+from pytorch_lightning.utilities.apply_func import apply_to_collection
+
 
 def recursive_detach(in_dict: dict, to_cpu: bool = False) -> dict:
     """Detach all tensors in `in_dict`.
@@ -43,6 +46,51 @@ def recursive_detach(in_dict: dict, to_cpu: bool = False) -> dict:
     return out_dict
 
 
+class _AsyncCPUOffload:
+    """Copies the CUDA tensors of a collection to pinned CPU memory on a side stream per device, so that the copies
+    overlap with the following steps instead of synchronizing the host at every step.
+
+    The returned tensors must not be read before :meth:`wait` is called.
+    """
+
+    def __init__(self) -> None:
+        self._streams: Dict[torch.device, torch.cuda.Stream] = {}
+        self._events: List[torch.cuda.Event] = []
+
+    def __call__(self, data: Any) -> Any:
+        used_streams = {}
+        out = apply_to_collection(data, torch.Tensor, self._offload, used_streams)
+        for stream in used_streams.values():
+            event = torch.cuda.Event()
+            event.record(stream)
+            self._events.append(event)
+        return out
+
+    def _offload(self, tensor: torch.Tensor, used_streams: Dict[torch.device, torch.cuda.Stream]) -> torch.Tensor:
+        tensor = tensor.detach()
+        if not tensor.is_cuda:
+            return tensor
+        stream = self._streams.get(tensor.device)
+        if stream is None:
+            stream = self._streams[tensor.device] = torch.cuda.Stream(device=tensor.device)
+        if tensor.device not in used_streams:
+            # the copies can only start once the step which produced the tensors is done
+            stream.wait_stream(torch.cuda.current_stream(tensor.device))
+            used_streams[tensor.device] = stream
+        out = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True)
+        with torch.cuda.stream(stream):
+            out.copy_(tensor, non_blocking=True)
+        # otherwise, the caching allocator could reuse the memory of `tensor` before the copy is done
+        tensor.record_stream(stream)
+        return out
+
+    def wait(self) -> None:
+        """Blocks until all the copies are done."""
+        for event in self._events:
+            event.synchronize()
+        self._events = []
+
+
 def is_oom_error(exception):
     return is_cuda_out_of_memory(exception) \
         or is_cudnn_snafu(exception) \
@@ -13,7 +13,7 @@
 # limitations under the License.
 """Helper functions to operate on metric values. """
 import numbers
-from typing import Any
+from typing import Any, Dict, List, Tuple
 
 import torch
 
@@ -25,17 +25,48 @@ def metrics_to_scalars(metrics: Any) -> Any:
     """
     Recursively walk through a collection and convert single-item tensors to scalar values
 
+    The tensors which are not on the CPU are stacked and copied to the host together, with a single synchronization
+    per device and kind. The integer tensors are stacked separately so that they don't lose precision.
+
     Raises:
         MisconfigurationException:
             If ``value`` contains multiple elements, hence preventing conversion to ``float``
     """
+    device_tensors: Dict[Tuple[torch.device, bool], List[torch.Tensor]] = {}
 
-    def to_item(value: torch.Tensor) -> numbers.Number:
+    def collect(value: torch.Tensor) -> torch.Tensor:
         if value.numel() != 1:
             raise MisconfigurationException(
                 f"The metric `{value}` does not contain a single element"
                 f" thus it cannot be converted to float."
             )
-        return value.item()
+        if value.device.type != "cpu" and not value.is_complex():
+            is_integer = not value.is_floating_point() and value.dtype != torch.bool
+            device_tensors.setdefault((value.device, is_integer), []).append(value)
+        return value
+
+    apply_to_collection(metrics, torch.Tensor, collect)
+
+    scalars: Dict[int, numbers.Number] = {}
+    for (_, is_integer), tensors in device_tensors.items():
+        if len(tensors) == 1:
+            continue
+        dtype = torch.int64 if is_integer else torch.float64
+        stacked = torch.stack([t.detach().reshape(()).to(dtype) for t in tensors])
+        for tensor, value in zip(tensors, stacked.cpu().tolist()):
+            scalars[id(tensor)] = _cast_like(value, tensor)
+
+    def to_item(value: torch.Tensor) -> numbers.Number:
+        scalar = scalars.get(id(value))
+        return value.item() if scalar is None else scalar
 
     return apply_to_collection(metrics, torch.Tensor, to_item)
+
+
+def _cast_like(value: numbers.Number, tensor: torch.Tensor) -> numbers.Number:
+    # match the type returned by `tensor.item()`
+    if tensor.dtype == torch.bool:
+        return bool(value)
+    if not tensor.is_floating_point():
+        return int(value)
+    return value
@@ -11,11 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
 
+import numpy as np
 import pytest
+import torch
+from torch.utils.data import DataLoader
 
 from pytorch_lightning import Trainer
-from pytorch_lightning.callbacks import BasePredictionWriter
+from pytorch_lightning.callbacks import BasePredictionWriter, ShardedPredictionWriter
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.helpers import BoringModel
 
@@ -64,3 +68,35 @@ def test_prediction_writer(tmpdir):
     trainer.predict(model, dataloaders=model.train_dataloader(), return_predictions=False)
     assert not cb.write_on_batch_end_called
     assert cb.write_on_epoch_end_called
+
+
+def test_sharded_prediction_writer(tmpdir):
+    """Test that the predictions are streamed to memory-mapped arrays or chunks and merged by dataset index."""
+
+    class TestModel(BoringModel):
+
+        def predict_step(self, batch, batch_idx, dataloader_idx=None):
+            # the shape of `ragged` changes with every batch
+            return {"output": self(batch), "ragged": torch.ones(len(batch), batch_idx + 1)}
+
+        def predict_dataloader(self):
+            return DataLoader(torch.arange(10, dtype=torch.float).unsqueeze(1).expand(10, 32), batch_size=4)
+
+    model = TestModel()
+    writer = ShardedPredictionWriter(tmpdir, chunk_size=2)
+    trainer = Trainer(default_root_dir=tmpdir, callbacks=writer)
+    assert trainer.predict(model, return_predictions=False) is None
+
+    rank_dir = os.path.join(tmpdir, "dataloader_0", "rank_0")
+    assert sorted(f for f in os.listdir(rank_dir) if f.endswith(".npy")) == ["_index.npy", "output.npy", "ragged.npy"]
+    # the rows of `ragged` after the first batch are written in chunks
+    assert sorted(f for f in os.listdir(rank_dir) if f.startswith("ragged_")) == ["ragged_0.pt", "ragged_1.pt"]
+
+    merged = ShardedPredictionWriter.merge(tmpdir)
+    assert isinstance(merged["output"], np.memmap)
+    expected = model(torch.arange(10, dtype=torch.float).unsqueeze(1).expand(10, 32))
+    np.testing.assert_allclose(merged["output"], expected.detach().numpy(), rtol=1e-5)
+    assert [row.shape[-1] for row in merged["ragged"]] == [1] * 4 + [2] * 4 + [3] * 2
+
+    with pytest.raises(MisconfigurationException, match="expects `predict_step` to return a tensor"):
+        writer.write_on_batch_end(trainer, model, [torch.ones(1)], None, None, 0, 0)
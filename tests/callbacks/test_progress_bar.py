@@ -23,7 +23,7 @@ import torch
 from torch.utils.data.dataloader import DataLoader
 
 from pytorch_lightning import Trainer
-from pytorch_lightning.callbacks import ModelCheckpoint, ProgressBar, ProgressBarBase
+from pytorch_lightning.callbacks import HeadlessProgressBar, ModelCheckpoint, ProgressBar, ProgressBarBase
 from pytorch_lightning.callbacks.progress import tqdm
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.helpers.boring_model import BoringModel, RandomDataset
@@ -381,6 +381,76 @@ def test_test_progress_bar_update_amount(tmpdir, test_batches: int, refresh_rate
     progress_bar.test_progress_bar.update.assert_has_calls([call(delta) for delta in test_deltas])
 
 
+@pytest.mark.parametrize(
+    "refresh_interval,train_deltas,val_deltas", [
+        [0, [1, 1, 1, 1, 1, 1, 1], [1, 1]],
+        # the first batch is displayed right away, the others when the stage changes or the last batch is reached
+        [1000, [1, 4, 2], [2]],
+    ]
+)
+def test_progress_bar_refresh_interval(tmpdir, refresh_interval: float, train_deltas: list, val_deltas: list):
+    """Test that the bars get updated with all the batches since the last refresh when refreshing based on time."""
+    progress_bar = MockedUpdateProgressBars(refresh_interval=refresh_interval)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=5,
+        limit_val_batches=2,
+        callbacks=[progress_bar],
+        logger=False,
+        checkpoint_callback=False,
+    )
+    with mock.patch.object(Trainer, "progress_bar_dict", new_callable=mock.PropertyMock, return_value={}) as pbar_dict:
+        trainer.fit(BoringModel())
+    assert progress_bar.main_progress_bar.update.call_args_list == [call(delta) for delta in train_deltas]
+    assert progress_bar.val_progress_bar.update.call_args_list == [call(delta) for delta in val_deltas]
+    assert progress_bar.main_progress_bar.n == 7
+    # the metrics are only computed when the main bar is redrawn, and at the end of the sanity check and validation
+    num_train_refreshes = 5 if refresh_interval == 0 else 1
+    assert pbar_dict.call_count == num_train_refreshes + 2
+
+    with pytest.raises(MisconfigurationException, match="non-negative number of seconds"):
+        ProgressBar(refresh_interval=-1)
+
+
+@pytest.mark.parametrize("refresh_interval", [0, 1000])
+def test_headless_progress_bar(tmpdir, capsys, refresh_interval: float):
+    """Test that the headless progress bar prints a status line every `refresh_interval` seconds."""
+    progress_bar = HeadlessProgressBar(refresh_interval=refresh_interval)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=2,
+        limit_val_batches=2,
+        limit_test_batches=2,
+        callbacks=[progress_bar],
+        logger=False,
+        checkpoint_callback=False,
+    )
+    assert trainer.progress_bar_callback is progress_bar
+    trainer.fit(BoringModel())
+    trainer.test(BoringModel(), verbose=False)
+
+    lines = capsys.readouterr().out.splitlines()
+    lines = [line for line in lines if line.split(":")[0] in ("Epoch 0", "Validating", "Testing")]
+    epoch_lines = [line for line in lines if line.startswith("Epoch 0")]
+    assert epoch_lines[-1].startswith("Epoch 0: 2/2 [100%, ")
+    assert "loss=" in epoch_lines[-1]
+    if refresh_interval == 0:
+        assert len(epoch_lines) == 3
+        assert [line.split(" [")[0] for line in lines if not line.startswith("Epoch 0")] == [
+            "Validating: 1/2", "Validating: 2/2", "Testing: 1/2", "Testing: 2/2", "Testing: 2/2"
+        ]
+    else:
+        # only the final status lines
+        assert len(epoch_lines) == 1
+        assert [line.split(" [")[0] for line in lines if not line.startswith("Epoch 0")] == ["Testing: 2/2"]
+
+    progress_bar.disable()
+    trainer.test(BoringModel(), verbose=False)
+    assert "Testing" not in capsys.readouterr().out
+
+
 def test_tensor_to_float_conversion(tmpdir):
     """Check tensor gets converted to float"""
 
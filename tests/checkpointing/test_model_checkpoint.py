@@ -37,6 +37,7 @@ import tests.helpers.utils as tutils
 from pytorch_lightning import seed_everything, Trainer
 from pytorch_lightning.callbacks import ModelCheckpoint
 from pytorch_lightning.loggers import TensorBoardLogger
+from pytorch_lightning.utilities.cloud_io import AsyncCheckpointWriter
 from pytorch_lightning.utilities.cloud_io import load as pl_load
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.helpers import BoringModel
@@ -1315,3 +1316,76 @@ def test_trainer_checkpoint_callback_bool(tmpdir):
     mc = ModelCheckpoint(dirpath=tmpdir)
     with pytest.raises(MisconfigurationException, match="Invalid type provided for checkpoint_callback"):
         Trainer(checkpoint_callback=mc)
+
+
+@pytest.mark.parametrize("save_last", [False, True])
+def test_model_checkpoint_save_async(tmpdir, save_last: bool):
+    """ Test that the checkpoints written in the background match the synchronous ones. """
+    seed_everything(1000)
+    model = LogInTwoMethods()
+    checkpoint_callback = ModelCheckpoint(
+        dirpath=tmpdir, filename="{epoch}", monitor="epoch", mode="max", save_top_k=2, save_last=save_last,
+        save_async=True
+    )
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        callbacks=[checkpoint_callback],
+        max_epochs=4,
+        limit_train_batches=2,
+        limit_val_batches=2,
+        logger=False,
+    )
+    trainer.fit(model)
+
+    writer = trainer.training_type_plugin.checkpoint_writer
+    assert writer is not None
+    assert not writer.pending_paths
+
+    # the checkpoints out of the top-k have been removed after the new ones were written
+    expected = {"epoch=2.ckpt", "epoch=3.ckpt"} | ({"last.ckpt"} if save_last else set())
+    assert set(os.listdir(tmpdir)) == expected
+    assert checkpoint_callback.best_model_path == tmpdir / "epoch=3.ckpt"
+
+    ckpt = pl_load(checkpoint_callback.best_model_path)
+    assert ckpt["epoch"] == 3
+    for k, v in model.state_dict().items():
+        assert torch.equal(ckpt["state_dict"][k], v)
+
+    # the manual saves are synchronous
+    with mock.patch.object(writer, "save") as save_mock:
+        trainer.save_checkpoint(tmpdir / "manual.ckpt")
+    save_mock.assert_not_called()
+    assert os.path.isfile(tmpdir / "manual.ckpt")
+
+
+def test_async_checkpoint_writer(tmpdir):
+    """ Test that the writer snapshots the tensors and runs the operations in order. """
+    writer = AsyncCheckpointWriter(max_pending=2)
+    tensor = torch.zeros(2)
+    filepath = str(tmpdir / "a.ckpt")
+
+    writer.save({"tensor": tensor}, filepath)
+    # the snapshot is not affected by in-place updates
+    tensor += 1
+    writer.remove(filepath)
+    writer.save({"tensor": tensor}, str(tmpdir / "b.ckpt"))
+    writer.wait()
+
+    assert os.listdir(tmpdir) == ["b.ckpt"]
+    assert torch.equal(pl_load(str(tmpdir / "b.ckpt"))["tensor"], torch.ones(2))
+    assert not writer.pending_paths
+
+    # the writer can be pickled and reused
+    writer = pickle.loads(pickle.dumps(writer))
+    writer.save({"tensor": tensor}, str(tmpdir / "c.ckpt"))
+    writer.close()
+    assert sorted(os.listdir(tmpdir)) == ["b.ckpt", "c.ckpt"]
+
+    # errors are raised when waiting
+    writer = AsyncCheckpointWriter(save_fn=Mock(side_effect=RuntimeError("write failed")))
+    writer.save({"tensor": tensor}, str(tmpdir / "d.ckpt"))
+    # the previous checkpoint is kept when the new one can't be written
+    writer.remove(str(tmpdir / "c.ckpt"))
+    with pytest.raises(RuntimeError, match="write failed"):
+        writer.close()
+    assert sorted(os.listdir(tmpdir)) == ["b.ckpt", "c.ckpt"]
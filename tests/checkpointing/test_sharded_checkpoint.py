@@ -0,0 +1,118 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+from unittest import mock
+
+import pytest
+import torch
+
+from pytorch_lightning import Trainer
+from pytorch_lightning.plugins import DDPPlugin, DDPShardedPlugin, DDPSpawnPlugin, DDPSpawnShardedPlugin
+from pytorch_lightning.utilities.cloud_io import is_sharded_checkpoint, sharded_checkpoint_shard_path
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from tests.helpers import BoringModel
+from tests.helpers.runif import RunIf
+
+
+class RankAwareModel(BoringModel):
+
+    def __init__(self, resumed_from=None):
+        super().__init__()
+        self.resumed_from = resumed_from
+        self.restored_rank = None
+
+    def configure_optimizers(self):
+        optimizer = torch.optim.Adam(self.layer.parameters(), lr=0.1)
+        lr_scheduler = torch.optim.lr_scheduler.StepLR(optimizer, step_size=1)
+        return [optimizer], [lr_scheduler]
+
+    def on_save_checkpoint(self, checkpoint):
+        checkpoint["rank"] = self.global_rank
+
+    def on_load_checkpoint(self, checkpoint):
+        self.restored_rank = checkpoint["rank"]
+
+    def on_train_start(self):
+        if self.resumed_from is None:
+            return
+        # every process restored from its own shard, this runs in the spawned processes too
+        assert self.restored_rank == self.global_rank
+        shard = torch.load(sharded_checkpoint_shard_path(self.resumed_from, self.global_rank))
+        optimizer = self.trainer.optimizers[0]
+        # the `OSS` optimizers hold the partition of this process
+        state = getattr(optimizer, "optim", optimizer).state_dict()["state"]
+        expected_state = shard["optimizer_states"][0]["state"]
+        assert state.keys() == expected_state.keys()
+        for index, param_state in expected_state.items():
+            for name, value in param_state.items():
+                assert torch.equal(torch.as_tensor(state[index][name]).cpu(), torch.as_tensor(value))
+
+
+@pytest.mark.parametrize(
+    "plugin_cls", [
+        pytest.param(DDPSpawnPlugin, marks=RunIf(skip_windows=True)),
+        pytest.param(DDPSpawnShardedPlugin, marks=RunIf(skip_windows=True, fairscale=True)),
+        pytest.param(DDPPlugin, marks=RunIf(skip_windows=True, special=True)),
+        pytest.param(DDPShardedPlugin, marks=RunIf(skip_windows=True, special=True, fairscale=True)),
+    ]
+)
+def test_sharded_checkpoint_ddp_cpu(tmpdir, plugin_cls):
+    """Test that every process writes and restores its own shard of a sharded checkpoint."""
+    trainer_kwargs = dict(
+        default_root_dir=tmpdir,
+        accelerator="ddp_cpu",
+        num_processes=2,
+        plugins=[plugin_cls(sharded_checkpoint=True)],
+        limit_train_batches=2,
+        limit_val_batches=2,
+        logger=False,
+    )
+    trainer = Trainer(max_epochs=1, **trainer_kwargs)
+    trainer.fit(RankAwareModel())
+    assert trainer.state.finished, f"Training failed with {trainer.state}"
+
+    ckpt_path = trainer.checkpoint_callback.best_model_path
+    assert is_sharded_checkpoint(ckpt_path)
+    assert sorted(os.listdir(ckpt_path)) == ["manifest.json", "rank_0.ckpt", "rank_1.ckpt"]
+    with open(os.path.join(ckpt_path, "manifest.json")) as f:
+        assert json.load(f) == {"world_size": 2, "shards": ["rank_0.ckpt", "rank_1.ckpt"]}
+    for rank in range(2):
+        shard = torch.load(os.path.join(ckpt_path, f"rank_{rank}.ckpt"))
+        assert shard["rank"] == rank
+        assert shard["optimizer_states"][0]["state"]
+
+    # resume every process from its own shard, which is checked in `on_train_start`
+    trainer = Trainer(max_epochs=2, resume_from_checkpoint=ckpt_path, **trainer_kwargs)
+    trainer.fit(RankAwareModel(resumed_from=ckpt_path))
+    assert trainer.state.finished, f"Training failed with {trainer.state}"
+    assert trainer.current_epoch == 1
+
+    # a single process loads the shard of rank 0
+    model = RankAwareModel.load_from_checkpoint(ckpt_path)
+    shard = torch.load(os.path.join(ckpt_path, "rank_0.ckpt"))
+    for name, param in model.state_dict().items():
+        assert torch.equal(param, shard["state_dict"][name])
+
+
+def test_sharded_checkpoint_world_size_mismatch(tmpdir):
+    """Test that a sharded checkpoint can't be restored by a different number of processes."""
+    ckpt_path = os.path.join(tmpdir, "model.ckpt")
+    plugin = DDPSpawnPlugin(sharded_checkpoint=True)
+    plugin.save_checkpoint({"epoch": 1}, ckpt_path)
+    assert plugin.load_checkpoint_file(ckpt_path) == {"epoch": 1}
+
+    with mock.patch.object(DDPSpawnPlugin, "world_size", new_callable=mock.PropertyMock, return_value=2), \
+            pytest.raises(MisconfigurationException, match="saved by 1 processes, it can't be restored by 2"):
+        plugin.load_checkpoint_file(ckpt_path)
@@ -554,6 +554,22 @@ def test_dm_init_from_datasets_dataloaders(iterable):
         ])
 
 
+def test_dm_init_from_datasets_tensor_dataset():
+    """Test that the `TensorDataset`s are indexed once per batch."""
+    tensors = torch.arange(10).view(5, 2), torch.arange(5)
+    dm = LightningDataModule.from_datasets(torch.utils.data.TensorDataset(*tensors), batch_size=2)
+    dataset = dm.train_dataloader().dataset
+    assert isinstance(dataset, torch.utils.data.TensorDataset)
+    x, y = dataset.lightning_getitems([3, 1])
+    assert torch.equal(x, tensors[0][[3, 1]])
+    assert torch.equal(y, tensors[1][[3, 1]])
+
+    # a dataloader which isn't rebuilt by the Trainer still collates the samples
+    x, y = next(iter(torch.utils.data.DataLoader(dataset, batch_size=2)))
+    assert torch.equal(x, tensors[0][:2])
+    assert torch.equal(y, tensors[1][:2])
+
+
 class DataModuleWithHparams(LightningDataModule):
 
     def __init__(self, arg0, arg1, kwarg0=None):
@@ -13,6 +13,7 @@
 # limitations under the License.
 import pickle
 from copy import deepcopy
+from unittest import mock
 
 import pytest
 import torch
@@ -23,7 +24,15 @@ from torchmetrics import Metric
 import tests.helpers.utils as tutils
 from pytorch_lightning import Trainer
 from pytorch_lightning.callbacks import ModelCheckpoint
-from pytorch_lightning.trainer.connectors.logger_connector.result import _Sync, MetricSource, ResultCollection
+from pytorch_lightning.trainer.connectors.logger_connector.result import (
+    _Metadata,
+    _Sync,
+    MetricSource,
+    ResultCollection,
+    ResultMetric,
+)
+from pytorch_lightning.utilities.distributed import sync_ddp_if_available
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.helpers import BoringModel
 from tests.helpers.runif import RunIf
 
@@ -100,6 +109,60 @@ def test_result_reduce_ddp():
     mp.spawn(_ddp_test_fn, args=(worldsize, ), nprocs=worldsize)
 
 
+def _ddp_bucketed_sync_test_fn(rank, worldsize):
+    _setup_ddp(rank, worldsize)
+
+    calls = []
+
+    def sync_fn(value, reduce_op=None, group=None):
+        calls.append(reduce_op)
+        return sync_ddp_if_available(value, group=group, reduce_op=reduce_op)
+
+    def log_all(result):
+        for i in range(4):
+            result.batch_size = i + 1
+            for j, reduce_fx in enumerate(('mean', 'sum', 'max', 'mean', 'sum')):
+                value = torch.tensor(float((rank + 1) * (i + j)))
+                result.log(
+                    'h',
+                    f'{reduce_fx}_{j}',
+                    value,
+                    on_step=False,
+                    on_epoch=True,
+                    reduce_fx=reduce_fx,
+                    sync_dist_fn=sync_fn,
+                )
+
+    bucketed = ResultCollection(True, torch.device("cpu"))
+    log_all(bucketed)
+    bucketed_log = bucketed.metrics(False)[MetricSource.LOG]
+    # one collective per (reduce op) bucket instead of one per state
+    assert sorted(calls) == ['max', 'mean', 'sum']
+
+    # compare with the per-metric syncing
+    calls.clear()
+    expected = ResultCollection(True, torch.device("cpu"))
+    log_all(expected)
+    expected_log = {}
+    for result_metric in expected.values():
+        # the epoch-level metrics are always synced, like in `ResultCollection._get_cache`
+        result_metric.meta.sync.should = True
+        expected_log[result_metric.meta.name] = result_metric.compute()
+    assert len(calls) == 7
+    assert bucketed_log.keys() == expected_log.keys()
+    for k, v in bucketed_log.items():
+        torch.testing.assert_allclose(v, expected_log[k], rtol=0, atol=0)
+
+
+@RunIf(skip_windows=True)
+def test_result_bucketed_sync_ddp():
+    """Make sure the epoch-level metrics are synced in buckets with the same results as the per-metric sync"""
+    tutils.set_random_master_port()
+
+    worldsize = 2
+    mp.spawn(_ddp_bucketed_sync_test_fn, args=(worldsize, ), nprocs=worldsize)
+
+
 def test_result_metric_integration():
     metric_a = DummyMetric()
     metric_b = DummyMetric()
@@ -184,6 +247,73 @@ def test_result_collection_simple_loop():
             assert result[k].cumulated_batch_size == torch.tensor(1.), k
 
 
+def test_result_collection_log_cache():
+    """Test that repeated `log` calls with the same arguments reuse the validated metadata."""
+    result = ResultCollection(True, torch.device("cpu"))
+
+    with mock.patch("pytorch_lightning.trainer.connectors.logger_connector.result._Metadata", wraps=_Metadata) as meta:
+        for i in range(3):
+            result.log('training_step', 'a', torch.tensor(float(i)), on_step=True, on_epoch=True)
+            result.log('training_step', 'a', torch.tensor(float(i)), on_step=True, on_epoch=True, dataloader_idx=1)
+    assert meta.call_count == 2
+    assert result['training_step.a'].value == 3
+    assert result['training_step.a.1'].value == 3
+
+    with pytest.raises(MisconfigurationException, match=r"self.log\(a, ...\)` twice in `training_step`"):
+        result.log('training_step', 'a', torch.tensor(0.), on_step=False, on_epoch=True)
+
+    # the cache is dropped when the collection is restored
+    new_result = ResultCollection(True, torch.device("cpu"))
+    new_result.load_state_dict(result.state_dict(drop_value=False))
+    assert not new_result._log_cache
+    new_result.log('training_step', 'a', torch.tensor(1.), on_step=True, on_epoch=True)
+    assert new_result['training_step.a'].value == 4
+
+
+def test_result_collection_packed_accumulation():
+    """Test that the packed accumulation of the scalar `on_epoch` values matches the per-metric `update`."""
+    result = ResultCollection(True, torch.device("cpu"))
+    reductions = ("mean", "sum", "max", "min")
+    references = {}
+    for reduce_fx in reductions:
+        meta = _Metadata("training_step", reduce_fx, on_step=True, on_epoch=True)
+        meta.reduce_fx = reduce_fx
+        meta.sync = _Sync()
+        references[reduce_fx] = ResultMetric(meta, is_tensor=True)
+
+    values = torch.randn(5, len(reductions))
+    for i, row in enumerate(values):
+        result.batch_size = i + 1
+        for reduce_fx, value in zip(reductions, row):
+            result.log("training_step", reduce_fx, value, on_step=True, on_epoch=True, reduce_fx=reduce_fx)
+            references[reduce_fx].update(value, result.batch_size)
+
+    assert len(result._accumulators) == len(reductions)
+    for reduce_fx, reference in references.items():
+        result_metric = result[f"training_step.{reduce_fx}"]
+        assert result_metric._accumulator is result._accumulators[(reduce_fx, torch.device("cpu"))]
+        assert torch.equal(result_metric._forward_cache, reference._forward_cache)
+        # the states are only scattered back when read
+        assert result_metric.__dict__["value"] == 0
+        assert torch.equal(result_metric.value, reference.value)
+        assert torch.equal(result_metric.compute(), reference.compute())
+    assert torch.equal(result["training_step.mean"].cumulated_batch_size, references["mean"].cumulated_batch_size)
+
+    result.reset()
+    assert all(result_metric.value == 0 for result_metric in result.result_metrics)
+    value = torch.tensor(2.)
+    result.log("training_step", "sum", value, on_step=True, on_epoch=True, reduce_fx="sum")
+    # in-place updates after logging don't change the accumulated value
+    value += 1
+    assert result["training_step.sum"].compute() == 2 * result.batch_size
+
+    # the metrics get their own states back when moved
+    result._unpack_metrics()
+    assert not result._accumulators
+    assert result["training_step.sum"]._accumulator is None
+    assert result["training_step.sum"].value == 2 * result.batch_size
+
+
 def my_sync_dist(x, *_, **__):
     return x
 
@@ -380,7 +380,9 @@ def test_logger_with_prefix_all(tmpdir, monkeypatch):
          mock.patch('pytorch_lightning.loggers.mlflow.MlflowClient'):
         logger = _instantiate_logger(MLFlowLogger, save_dir=tmpdir, prefix=prefix)
         logger.log_metrics({"test": 1.0}, step=0)
-        logger.experiment.log_metric.assert_called_once_with(ANY, "tmp-test", 1.0, ANY, 0)
+        logger.experiment.log_batch.assert_called_once_with(ANY, metrics=ANY)
+        metric, = logger.experiment.log_batch.call_args[1]["metrics"]
+        assert (metric.key, metric.value, metric.step) == ("tmp-test", 1.0, 0)
 
     # Neptune
     with mock.patch('pytorch_lightning.loggers.neptune.neptune'):
@@ -12,15 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import pickle
+import time
 from argparse import Namespace
 from typing import Optional
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
+import torch
 
 from pytorch_lightning import Trainer
-from pytorch_lightning.loggers import LightningLoggerBase, LoggerCollection, TensorBoardLogger
+from pytorch_lightning.loggers import AsyncLogger, LightningLoggerBase, LoggerCollection, TensorBoardLogger
 from pytorch_lightning.loggers.base import DummyExperiment, DummyLogger
 from pytorch_lightning.utilities import rank_zero_only
 from tests.helpers import BoringModel
@@ -317,3 +319,86 @@ def test_log_hyperparams_being_called(log_hyperparams_mock, tmpdir, logger):
         log_hyperparams_mock.assert_called()
     else:
         log_hyperparams_mock.assert_not_called()
+
+
+class SlowLogger(CustomLogger):
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__()
+        self.latency = latency
+        self.history = []
+
+    @rank_zero_only
+    def log_metrics(self, metrics, step):
+        time.sleep(self.latency)
+        assert all(not isinstance(v, torch.Tensor) for v in metrics.values())
+        self.history.append((step, metrics))
+
+
+def test_async_logger_does_not_block():
+    """Test that the logging calls return before the wrapped logger processes them."""
+    latency = 0.1
+    logger = AsyncLogger(SlowLogger(latency=latency), max_queue_size=10)
+    start = time.monotonic()
+    for step in range(5):
+        logger.log_metrics({"a": torch.tensor(float(step))}, step)
+    assert time.monotonic() - start < 5 * latency
+
+    # the queued values aren't affected by in-place updates
+    value = torch.tensor(5.0)
+    logger.log_metrics({"a": value}, 5)
+    value += 1
+
+    logger.finalize("success")
+    assert logger.logger.history == [(step, {"a": float(step)}) for step in range(6)]
+    assert logger.logger.finalized_status == "success"
+    assert logger._worker is None
+
+
+def test_async_logger_error():
+    """Test that the errors raised by the wrapped logger surface on the next call."""
+
+    class FailingLogger(CustomLogger):
+
+        def log_metrics(self, metrics, step):
+            raise ValueError("backend error")
+
+    logger = AsyncLogger(FailingLogger())
+    logger.log_metrics({"a": 1.0}, 0)
+    with pytest.raises(ValueError, match="backend error"):
+        logger.flush()
+    # the error is only raised once
+    logger.flush()
+
+
+def test_async_logger_trainer(tmpdir):
+    """Test that the queued metrics are all logged at the end of a run."""
+
+    class CustomModel(BoringModel):
+
+        def training_step(self, batch, batch_idx):
+            output = super().training_step(batch, batch_idx)
+            self.log('train_loss', output["loss"])
+            return output
+
+    logger = AsyncLogger(SlowLogger(latency=0.01))
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_steps=4,
+        limit_val_batches=0,
+        log_every_n_steps=1,
+        logger=logger,
+        weights_summary=None,
+    )
+    trainer.fit(CustomModel())
+    assert [step for step, _ in logger.logger.history] == [0, 1, 2, 3]
+    assert all("train_loss" in metrics for _, metrics in logger.logger.history)
+    assert logger.logger.finalized_status == "success"
+    assert logger._worker is None
+
+
+def test_async_logger_log_dir(tmpdir):
+    """Test that `trainer.log_dir` is resolved from the wrapped logger."""
+    logger = TensorBoardLogger(tmpdir)
+    trainer = Trainer(default_root_dir=tmpdir, logger=AsyncLogger(logger))
+    assert trainer.log_dir == logger.log_dir
@@ -11,8 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import csv
 import os
+import time
 from argparse import Namespace
+from unittest import mock
 
 import pytest
 import torch
@@ -112,3 +115,60 @@ def test_file_logger_log_hyperparams(tmpdir):
     path_yaml = os.path.join(logger.log_dir, ExperimentWriter.NAME_HPARAMS_FILE)
     params = load_hparams_from_yaml(path_yaml)
     assert all([n in params for n in hparams])
+
+
+def test_file_logger_append_metrics(tmpdir):
+    """Verify that new rows are appended and the header is widened when new metric keys are logged"""
+    logger = CSVLogger(tmpdir)
+    logger.log_metrics({"a": 1}, step=0)
+    logger.save()
+    assert not logger.experiment.metrics
+
+    path_csv = os.path.join(logger.log_dir, ExperimentWriter.NAME_METRICS_FILE)
+    with mock.patch("pytorch_lightning.loggers.csv_logs.csv.DictReader", wraps=csv.DictReader) as reader:
+        logger.log_metrics({"a": 2}, step=1)
+        logger.save()
+        # appending a row with known keys does not read the file back
+        reader.assert_not_called()
+        logger.log_metrics({"b": 3}, step=2)
+        logger.save()
+        reader.assert_called_once()
+
+    with open(path_csv, 'r') as fp:
+        lines = fp.read().splitlines()
+    assert lines == ["a,step,b", "1,0,", "2,1,", ",2,3"]
+
+
+def test_file_logger_flush_logs_every_n_steps(tmpdir):
+    """Verify that the rows are buffered until the flushing interval is reached"""
+    logger = CSVLogger(tmpdir, flush_logs_every_n_steps=3)
+    path_csv = os.path.join(logger.log_dir, ExperimentWriter.NAME_METRICS_FILE)
+    for step in range(2):
+        logger.log_metrics({"a": step}, step=step)
+        logger.save()
+    assert len(logger.experiment.metrics) == 2
+    assert not os.path.isfile(path_csv)
+
+    logger.log_metrics({"a": 2}, step=2)
+    logger.save()
+    assert not logger.experiment.metrics
+    with open(path_csv, 'r') as fp:
+        assert len(fp.readlines()) == 4
+
+    # `finalize` writes the remaining rows
+    logger.log_metrics({"a": 3}, step=3)
+    logger.save()
+    logger.finalize("success")
+    with open(path_csv, 'r') as fp:
+        assert len(fp.readlines()) == 5
+
+
+def test_file_logger_flush_logs_every_n_seconds(tmpdir):
+    logger = CSVLogger(tmpdir, flush_logs_every_n_steps=100, flush_logs_every_n_seconds=10)
+    logger.log_metrics({"a": 1}, step=0)
+    logger.save()
+    assert len(logger.experiment.metrics) == 1
+
+    with mock.patch("pytorch_lightning.loggers.csv_logs.time.monotonic", return_value=time.monotonic() + 10):
+        logger.save()
+    assert not logger.experiment.metrics
@@ -13,7 +13,7 @@
 # limitations under the License.
 import os
 from unittest import mock
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 
 import pytest
 
@@ -213,6 +213,12 @@ def test_mlflow_logger_with_unexpected_characters(client, mlflow, tmpdir):
     with pytest.warns(RuntimeWarning, match='special characters in metric name'):
         logger.log_metrics(metrics)
 
+    # the metric name is only sanitized once
+    with mock.patch('pytorch_lightning.loggers.mlflow.rank_zero_warn') as warn:
+        logger.log_metrics(metrics)
+    warn.assert_not_called()
+    assert logger.experiment.log_batch.call_args[1]["metrics"][0].key == 'some_metric'
+
 
 @mock.patch('pytorch_lightning.loggers.mlflow.mlflow')
 @mock.patch('pytorch_lightning.loggers.mlflow.MlflowClient')
@@ -249,9 +255,36 @@ def test_mlflow_logger_experiment_calls(client, mlflow, time, tmpdir):
     metrics = {'some_metric': 10}
     logger.log_metrics(metrics)
 
-    logger.experiment.log_metric.assert_called_once_with(logger.run_id, 'some_metric', 10, 1000, None)
+    logger.experiment.log_batch.assert_called_once_with(logger.run_id, metrics=ANY)
+    metric, = logger.experiment.log_batch.call_args[1]["metrics"]
+    assert (metric.key, metric.value, metric.timestamp, metric.step) == ('some_metric', 10, 1000, 0)
 
     logger._mlflow_client.create_experiment.assert_called_once_with(
         name='test',
         artifact_location='my_artifact_location',
     )
+
+
+@mock.patch('pytorch_lightning.loggers.mlflow.mlflow')
+@mock.patch('pytorch_lightning.loggers.mlflow.MlflowClient')
+def test_mlflow_logger_batched_metrics(client, mlflow, tmpdir):
+    """
+    Test that the metrics of several steps are buffered and sent in batches.
+    """
+    logger = MLFlowLogger('test', save_dir=tmpdir, flush_logs_every_n_steps=3)
+    for step in range(2):
+        logger.log_metrics({'a': step, 'b': step}, step=step)
+    logger.experiment.log_batch.assert_not_called()
+
+    logger.log_metrics({'a': 2, 'b': 2}, step=2)
+    logger.experiment.log_batch.assert_called_once()
+    metrics = logger.experiment.log_batch.call_args[1]["metrics"]
+    assert [(m.key, m.value, m.step) for m in metrics] == [(k, s, s) for s in range(3) for k in ('a', 'b')]
+
+    # the remaining metrics are sent on `finalize`, split to respect the size limit of a batch
+    logger.experiment.log_batch.reset_mock()
+    logger.log_metrics({str(i): i for i in range(MLFlowLogger._MAX_METRICS_PER_BATCH + 1)}, step=3)
+    logger.finalize()
+    assert [len(c[1]["metrics"]) for c in logger.experiment.log_batch.call_args_list] == [
+        MLFlowLogger._MAX_METRICS_PER_BATCH, 1
+    ]
@@ -58,6 +58,11 @@ def test_index_batch_sampler(tmpdir):
     for batch in index_batch_sampler:
         assert index_batch_sampler.batch_indices == batch
 
+    # batches fetched ahead are consumed in order
+    batches = list(index_batch_sampler)
+    for batch in batches:
+        assert index_batch_sampler.pop_batch_indices() == batch
+
 
 def test_index_batch_sampler_methods():
     dataset = range(15)
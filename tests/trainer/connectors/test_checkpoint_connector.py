@@ -97,6 +97,31 @@ def test_preloaded_checkpoint_lifecycle(tmpdir):
     assert not connector._loaded_checkpoint
 
 
+def test_restore_releases_checkpoint_sections(tmpdir):
+    """ Tests that each section of the preloaded checkpoint is released right after it has been restored. """
+    model = BoringModel()
+    trainer = Trainer(default_root_dir=tmpdir, max_steps=1)
+    trainer.fit(model)
+    ckpt_path = trainer.checkpoint_callback.best_model_path
+
+    trainer = Trainer(default_root_dir=tmpdir, max_steps=2, resume_from_checkpoint=ckpt_path)
+    connector = trainer.checkpoint_connector
+    sections = []
+    resume_end = connector.resume_end
+
+    def record_sections():
+        sections.append(set(connector._loaded_checkpoint))
+        resume_end()
+
+    connector.resume_end = record_sections
+    trainer.fit(BoringModel())
+    assert not connector._loaded_checkpoint
+
+    (remaining, ) = sections
+    assert not remaining & {"state_dict", "callbacks", "optimizer_states", "lr_schedulers"}
+    assert {"epoch", "global_step"} <= remaining
+
+
 def test_hpc_restore_attempt(tmpdir):
     """ Test that restore() attempts to restore the hpc_ckpt with highest priority. """
     model = BoringModel()
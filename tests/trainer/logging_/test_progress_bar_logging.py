@@ -19,5 +19,14 @@ def test_logging_to_progress_bar_with_reserved_key(tmpdir):
         default_root_dir=tmpdir,
         max_steps=2,
     )
-    with pytest.warns(UserWarning, match="The progress bar already tracks a metric with the .* 'loss'"):
+    with pytest.warns(UserWarning, match="The progress bar already tracks a metric with the .* 'loss'") as record:
         trainer.fit(model)
+    # the names are only checked the first time they are seen
+    assert sum("already tracks a metric" in str(w.message) for w in record) == 1
+    assert trainer.logger_connector._progress_bar_keys_checked == {"loss"}
+    assert isinstance(trainer.progress_bar_metrics["loss"], float)
+
+    # the names are checked again in the next run
+    trainer.logger_connector._progress_bar_keys_checked.add("stale")
+    trainer.validate(model)
+    assert "stale" not in trainer.logger_connector._progress_bar_keys_checked
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import threading
 from unittest import mock
 from unittest.mock import Mock, patch
 
@@ -28,6 +29,7 @@ from pytorch_lightning import Callback, seed_everything, Trainer
 from pytorch_lightning.callbacks import ModelCheckpoint
 from pytorch_lightning.utilities import _TORCH_GREATER_EQUAL_1_6
 from pytorch_lightning.utilities.data import has_iterable_dataset, has_len
+from pytorch_lightning.utilities.dataset_cache import CachedDataset
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.base import EvalModelTemplate
 from tests.helpers.boring_model import BoringModel, RandomDataset, RandomIterableDataset, RandomIterableDatasetWithLen
@@ -1686,3 +1688,192 @@ def test_request_dataloader(tmpdir):
     assert model.on_train_batch_start_called
     assert model.on_val_dataloader_called
     assert model.on_val_batch_start_called
+
+
+@pytest.mark.parametrize("prefetch_batches", [0, 2])
+def test_prefetch_batches(tmpdir, prefetch_batches):
+    """Test that the batches are moved to the device in a background thread with `prefetch_batches`."""
+
+    class TransferThreadModel(BoringModel):
+
+        def __init__(self):
+            super().__init__()
+            self.transfer_in_main_thread = set()
+
+        def on_after_batch_transfer(self, batch, dataloader_idx):
+            self.transfer_in_main_thread.add(threading.current_thread() is threading.main_thread())
+            return batch
+
+    model = TransferThreadModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=5,
+        limit_val_batches=5,
+        prefetch_batches=prefetch_batches,
+    )
+    trainer.fit(model)
+    trainer.validate(model)
+    predictions = trainer.predict(model)
+    assert len(predictions) == 64
+    # the batch indices match the batches even though the batches are fetched ahead
+    assert trainer.predict_loop.epoch_batch_indices == [[[i] for i in range(64)]]
+    assert model.transfer_in_main_thread == {not prefetch_batches}
+
+
+def test_prefetch_batches_invalid_value(tmpdir):
+    with pytest.raises(MisconfigurationException, match="`prefetch_batches` should be an int >= 0, got -1"):
+        Trainer(default_root_dir=tmpdir, prefetch_batches=-1)
+
+
+@RunIf(skip_windows=True)
+def test_dataset_cache(tmpdir):
+    """Test that the training dataset is wrapped into a shared cache with `dataset_cache_bytes`."""
+
+    class TestModel(BoringModel):
+
+        def __init__(self):
+            super().__init__()
+            self.data = torch.randn(64, 32)
+
+        def train_dataloader(self):
+            # a new dataset with the same samples on every reload
+            dataset = RandomDataset(32, 64)
+            dataset.data = self.data
+            dataset.lightning_cache_key = "random"
+            return DataLoader(dataset)
+
+    model = TestModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=2,
+        limit_val_batches=0,
+        dataset_cache_bytes=2**20,
+        reload_dataloaders_every_n_epochs=1,
+    )
+    trainer.fit(model)
+    dataset = trainer.train_dataloader.loaders.dataset
+    assert isinstance(dataset, CachedDataset)
+    assert isinstance(trainer.train_dataloader.loaders.sampler, SequentialSampler)
+    # the reloaded dataloader uses the same cache
+    assert list(trainer.data_connector._dataset_caches.values()) == [dataset]
+    assert dataset.num_cached == len(dataset) == 64
+    assert dataset.misses == 64
+    assert dataset.hits == 64
+    assert dataset.owner
+
+    with pytest.raises(MisconfigurationException, match="`dataset_cache_bytes` should be an int >= 0, got -1"):
+        Trainer(default_root_dir=tmpdir, dataset_cache_bytes=-1)
+
+
+@RunIf(skip_windows=True)
+def test_dataset_cache_reload_new_samples(tmpdir):
+    """Test that a reloaded dataset with different samples doesn't get the samples of the previous cache."""
+
+    class TestModel(BoringModel):
+
+        def __init__(self):
+            super().__init__()
+            self.num_reloads = 0
+
+        def training_step(self, batch, batch_idx):
+            assert torch.all(batch == self.num_reloads)
+            return super().training_step(batch, batch_idx)
+
+        def train_dataloader(self):
+            # the same type and length, but new samples on every reload
+            self.num_reloads += 1
+            dataset = RandomDataset(32, 4)
+            dataset.data = torch.full((4, 32), float(self.num_reloads))
+            return DataLoader(dataset)
+
+    model = TestModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=2,
+        limit_val_batches=0,
+        dataset_cache_bytes=2**20,
+        reload_dataloaders_every_n_epochs=1,
+    )
+    trainer.fit(model)
+    assert model.num_reloads == 2
+    dataset = trainer.train_dataloader.loaders.dataset
+    assert list(trainer.data_connector._dataset_caches.values()) == [dataset]
+    assert dataset.misses == 4
+    assert dataset.hits == 0
+
+
+class BatchedDataset(RandomDataset):
+
+    def __init__(self, size, length):
+        super().__init__(size, length)
+        self.fetched_indices = []
+
+    def __getitem__(self, index):
+        raise AssertionError("The samples should be fetched by batch")
+
+    def lightning_getitems(self, indices):
+        self.fetched_indices.append(indices)
+        return self.data[indices]
+
+
+def test_batched_fetching(tmpdir):
+    """Test that the batches of a dataset implementing `lightning_getitems` are fetched with a single call."""
+
+    class TestModel(BoringModel):
+
+        def training_step(self, batch, batch_idx):
+            assert batch.shape == (8, 32)
+            return super().training_step(batch, batch_idx)
+
+        def train_dataloader(self):
+            return DataLoader(BatchedDataset(32, 64), batch_size=8)
+
+        def predict_dataloader(self):
+            return DataLoader(BatchedDataset(32, 20), batch_size=8)
+
+    model = TestModel()
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=1, limit_val_batches=0)
+    trainer.fit(model)
+    dataloader = trainer.train_dataloader.loaders
+    assert dataloader.batch_size is None
+    assert len(dataloader.dataset.dataset.fetched_indices) == trainer.num_training_batches == 8
+    assert all(len(indices) == 8 for indices in dataloader.dataset.dataset.fetched_indices)
+
+    predictions = trainer.predict(model)
+    assert [len(p) for p in predictions] == [8, 8, 4]
+    assert trainer.predict_loop.epoch_batch_indices == [[list(range(0, 8)), list(range(8, 16)), list(range(16, 20))]]
+
+    # a custom `collate_fn` expects the samples
+    dataloader = DataLoader(BatchedDataset(32, 64), batch_size=8, collate_fn=lambda samples: samples)
+    assert trainer.auto_add_sampler(dataloader, shuffle=True) is dataloader
+
+
+class BatchedFetchingDistributedSamplerCallback(Callback):
+
+    def on_train_epoch_start(self, trainer, pl_module):
+        sampler = trainer.train_dataloader.sampler
+        # the batches are sampled from the `DistributedSampler`, which shuffles differently every epoch
+        assert isinstance(sampler.sampler, DistributedSampler)
+        assert sampler.sampler.epoch == trainer.current_epoch
+
+
+@RunIf(skip_windows=True)
+def test_batched_fetching_distributed_sampler_set_epoch(tmpdir):
+    """Test that `set_epoch` reaches the `DistributedSampler` when the batches are fetched with a single call."""
+
+    class TestModel(BoringModel):
+
+        def train_dataloader(self):
+            return DataLoader(BatchedDataset(32, 64), batch_size=8)
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=2,
+        limit_val_batches=0,
+        accelerator='ddp_cpu',
+        num_processes=2,
+        callbacks=[BatchedFetchingDistributedSamplerCallback()],
+    )
+    trainer.fit(TestModel())
+    assert trainer.state.finished, "DDP Training failed"
@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import time
 from collections import Sequence
 from unittest import mock
 
+import numpy as np
 import pytest
 import torch
 from torch.utils.data import DataLoader, TensorDataset
@@ -29,11 +31,15 @@ from pytorch_lightning.trainer.supporters import (
     CombinedLoader,
     CombinedLoaderIterator,
     CycleIterator,
+    DevicePrefetcher,
     prefetch_iterator,
+    PredictionCollection,
     TensorRunningAccum,
 )
 from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.utilities.apply_func import move_data_to_device
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from tests.helpers.runif import RunIf
 
 
 def test_tensor_running_accum_reset():
@@ -57,6 +63,115 @@ def test_tensor_running_accum_reset():
     assert not accum.rotated
 
 
+@pytest.mark.parametrize("device", [
+    "cpu",
+    pytest.param("cuda", marks=RunIf(min_gpus=1)),
+])
+def test_tensor_running_accum_statistics(device):
+    """ Test that the running statistics match the ones of the window and stay on the device of the values """
+    window_length = 7
+    values = torch.rand(30, device=device)
+
+    accum = TensorRunningAccum(window_length=window_length)
+    for i, value in enumerate(values):
+        accum.append(value)
+        window = values[max(0, i + 1 - window_length):i + 1]
+        assert accum.last().device == values.device
+        assert accum.mean().device == values.device
+        torch.testing.assert_allclose(accum.mean(), window.mean())
+        assert accum.min() == window.min()
+        assert accum.max() == window.max()
+
+    ema = TensorRunningAccum(window_length=window_length, ema_decay=0.9)
+    expected = values[0]
+    for i, value in enumerate(values):
+        ema.append(value)
+        if i > 0:
+            expected = 0.9 * expected + 0.1 * value
+    torch.testing.assert_allclose(ema.mean(), expected)
+
+    ema.reset()
+    assert ema.ema_decay == 0.9
+    assert ema.mean() is None
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_tensor_running_accum_non_finite(value):
+    """ Test that a non-finite value only affects the mean while it is in the window """
+    window_length = 5
+    accum = TensorRunningAccum(window_length=window_length)
+    accum.append(torch.tensor(1.0))
+    accum.append(torch.tensor(value))
+    torch.testing.assert_allclose(accum.mean(), torch.tensor(value), equal_nan=True)
+
+    values = torch.rand(window_length)
+    for i, v in enumerate(values):
+        accum.append(v)
+        if i < window_length - 1:
+            assert not torch.isfinite(accum.mean())
+    torch.testing.assert_allclose(accum.mean(), values.mean())
+
+    # `inf` and `-inf` in the same window sum to `nan`
+    accum.append(torch.tensor(float("inf")))
+    accum.append(torch.tensor(float("-inf")))
+    assert torch.isnan(accum.mean())
+
+    with pytest.raises(MisconfigurationException, match="should be in the range"):
+        TensorRunningAccum(window_length=window_length, ema_decay=1.0)
+
+
+@pytest.mark.parametrize("world_size", [1, 2])
+def test_prediction_collection_to_disk(tmpdir, world_size):
+    """ Test that the predictions are written as rows to a file and as columns to a directory """
+    collection = PredictionCollection(global_rank=world_size - 1, world_size=world_size)
+    for filename, columnar in (("predictions.pt", False), ("predictions", True)):
+        filepath = os.path.join(tmpdir, filename)
+        for batch_idx in range(3):
+            collection.add({
+                filepath: {
+                    "idxs": torch.arange(batch_idx * 2, batch_idx * 2 + 2),
+                    "preds": torch.rand(2, 3, requires_grad=True),
+                    "half": torch.rand(2, dtype=torch.bfloat16),
+                    "labels": ["cat", "dog"],
+                }
+            }, columnar=columnar)
+    collection.to_disk()
+
+    suffix = f"_rank_{world_size - 1}" if world_size > 1 else ""
+    rows = PredictionCollection.load(os.path.join(tmpdir, f"predictions{suffix}.pt"))
+    assert len(rows) == 6
+    assert rows[5]["idxs"] == 5
+    assert rows[5]["labels"] == "dog"
+    assert len(rows[5]["preds"]) == 3
+
+    dirpath = os.path.join(tmpdir, f"predictions{suffix}")
+    # numpy doesn't support `bfloat16`
+    assert sorted(os.listdir(dirpath)) == ["half.pt", "idxs.npy", "labels.pt", "preds.npy"]
+    columns = PredictionCollection.load(dirpath)
+    assert isinstance(columns["preds"], np.memmap)
+    assert columns["half"].dtype == torch.bfloat16
+    assert columns["preds"].shape == (6, 3)
+    np.testing.assert_array_equal(columns["idxs"], np.arange(6))
+    assert columns["labels"] == ["cat", "dog"] * 3
+
+    # the row view of the columns matches the file
+    column_rows = PredictionCollection.load(dirpath, rows=True)
+    assert [r["idxs"] for r in column_rows] == [r["idxs"] for r in rows]
+    assert [r["labels"] for r in column_rows] == [r["labels"] for r in rows]
+    assert all(len(r["preds"]) == 3 for r in column_rows)
+
+    # a filename without an extension is still a file by default
+    collection = PredictionCollection(global_rank=0, world_size=1)
+    collection.add({os.path.join(tmpdir, "no_extension"): {"a": torch.rand(2)}})
+    collection.to_disk()
+    assert os.path.isfile(os.path.join(tmpdir, "no_extension"))
+
+    collection = PredictionCollection(global_rank=0, world_size=1)
+    collection.add({os.path.join(tmpdir, "mismatch"): {"a": torch.rand(2), "b": torch.rand(3)}})
+    with pytest.raises(ValueError, match="Mismatching feature column lengths"):
+        collection.to_disk()
+
+
 def test_cycle_iterator():
     """Test the cycling function of `CycleIterator`"""
     iterator = CycleIterator(range(100), 1000)
@@ -103,6 +218,59 @@ def test_prefetch_iterator():
     assert list(iterator) == []
 
 
+@pytest.mark.parametrize("device", ["cpu", pytest.param("cuda", marks=RunIf(min_gpus=1))])
+@pytest.mark.parametrize("depth", [1, 3])
+def test_device_prefetcher(device, depth):
+    """ Test that the DevicePrefetcher moves the batches to the device ahead of the consumer. """
+    device = torch.device(device)
+    dataloader = DataLoader(TensorDataset(torch.arange(20.0)), batch_size=2)
+    fetched = []
+
+    def to_device(batch):
+        fetched.append(batch)
+        return move_data_to_device(batch, device)
+
+    prefetcher = DevicePrefetcher(dataloader, to_device, device, depth=depth)
+    batches = []
+    for batch in prefetcher:
+        assert batch[0].device.type == device.type
+        batches.append(batch[0].cpu())
+    assert torch.equal(torch.cat(batches), torch.arange(20.0))
+    assert len(fetched) == 10
+    assert prefetcher.wait_time > 0
+
+    # the prefetcher can be iterated again
+    assert len(list(prefetcher)) == 10
+
+    # the worker only gets up to `depth` batches ahead of the consumer
+    fetched.clear()
+    iterator = iter(prefetcher)
+    next(iterator)
+    time.sleep(0.2)
+    assert len(fetched) <= depth + 2
+    prefetcher.close()
+    with pytest.raises(StopIteration):
+        next(iterator)
+
+
+def test_device_prefetcher_error():
+    """ Test that errors raised while fetching the batches are raised by the DevicePrefetcher. """
+
+    def to_device(batch):
+        if batch == 2:
+            raise RuntimeError("transfer failed")
+        return batch
+
+    prefetcher = iter(DevicePrefetcher([0, 1, 2, 3], to_device, "cpu"))
+    assert next(prefetcher) == 0
+    assert next(prefetcher) == 1
+    with pytest.raises(RuntimeError, match="transfer failed"):
+        next(prefetcher)
+
+    with pytest.raises(MisconfigurationException, match="`depth` should be a positive integer"):
+        DevicePrefetcher([], to_device, "cpu", depth=0)
+
+
 @pytest.mark.parametrize(
     ["dataset_1", "dataset_2"],
     [
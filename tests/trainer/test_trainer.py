@@ -19,7 +19,7 @@ import sys
 from argparse import Namespace
 from copy import deepcopy
 from pathlib import Path
-from unittest.mock import ANY, call, patch
+from unittest.mock import ANY, call, Mock, patch
 
 import cloudpickle
 import pytest
@@ -1969,3 +1969,39 @@ def test_ddp_terminate_when_deadlock_is_detected(tmpdir):
     # simulate random failure in training_step on rank 0
     with pytest.raises(DeadlockDetectedException, match="CustomException"):
         trainer.fit(model)
+
+
+def test_call_hook_dispatch_table(tmpdir):
+    """Test that the hooks are only dispatched to the callbacks implementing them and that the dispatch table is
+    rebuilt when the callbacks change."""
+
+    class BatchStartCallback(Callback):
+
+        def __init__(self):
+            self.calls = 0
+
+        def on_train_batch_start(self, *_):
+            self.calls += 1
+
+    batch_start_callback = BatchStartCallback()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        fast_dev_run=2,
+        progress_bar_refresh_rate=0,
+        callbacks=[batch_start_callback, Callback()],
+    )
+    trainer.fit(BoringModel())
+    assert batch_start_callback.calls == 2
+    assert trainer._callbacks_with_hook("on_train_batch_start") == [batch_start_callback]
+    assert trainer._callbacks_with_hook("on_train_batch_end") == []
+    trainer_hook, model_hook, _ = trainer._hook_dispatch("on_train_batch_start")
+    assert trainer_hook == trainer.on_train_batch_start
+    assert model_hook is None
+    # the trainer hook is skipped as no callback implements it
+    assert trainer._hook_dispatch("on_train_batch_end")[0] is None
+
+    callback_mock = Mock(spec=Callback)
+    trainer.callbacks.append(callback_mock)
+    trainer.validate(BoringModel())
+    assert trainer._callbacks_with_hook("on_validation_batch_end") == [callback_mock]
+    assert callback_mock.on_validation_batch_end.call_count == 2
@@ -0,0 +1,84 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from unittest import mock
+
+import pytest
+from torch.utils.data import DataLoader
+
+from pytorch_lightning import Callback, Trainer
+from pytorch_lightning.tuner import dataloader_tuning
+from tests.helpers import BoringModel, RandomDataset
+from tests.helpers.runif import RunIf
+
+
+class DataLoaderModel(BoringModel):
+
+    def train_dataloader(self):
+        return DataLoader(RandomDataset(32, 64), batch_size=2)
+
+
+@RunIf(min_torch="1.7.0")
+@pytest.mark.parametrize("mode", ["grid", "halving"])
+def test_tune_dataloader(tmpdir, mode):
+    """Test that the settings with the fewest workers reaching the best throughput are used by the next fit."""
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=1, limit_train_batches=2, limit_val_batches=0)
+    model = DataLoaderModel()
+
+    measured = []
+
+    def measure(trainer, dataloader, config, num_batches, warmup_batches, device):
+        measured.append((config, num_batches))
+        # the throughput stops improving after 2 workers
+        return min(config["num_workers"], 2) * 10.0 + config["prefetch_factor"] / 100, 0.1
+
+    with mock.patch.object(dataloader_tuning, "_measure", side_effect=measure):
+        settings = trainer.tuner.tune_dataloader(model, mode=mode, num_batches=4, max_num_workers=4)
+    assert settings == dict(num_workers=2, pin_memory=False, prefetch_factor=2, persistent_workers=True)
+    assert trainer.data_connector.train_dataloader_kwargs == settings
+
+    num_workers = {config["num_workers"] for config, _ in measured}
+    assert num_workers == {0, 1, 2, 4}
+    if mode == "halving":
+        # 7 settings, then the best 4, 2 and 1 with twice as many batches each time, then the other 3 settings with
+        # 2 or 4 workers with as many batches as the last one
+        assert [n for _, n in measured] == [4] * 7 + [8] * 4 + [16] * 2 + [32] + [32] * 3
+    else:
+        assert len(measured) == 7
+
+    class CheckDataLoader(Callback):
+
+        def on_train_start(self, trainer, pl_module):
+            dataloader = trainer.train_dataloader.loaders
+            for name, value in settings.items():
+                assert getattr(dataloader, name) == value
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        callbacks=CheckDataLoader(),
+    )
+    trainer.data_connector.train_dataloader_kwargs = settings
+    trainer.fit(model)
+
+
+def test_tune_dataloader_measure(tmpdir):
+    """Test that the dataloader is iterated without the model to measure its throughput."""
+    trainer = Trainer(default_root_dir=tmpdir)
+    model = DataLoaderModel()
+    with mock.patch.object(DataLoaderModel, "training_step") as training_step:
+        settings = trainer.tuner.tune_dataloader(model, mode="grid", num_batches=2, max_num_workers=1)
+    training_step.assert_not_called()
+    assert settings["num_workers"] in (0, 1)
@@ -11,8 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
 import os
 from copy import deepcopy
+from unittest import mock
 
 import pytest
 import torch
@@ -291,6 +293,42 @@ def test_scale_batch_size_no_trials(tmpdir):
     assert result == 2
 
 
+def test_scale_batch_size_throughput_mode(tmpdir, caplog):
+    """Check the throughput mode measures each batch size and selects the knee of the throughput curve on CPU."""
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=1)
+    model = BatchSizeModel(batch_size=2)
+    # the throughput stops improving after a batch size of 8
+    durations = {2: 1.0, 4: 1.0, 8: 1.0, 16: 1.95, 32: 4.0}
+
+    def on_train_end(self, *_):
+        self.durations = [durations[model.batch_size]] * 3
+        self.peak_memory = 2**20
+
+    with mock.patch("pytorch_lightning.tuner.batch_size_scaling._ThroughputMonitor.on_train_end", on_train_end), \
+            caplog.at_level(logging.INFO, logger="pytorch_lightning.tuner.batch_size_scaling"):
+        result = trainer.tuner.scale_batch_size(model, mode="throughput", max_trials=5)
+    assert result == 8
+    assert model.batch_size == 8
+    assert "Throughput (samples/s)" in caplog.text
+    assert "Selected batch size 8" in caplog.text
+
+
+def test_scale_batch_size_throughput_mode_memory_headroom(tmpdir):
+    """Check the throughput mode stops before using the memory headroom."""
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=1)
+    model = BatchSizeModel(batch_size=2)
+
+    def on_train_end(self, *_):
+        self.durations = [1.0]
+        self.total_memory = 100
+        self.peak_memory = 10 * model.batch_size
+
+    with mock.patch("pytorch_lightning.tuner.batch_size_scaling._ThroughputMonitor.on_train_end", on_train_end):
+        result = trainer.tuner.scale_batch_size(model, mode="throughput", max_trials=5)
+    # a batch size of 8 would use 80% of the memory, 16 more than the 90% limit
+    assert result == 8
+
+
 def test_scale_batch_size_fails_with_unavailable_mode(tmpdir):
     """Check the tuning raises error when called with mode that does not exist."""
 
@@ -309,7 +347,7 @@ def test_scale_batch_size_fails_with_unavailable_mode(tmpdir):
         auto_scale_batch_size='ThisModeDoesNotExist',
     )
 
-    with pytest.raises(ValueError, match='could either be `power` or `binsearch`'):
+    with pytest.raises(ValueError, match='could either be `power`, `binsearch` or `throughput`'):
         trainer.tune(model)
-    with pytest.raises(ValueError, match='could either be `power` or `binsearch`'):
+    with pytest.raises(ValueError, match='could either be `power`, `binsearch` or `throughput`'):
         trainer.tuner.scale_batch_size(model, mode='ThisModeDoesNotExist')
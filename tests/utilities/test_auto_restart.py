@@ -16,6 +16,7 @@ import os
 import random
 from collections.abc import Iterable
 from typing import Optional
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -203,6 +204,57 @@ def test_fast_forward_on_random_sampler():
     assert has_raised
 
 
+@pytest.mark.parametrize("generator", [None, torch.Generator().manual_seed(1)])
+@RunIf(min_torch="1.9.0")
+def test_fast_forward_seekable_samplers(generator):
+    """
+    This test ensures ``FastForwardSampler`` seeks the samplers supporting it instead of replaying them, and restarts
+    in the same order without re-seeding.
+    """
+    dataset = range(15)
+    samplers = [
+        SequentialSampler(dataset),
+        RandomSampler(dataset, generator=generator),
+        DistributedSampler(dataset, num_replicas=2, rank=1, shuffle=True),
+    ]
+    for wrapped_sampler in samplers:
+        sampler = FastForwardSampler(wrapped_sampler)
+        assert sampler._seekable_sampler is not None
+        sampler.setup(3)
+        values = list(sampler)
+        state_dict = sampler.state_dict(2)
+        assert state_dict[0]["current_iteration"] == 6
+
+        # run another epoch before restarting
+        list(sampler)
+
+        sampler = FastForwardSampler(wrapped_sampler)
+        sampler.setup(3)
+        sampler.load_state_dict(state_dict)
+        sampler_cls = type(wrapped_sampler)
+        with mock.patch.object(sampler_cls, "__iter__", autospec=True, side_effect=sampler_cls.__iter__) as iter_mock:
+            assert list(sampler) == values[6:]
+        # only the sampler whose order doesn't depend on an RNG are iterated, and they aren't replayed
+        assert iter_mock.call_count == (not isinstance(wrapped_sampler, RandomSampler))
+        assert sampler._current_iteration == 0
+
+
+def test_fast_forward_replays_non_seekable_sampler():
+    """This test ensures ``FastForwardSampler`` replays the samplers which aren't seekable."""
+    sampler = FastForwardSampler(RandomSampler(range(15), replacement=True))
+    assert sampler._seekable_sampler is None
+
+    class CustomSampler(SequentialSampler):
+
+        def __iter__(self):
+            yield from range(len(self.data_source))
+
+    sampler = FastForwardSampler(CustomSampler(range(15)))
+    assert sampler._seekable_sampler is None
+    sampler.load_state_dict({0: {"current_iteration": 10}})
+    assert list(sampler) == list(range(10, 15))
+
+
 class RangeIterableDataset(IterableDataset):
 
     def __init__(self, data, num_workers: int, batch_size: int, is_in_workers: bool, state_dict=None):
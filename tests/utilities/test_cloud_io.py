@@ -0,0 +1,81 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from unittest import mock
+
+import pytest
+import torch
+
+from pytorch_lightning.utilities.cloud_io import atomic_save
+from pytorch_lightning.utilities.cloud_io import load as pl_load
+from tests.helpers.runif import RunIf
+
+
+@pytest.mark.parametrize("protocol", ["", "file://"])
+def test_atomic_save(tmpdir, protocol):
+    """Test that the checkpoint is streamed to a temporary file which replaces the target once complete."""
+    filepath = os.path.join(tmpdir, "sub", "model.ckpt")
+    checkpoint = {"state_dict": {"weight": torch.rand(32, 32)}, "epoch": 1}
+
+    atomic_save(checkpoint, protocol + filepath, chunk_size=1024)
+    assert os.listdir(os.path.join(tmpdir, "sub")) == ["model.ckpt"]
+    loaded = pl_load(filepath)
+    assert loaded["epoch"] == 1
+    assert torch.equal(loaded["state_dict"]["weight"], checkpoint["state_dict"]["weight"])
+
+    # overwrite an existing checkpoint
+    checkpoint["epoch"] = 2
+    atomic_save(checkpoint, protocol + filepath)
+    assert pl_load(filepath)["epoch"] == 2
+    assert os.listdir(os.path.join(tmpdir, "sub")) == ["model.ckpt"]
+
+
+def test_atomic_save_no_partial_files(tmpdir):
+    """Test that a failure while serializing leaves neither a partial checkpoint nor the temporary file."""
+    filepath = os.path.join(tmpdir, "model.ckpt")
+    atomic_save({"epoch": 1}, filepath)
+
+    def failing_save(obj, f, **_):
+        f.write(b"partial")
+        raise RuntimeError("serialization failed")
+
+    with mock.patch("torch.save", side_effect=failing_save), pytest.raises(RuntimeError, match="serialization failed"):
+        atomic_save({"epoch": 2}, filepath)
+
+    # the previous checkpoint is untouched
+    assert os.listdir(tmpdir) == ["model.ckpt"]
+    assert pl_load(filepath)["epoch"] == 1
+
+
+@RunIf(min_torch="2.1", skip_windows=True)
+def test_load_mmap(tmpdir):
+    """Test that local zipfile checkpoints get memory-mapped while legacy checkpoints are read into memory."""
+    checkpoint = {"state_dict": {"weight": torch.rand(32, 32)}, "optimizer_states": [{"state": torch.rand(32)}]}
+    filepath = os.path.join(tmpdir, "model.ckpt")
+    torch.save(checkpoint, filepath)
+    legacy_filepath = os.path.join(tmpdir, "legacy.ckpt")
+    torch.save(checkpoint, legacy_filepath, _use_new_zipfile_serialization=False)
+
+    with mock.patch("torch.load", wraps=torch.load) as load_mock:
+        loaded = pl_load(filepath)
+        assert load_mock.call_args[1]["mmap"]
+        assert torch.equal(loaded["state_dict"]["weight"], checkpoint["state_dict"]["weight"])
+
+        loaded = pl_load(filepath, mmap=False)
+        assert "mmap" not in load_mock.call_args[1]
+        assert torch.equal(loaded["state_dict"]["weight"], checkpoint["state_dict"]["weight"])
+
+        loaded = pl_load(legacy_filepath)
+        assert "mmap" not in load_mock.call_args[1]
+        assert torch.equal(loaded["optimizer_states"][0]["state"], checkpoint["optimizer_states"][0]["state"])
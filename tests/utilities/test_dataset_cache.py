@@ -0,0 +1,94 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import pickle
+import uuid
+
+import torch
+from torch.utils.data import DataLoader, Dataset
+
+from pytorch_lightning.utilities.dataset_cache import CachedDataset
+from tests.helpers.runif import RunIf
+
+
+class CountingDataset(Dataset):
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.num_loads = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int):
+        self.num_loads += 1
+        return {"x": torch.full((4, ), float(index)), "index": index}
+
+
+@RunIf(skip_windows=True)
+def test_cached_dataset():
+    """Test that the samples are loaded once and then read from the arena, within the byte budget."""
+    dataset = CountingDataset(10)
+    sample_bytes = len(pickle.dumps(dataset[0], protocol=pickle.HIGHEST_PROTOCOL))
+    dataset.num_loads = 0
+    cached = CachedDataset(dataset, uuid.uuid4().hex, max_bytes=6 * sample_bytes + sample_bytes // 2)
+
+    for _ in range(3):
+        samples = [cached[i] for i in range(len(cached))]
+        for i, sample in enumerate(samples):
+            assert torch.equal(sample["x"], torch.full((4, ), float(i)))
+            assert sample["index"] == i
+
+    # the first 6 samples fill the arena, the other ones are loaded every epoch
+    assert cached.num_cached == 6
+    assert cached.used_bytes <= cached.max_bytes
+    assert dataset.num_loads == 10 + 2 * 4
+    assert cached.misses == 10 + 2 * 4
+    assert cached.hits == 2 * 6
+
+    # another process opening the arena reads the same samples
+    other = pickle.loads(pickle.dumps(cached))
+    other.dataset = CountingDataset(10)
+    assert other[3]["index"] == 3
+    assert other.hits == cached.hits + 1
+    assert other.dataset.num_loads == 0
+
+
+@RunIf(skip_windows=True)
+def test_cached_dataset_dataloader_workers():
+    """Test that the dataloader workers share the arena."""
+    cached = CachedDataset(CountingDataset(16), uuid.uuid4().hex, max_bytes=2**20)
+    dataloader = DataLoader(cached, batch_size=4, num_workers=2)
+    for _ in range(2):
+        indices = torch.cat([batch["index"] for batch in dataloader])
+        assert indices.tolist() == list(range(16))
+    assert cached.num_cached == 16
+    # the main process didn't load any sample
+    assert cached.hits == cached.misses == 0
+
+
+@RunIf(skip_windows=True)
+def test_cached_dataset_owner():
+    """Test that only the owner removes the arena."""
+    name = uuid.uuid4().hex
+    owner = CachedDataset(CountingDataset(4), name, max_bytes=2**20)
+    other = CachedDataset(CountingDataset(4), name, max_bytes=2**20, owner=False)
+    assert other[0]["index"] == 0
+    assert owner[0]["index"] == 0
+    assert owner.hits == 1
+
+    other.close()
+    assert os.path.exists(owner.path)
+    owner.close()
+    assert not os.path.exists(owner.path)
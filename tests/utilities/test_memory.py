@@ -13,7 +13,8 @@
 # limitations under the License.
 import torch
 
-from pytorch_lightning.utilities.memory import recursive_detach
+from pytorch_lightning.utilities.memory import _AsyncCPUOffload, recursive_detach
+from tests.helpers.runif import RunIf
 
 
 def test_recursive_detach():
@@ -28,3 +29,19 @@ def test_recursive_detach():
     assert y["foo"].device.type == "cpu"
     assert y["bar"]["baz"].device.type == "cpu"
     assert not y["bar"]["baz"].requires_grad
+
+
+@RunIf(min_gpus=1)
+def test_async_cpu_offload():
+    offload = _AsyncCPUOffload()
+    x = torch.arange(4.0, device="cuda", requires_grad=True) * 2
+    outputs = [offload({"foo": x, "bar": [x + 1, "baz"]}) for _ in range(3)]
+    offload.wait()
+
+    for y in outputs:
+        assert y["foo"].device.type == "cpu"
+        assert y["foo"].is_pinned()
+        assert not y["foo"].requires_grad
+        assert torch.equal(y["foo"], torch.tensor([0.0, 2.0, 4.0, 6.0]))
+        assert torch.equal(y["bar"][0], torch.tensor([1.0, 3.0, 5.0, 7.0]))
+        assert y["bar"][1] == "baz"
@@ -0,0 +1,69 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from unittest import mock
+
+import pytest
+import torch
+
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from pytorch_lightning.utilities.metrics import metrics_to_scalars
+from tests.helpers.runif import RunIf
+
+
+def _metrics(device):
+    return {
+        "float": torch.tensor(1.5, device=device),
+        "int": torch.tensor([3], device=device),
+        "large_int": torch.tensor(2**53 + 1, device=device),
+        "bool": torch.tensor(True, device=device),
+        "nested": {"half": torch.tensor(0.5, device=device, dtype=torch.half)},
+        "number": 2,
+    }
+
+
+@pytest.mark.parametrize("device", [
+    "cpu",
+    pytest.param("cuda", marks=RunIf(min_gpus=1)),
+])
+def test_metrics_to_scalars(device):
+    """Test that the tensors are converted to the same Python numbers as ``Tensor.item()``."""
+    metrics = _metrics(device)
+    expected = {
+        "float": 1.5,
+        "int": 3,
+        "large_int": 2**53 + 1,
+        "bool": True,
+        "nested": {"half": 0.5},
+        "number": 2,
+    }
+    scalars = metrics_to_scalars(metrics)
+    assert scalars == expected
+    assert type(scalars["float"]) is float
+    assert type(scalars["int"]) is int
+    assert type(scalars["bool"]) is bool
+
+    with pytest.raises(MisconfigurationException, match="does not contain a single element"):
+        metrics_to_scalars({"a": torch.tensor([1.0, 2.0], device=device)})
+
+
+@RunIf(min_gpus=1)
+def test_metrics_to_scalars_single_transfer():
+    """Test that the tensors on the GPU are copied to the host with a single transfer per kind."""
+    metrics = _metrics("cuda")
+    with mock.patch.object(torch.Tensor, "item", autospec=True, side_effect=torch.Tensor.item) as item_mock, \
+            mock.patch("torch.stack", wraps=torch.stack) as stack_mock:
+        metrics_to_scalars(metrics)
+    item_mock.assert_not_called()
+    # the floating point and the integer tensors
+    assert stack_mock.call_count == 2